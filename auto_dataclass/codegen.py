@@ -0,0 +1,115 @@
+import threading
+from typing import Callable
+
+from auto_dataclass.exceptions import ConversionError
+from auto_dataclass.plan import DataclassPlan, FieldKind, FieldPlan
+
+
+def not_iterable_error(field_data, dc: type) -> ConversionError:
+    return ConversionError(f"The {field_data} is not iterable, but specified type is List[{dc}]")
+
+
+def convert_shared(data, identity_map: dict, convert: Callable, plan: DataclassPlan):
+    pk = data.pk
+    if pk is None:
+        return convert(data, identity_map)
+    key = (plan, data.__class__, pk)
+    dataclass_obj = identity_map.get(key)
+    if dataclass_obj is None:
+        dataclass_obj = identity_map[key] = convert(data, identity_map)
+    return dataclass_obj
+
+
+class ConverterGenerator:
+    """Generates one flat converter function per dataclass plan.
+
+    Every generated function reads the model attributes directly and calls the
+    dataclass constructor positionally, the same way ``dataclasses`` builds
+    ``__init__``. The functions share one namespace, so nested and recursive
+    plans call each other by name. The ``shared`` variant of a function takes an
+    identity map and converts every related model object only once.
+
+    Converters are published only once generated, so lookups take no lock while
+    generation is serialized.
+    """
+
+    def __init__(self):
+        self._namespace = {"not_iterable_error": not_iterable_error, "convert_shared": convert_shared}
+        self._names = {}
+        self._converters = {}
+        self._lock = threading.Lock()
+
+    def get_converter(self, plan: DataclassPlan, shared: bool = False) -> Callable:
+        converter = self._converters.get((plan, shared))
+        if converter is None:
+            with self._lock:
+                converter = self._converters.get((plan, shared)) or self._generate(plan, shared)
+        return converter
+
+    def _generate(self, plan: DataclassPlan, shared: bool) -> Callable:
+        pending = []
+        self._assign_name(plan, shared, pending)
+        for key in pending:
+            exec(self._get_source(*key, self._names[key]), self._namespace)
+        for key in pending:
+            self._converters[key] = self._namespace[self._names[key]]
+        return self._converters[(plan, shared)]
+
+    def _assign_name(self, plan: DataclassPlan, shared: bool, pending: list) -> None:
+        if (plan, shared) in self._names:
+            return
+        suffix = "_shared" if shared else ""
+        self._names[(plan, shared)] = f"convert_{plan.dc.__name__}_{len(self._names)}{suffix}"
+        pending.append((plan, shared))
+        for field_plan in plan.fields:
+            if field_plan.target is not None:
+                self._assign_name(field_plan.target, shared, pending)
+
+    def _get_source(self, plan: DataclassPlan, shared: bool, func_name: str) -> str:
+        self._namespace[f"{func_name}_dc"] = plan.dc
+        self._namespace[f"{func_name}_plan"] = plan
+        lines = [f"def {func_name}(data, identity_map):" if shared else f"def {func_name}(data):"]
+        args = []
+        for index, field_plan in enumerate(plan.fields):
+            field_ref = f"{func_name}_field_{index}"
+            self._namespace[field_ref] = field_plan
+            value = f"v{index}"
+            lines.extend(self._get_field_source(field_plan, shared, field_ref, value))
+            args.append(f"{field_plan.name}={value}" if field_plan.kw_only else value)
+        lines.append(f"    return {func_name}_dc({', '.join(args)})")
+        return "\n".join(lines)
+
+    def _get_field_source(self, field_plan: FieldPlan, shared: bool, field_ref: str, value: str) -> list[str]:
+        if field_plan.kind is FieldKind.EXCLUDED:
+            return [f"    {value} = {field_ref}.get_excluded_value()"]
+        lines = [
+            "    try:",
+            f"        {value} = data.{field_plan.name}",
+            "    except AttributeError:",
+            f"        {value} = {field_ref}.get_default(data)",
+        ]
+        if field_plan.kind is FieldKind.VALUE:
+            if field_plan.coercer is not None:
+                lines.extend(["    else:", f"        {value} = {field_ref}.coercer({value})"])
+            return lines
+        lines.append("    else:")
+        if field_plan.kind is FieldKind.UNRESOLVED:
+            lines.append(f"        raise {field_ref}.unresolved_error()")
+            return lines
+        target_name = self._names[(field_plan.target, shared)]
+        if shared:
+            convert_target = f"convert_shared({{}}, identity_map, {target_name}, {target_name}_plan)"
+        else:
+            convert_target = f"{target_name}({{}})"
+        lines.append(f"        if {value} is not None:")
+        if field_plan.kind is FieldKind.OBJECT:
+            lines.append(f"            {value} = {convert_target.format(value)}")
+            return lines
+        lines.extend([
+            "            try:",
+            f"                orm_objects = {value}.all()",
+            "            except AttributeError:",
+            f"                raise not_iterable_error({value}, {target_name}_dc) from None",
+            f"            {value} = [{convert_target.format('orm_obj')} for orm_obj in orm_objects]",
+        ])
+        return lines
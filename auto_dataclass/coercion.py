@@ -0,0 +1,124 @@
+import datetime
+import decimal
+import uuid
+from enum import Enum
+from typing import Any, Callable
+
+from auto_dataclass.exceptions import ConversionError
+
+_STR_TYPES = (int, float, decimal.Decimal, uuid.UUID, datetime.date, datetime.time)
+_BOOL_STRINGS = {"true": True, "1": True, "false": False, "0": False}
+
+
+def _to_str(value) -> str:
+    if value.__class__ is str:
+        return value
+    if isinstance(value, str):
+        return str.__str__(value)
+    if isinstance(value, (bool, bytes, bytearray)):
+        raise TypeError(f"{type(value)} has no text form")
+    # Numbers, UUIDs and the objects with a text form of their own, like FieldFile.
+    if isinstance(value, _STR_TYPES) or type(value).__str__ is not object.__str__:
+        return str(value)
+    raise TypeError(f"{type(value)} has no text form")
+
+
+def _to_int(value) -> int:
+    if value.__class__ is int:
+        return value
+    if isinstance(value, bool):
+        raise TypeError("bool is not an integer")
+    if isinstance(value, (float, decimal.Decimal)):
+        if value != int(value):
+            raise ValueError(f"{value!r} is not integral")
+        return int(value)
+    if isinstance(value, (int, str)):
+        return int(value)
+    raise TypeError(f"{type(value)} is not an integer")
+
+
+def _to_float(value) -> float:
+    if value.__class__ is float:
+        return value
+    if isinstance(value, bool) or not isinstance(value, (int, float, decimal.Decimal, str)):
+        raise TypeError(f"{type(value)} is not a number")
+    return float(value)
+
+
+def _to_bool(value) -> bool:
+    if value.__class__ is bool:
+        return value
+    if isinstance(value, str):
+        key = value.strip().lower()
+    elif value.__class__ is int:
+        key = str(value)
+    else:
+        raise TypeError(f"{type(value)} is not a boolean")
+    try:
+        return _BOOL_STRINGS[key]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a boolean") from None
+
+
+def _to_decimal(value) -> decimal.Decimal:
+    if value.__class__ is decimal.Decimal:
+        return value
+    if isinstance(value, bool) or not isinstance(value, (int, float, decimal.Decimal, str)):
+        raise TypeError(f"{type(value)} is not a number")
+    return decimal.Decimal(str(value)) if value.__class__ is float else decimal.Decimal(value)
+
+
+def _to_uuid(value) -> uuid.UUID:
+    return value if value.__class__ is uuid.UUID else uuid.UUID(str(value))
+
+
+def _make_isoformat_parser(value_type: type) -> Callable:
+    def parse(value):
+        return value if value.__class__ is value_type else value_type.fromisoformat(value)
+    return parse
+
+
+def _to_date(value) -> datetime.date:
+    if value.__class__ is datetime.datetime:
+        return value.date()
+    return value if value.__class__ is datetime.date else datetime.date.fromisoformat(value)
+
+
+COERCERS = {
+    str: _to_str,
+    int: _to_int,
+    float: _to_float,
+    bool: _to_bool,
+    decimal.Decimal: _to_decimal,
+    uuid.UUID: _to_uuid,
+    datetime.datetime: _make_isoformat_parser(datetime.datetime),
+    datetime.date: _to_date,
+    datetime.time: _make_isoformat_parser(datetime.time),
+}
+
+
+def get_coercer(dc: type, name: str, field_type: Any, is_optional: bool) -> Callable | None:
+    """Return the function coercing and validating the values of a ``field_type`` field.
+
+    The function is chosen once by the field annotation, ``None`` is returned for the
+    annotations that have no coercion (``Any``, collections, arbitrary classes).
+    """
+    convert = COERCERS.get(field_type)
+    if convert is None and isinstance(field_type, type) and issubclass(field_type, Enum):
+        convert = field_type
+    if convert is None:
+        return None
+
+    def coerce(value):
+        if value is None:
+            if is_optional:
+                return None
+            raise ConversionError(f"The field '{name}' of {dc} is not Optional, but the value is None")
+        try:
+            return convert(value)
+        except (TypeError, ValueError, ArithmeticError) as exc:
+            raise ConversionError(
+                f"The value {value!r} of the field '{name}' of {dc} can't be coerced to {field_type}"
+            ) from exc
+
+    return coerce
@@ -0,0 +1,143 @@
+from array import array
+from collections.abc import Iterable, Sequence
+
+from auto_dataclass.exceptions import ConversionError
+from auto_dataclass.plan import MISSING, DataclassPlan, FieldKind, FieldPlan, unwrap_field_type
+
+ARRAY_TYPECODES = {int: "q", float: "d"}
+NUMPY_DTYPES = {int: "int64", float: "float64", bool: "bool"}
+VALUE_KINDS = (FieldKind.VALUE, FieldKind.EXCLUDED)
+
+
+class ColumnarDTOs(Sequence):
+    """Struct-of-arrays conversion result, keeping the dataclass as the schema.
+
+    Every value field is stored in ``columns`` as a contiguous ``array.array`` when the
+    dataclass annotates it as ``int`` or ``float`` and all the values are of that exact
+    type, or are coerced to it, and fit, as a list otherwise. In NumPy mode columns are NumPy
+    arrays, of ``object`` dtype for the rest.
+    Nested dataclass and ``List[...]`` fields are stored as ``children`` results with all
+    the related objects of the column, the items of row ``i`` being
+    ``children[name][offsets[name][i]:offsets[name][i + 1]]``. Indexing materializes
+    a DTO of the row on demand.
+    """
+
+    def __init__(self, plan: DataclassPlan, length: int, columns: dict, offsets: dict, children: dict):
+        self.dc = plan.dc
+        self.columns = columns
+        self.offsets = offsets
+        self.children = children
+        self._plan = plan
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ColumnarDTOs index out of range")
+        obj_for_dataclass = {}
+        for field in self._plan.fields:
+            if field.kind in VALUE_KINDS:
+                obj_for_dataclass[field.name] = _get_python_value(self.columns[field.name][index])
+                continue
+            offsets = self.offsets[field.name]
+            start, end = offsets[index], offsets[index + 1]
+            if field.kind is FieldKind.LIST:
+                obj_for_dataclass[field.name] = self.children[field.name][start:end]
+            else:
+                obj_for_dataclass[field.name] = self.children[field.name][start] if start != end else None
+        return self._plan.dc(**obj_for_dataclass)
+
+
+class ColumnarBuilder:
+    """Converts model objects to ``ColumnarDTOs`` following a dataclass plan without building DTOs."""
+
+    def __init__(self, use_numpy: bool = False):
+        self._numpy = self._import_numpy() if use_numpy else None
+
+    def build(self, data: Iterable, plan: DataclassPlan) -> ColumnarDTOs:
+        values = {field.name: [] for field in plan.fields if field.kind in VALUE_KINDS}
+        related_objs = {field.name: [] for field in plan.fields if field.kind not in VALUE_KINDS}
+        offsets = {name: array("q", [0]) for name in related_objs}
+        for field in plan.fields:
+            if field.kind is FieldKind.UNRESOLVED:
+                raise field.unresolved_error()
+        length = 0
+        for obj in data:
+            length += 1
+            for field in plan.fields:
+                if field.kind is FieldKind.EXCLUDED:
+                    values[field.name].append(field.get_excluded_value())
+                    continue
+                field_data = getattr(obj, field.name, MISSING)
+                if field_data is MISSING:
+                    field_data = field.get_default(obj)
+                    if field.kind is not FieldKind.VALUE and field_data:
+                        raise ConversionError(
+                            f"The columnar mode doesn't support non-empty defaults of the '{field.name}' field"
+                        )
+                if field.kind is FieldKind.VALUE:
+                    values[field.name].append(field_data if field.coercer is None else field.coercer(field_data))
+                    continue
+                field_objs = related_objs[field.name]
+                if field.kind is FieldKind.LIST and field_data:
+                    field_objs.extend(self._get_related_objects(field_data, field.target))
+                elif field.kind is FieldKind.OBJECT and field_data is not None:
+                    field_objs.append(field_data)
+                offsets[field.name].append(len(field_objs))
+        columns = {}
+        children = {}
+        for field in plan.fields:
+            if field.kind in VALUE_KINDS:
+                columns[field.name] = self._get_column(values[field.name], field)
+            elif related_objs[field.name]:
+                children[field.name] = self.build(related_objs[field.name], field.target)
+            else:
+                children[field.name] = ColumnarDTOs(field.target, 0, {}, {}, {})
+        return ColumnarDTOs(plan, length, columns, offsets, children)
+
+    def _get_column(self, values: list, field: FieldPlan) -> Sequence:
+        field_type, is_iterable = unwrap_field_type(field.annotation)
+        if is_iterable or field.coercer is None and any(value.__class__ is not field_type for value in values):
+            # Typed arrays convert Decimal, bool and the like silently, so they only get the values of the exact type.
+            field_type = None
+        if self._numpy is not None:
+            dtype = NUMPY_DTYPES.get(field_type)
+            if dtype is not None and None not in values:
+                try:
+                    return self._numpy.array(values, dtype=dtype)
+                except (TypeError, ValueError, OverflowError):
+                    pass
+            return self._numpy.fromiter(values, dtype=object, count=len(values))
+        typecode = ARRAY_TYPECODES.get(field_type)
+        if typecode is not None:
+            try:
+                return array(typecode, values)
+            except (TypeError, OverflowError):
+                pass
+        return values
+
+    @staticmethod
+    def _get_related_objects(field_data, plan: DataclassPlan) -> Iterable:
+        try:
+            return field_data.all()
+        except AttributeError:
+            raise ConversionError(f"The {field_data} is not iterable, but specified type is List[{plan.dc}]")
+
+    @staticmethod
+    def _import_numpy():
+        try:
+            import numpy
+        except ImportError:
+            raise ConversionError("The NumPy columnar mode requires the 'numpy' package to be installed")
+        return numpy
+
+
+def _get_python_value(value):
+    item = getattr(value, "item", None)
+    return item() if item is not None and type(value).__module__ == "numpy" else value
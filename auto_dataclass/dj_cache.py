@@ -0,0 +1,139 @@
+import hashlib
+import threading
+import uuid
+from typing import Any, Hashable, Iterable
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+
+from auto_dataclass.cache import LRUCache
+from auto_dataclass.plan import MISSING
+
+GENERATION = "generation"
+
+
+class DjangoCacheBackend:
+    """Adapts a cache of Django's cache framework to the ``LRUCache`` interface.
+
+    Keys are hashed to be valid for every Django cache backend and DTOs are pickled by
+    the cache, so their dataclasses must be importable. ``timeout`` defaults to the
+    ``TIMEOUT`` of the cache, ``None`` never expires the entries.
+    """
+
+    def __init__(
+        self, alias: str = "default", timeout: float | None = DEFAULT_TIMEOUT, key_prefix: str = "auto_dataclass"
+    ):
+        self._cache = caches[alias]
+        self._timeout = timeout
+        self._key_prefix = key_prefix
+
+    def get(self, key: tuple, default: Any = MISSING) -> Any:
+        return self._cache.get(self._make_key(key), default)
+
+    def set(self, key: tuple, value: Any) -> None:
+        self._cache.set(self._make_key(key), value, self._timeout)
+
+    def delete(self, key: tuple) -> None:
+        self._cache.delete(self._make_key(key))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _make_key(self, key: tuple) -> str:
+        raw_key = ":".join(
+            f"{part.__module__}.{part.__qualname__}" if isinstance(part, type) else str(part) for part in key
+        )
+        return f"{self._key_prefix}:{hashlib.md5(raw_key.encode()).hexdigest()}"
+
+
+class DTOCache:
+    """Caches the DTOs converted by ``FromOrmToDataclass.to_dto``.
+
+    DTOs are keyed by dataclass, field projection, model label, pk, the value of the
+    ``version_field`` of the model object and the generation of the model object. The
+    generation is a random token stored in the backend next to the DTOs, replaced on
+    invalidation, so the DTOs of an invalidated object are not found anymore and are left
+    to the eviction of the backend. With a shared backend this invalidates the DTOs stored
+    by every process. ``connect`` invalidates model objects on ``post_save`` and
+    ``post_delete``. Model objects without pk, or with the version field deferred, are
+    not cached.
+    """
+
+    def __init__(
+        self, backend: LRUCache | DjangoCacheBackend | None = None, version_field: str | None = "updated_at"
+    ):
+        self.backend = backend if backend is not None else LRUCache()
+        self.version_field = version_field
+        self.hits = 0
+        self.misses = 0
+        self._senders = []
+        self._lock = threading.Lock()
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "hit_ratio": self.hit_ratio}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def get_key(self, data: Model, dc: type, fields: Iterable[str] | None = None) -> tuple | None:
+        pk = data.pk
+        if pk is None:
+            return None
+        version = None
+        if self.version_field is not None and hasattr(type(data), self.version_field):
+            if self.version_field in data.get_deferred_fields():
+                return None
+            version = getattr(data, self.version_field)
+        fields = None if fields is None else tuple(sorted(fields))
+        label = data._meta.label
+        return dc, fields, label, pk, version, self._get_generation(label, pk)
+
+    def _get_generation(self, label: str, pk: Any) -> str:
+        generation_key = (GENERATION, label, pk)
+        generation = self.backend.get(generation_key, None)
+        if generation is None:
+            generation = uuid.uuid4().hex
+            self.backend.set(generation_key, generation)
+        return generation
+
+    def get(self, key: Hashable) -> Any:
+        dataclass_obj = self.backend.get(key, MISSING)
+        with self._lock:
+            if dataclass_obj is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return dataclass_obj
+
+    def set(self, key: tuple, dataclass_obj) -> None:
+        self.backend.set(key, dataclass_obj)
+
+    def invalidate(self, data: Model) -> None:
+        """Start a new generation of the model object, so its cached DTOs are not used anymore."""
+        if data.pk is not None:
+            self.backend.delete((GENERATION, data._meta.label, data.pk))
+
+    def connect(self, *models: type[Model]) -> None:
+        """Invalidate the DTOs of ``models`` objects, of all models when none are passed, on save and delete."""
+        for sender in models or (None,):
+            post_save.connect(self._on_change, sender=sender, weak=False, dispatch_uid=(id(self), sender))
+            post_delete.connect(self._on_change, sender=sender, weak=False, dispatch_uid=(id(self), sender))
+            self._senders.append(sender)
+
+    def disconnect(self) -> None:
+        for sender in self._senders:
+            post_save.disconnect(sender=sender, dispatch_uid=(id(self), sender))
+            post_delete.disconnect(sender=sender, dispatch_uid=(id(self), sender))
+        self._senders = []
+
+    def _on_change(self, sender, instance: Model, **kwargs) -> None:
+        self.invalidate(instance)
@@ -0,0 +1,263 @@
+import dataclasses
+import datetime
+import decimal
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Iterable, List, Optional
+
+from django.db.models import Model
+
+from auto_dataclass.exceptions import ConversionError
+
+FIELD_TYPES = {
+    "AutoField": int,
+    "BigAutoField": int,
+    "SmallAutoField": int,
+    "IntegerField": int,
+    "BigIntegerField": int,
+    "SmallIntegerField": int,
+    "PositiveIntegerField": int,
+    "PositiveBigIntegerField": int,
+    "PositiveSmallIntegerField": int,
+    "FloatField": float,
+    "DecimalField": decimal.Decimal,
+    "BooleanField": bool,
+    "CharField": str,
+    "TextField": str,
+    "SlugField": str,
+    "EmailField": str,
+    "URLField": str,
+    "FilePathField": str,
+    "GenericIPAddressField": str,
+    "IPAddressField": str,
+    "DateTimeField": datetime.datetime,
+    "DateField": datetime.date,
+    "TimeField": datetime.time,
+    "DurationField": datetime.timedelta,
+    "UUIDField": uuid.UUID,
+    "BinaryField": bytes,
+}
+
+
+@dataclass(slots=True)
+class FieldSpec:
+    name: str
+    type: Any
+    is_list: bool = False
+    is_optional: bool = False
+    default_none: bool = False
+
+    @property
+    def has_default(self) -> bool:
+        return self.is_list or self.default_none
+
+
+@dataclass(slots=True)
+class DataclassSpec:
+    name: str
+    fields: list[FieldSpec]
+    dc: type | None = None
+
+
+class DataclassBuilder:
+    """Builds DTO dataclasses mirroring Django models.
+
+    Top-level fields are the model concrete fields, or the ``fields`` names which may also
+    point to reverse and many-to-many relations, without the ``exclude`` names. Relations
+    are followed into nested dataclasses of all the related model concrete fields while
+    ``depth`` allows, deeper foreign keys are kept as their ``<name>_id`` column. Nested
+    dataclasses of reverse relations leave out the foreign key back to the parent model.
+    """
+
+    def __init__(self, depth: int = 0, slots: bool = True, frozen: bool = True, module: str | None = None):
+        self._depth = depth
+        self._slots = slots
+        self._frozen = frozen
+        self._module = module
+        self._specs = {}
+        self._names = set()
+        self._ordered_specs = []
+
+    def build(
+        self,
+        model: type[Model],
+        fields: Iterable[str] | None = None,
+        exclude: Iterable[str] = (),
+        name: str | None = None,
+    ) -> type:
+        spec = self._get_spec(model, fields, exclude, self._depth, name)
+        for ordered_spec in self._ordered_specs:
+            if ordered_spec.dc is None:
+                ordered_spec.dc = self._make_dataclass(ordered_spec)
+        return spec.dc
+
+    def build_source(
+        self,
+        model: type[Model],
+        fields: Iterable[str] | None = None,
+        exclude: Iterable[str] = (),
+        name: str | None = None,
+    ) -> str:
+        """Return the Python source of the dataclass and the nested dataclasses it refers to."""
+        self._get_spec(model, fields, exclude, self._depth, name)
+        imports = {"dataclasses": {"dataclass"}}
+        classes = []
+        for spec in self._ordered_specs:
+            classes.append(self._get_class_source(spec, imports))
+        import_lines = [
+            f"from {module} import {', '.join(sorted(names))}" for module, names in sorted(imports.items())
+        ]
+        return "\n".join(import_lines) + "\n\n\n" + "\n\n\n".join(classes)
+
+    def _get_spec(
+        self,
+        model: type[Model],
+        fields: Iterable[str] | None,
+        exclude: Iterable[str],
+        depth: int,
+        name: str | None = None,
+    ) -> DataclassSpec:
+        fields = None if fields is None else tuple(fields)
+        exclude = frozenset(exclude)
+        key = (model, fields, exclude, depth, name)
+        spec = self._specs.get(key)
+        if spec is not None:
+            return spec
+        spec = self._specs[key] = DataclassSpec(self._get_class_name(name or f"{model.__name__}DTO"), [])
+        for model_field in self._get_model_fields(model, fields, exclude):
+            spec.fields.append(self._get_field_spec(model, model_field, depth))
+        spec.fields.sort(key=lambda field_spec: field_spec.has_default)
+        self._ordered_specs.append(spec)
+        return spec
+
+    def _get_field_spec(self, model: type[Model], model_field, depth: int) -> FieldSpec:
+        if not model_field.is_relation:
+            return FieldSpec(
+                model_field.name, FIELD_TYPES.get(model_field.get_internal_type(), Any), is_optional=model_field.null
+            )
+        if depth > 0:
+            target = self._get_spec(model_field.related_model, None, self._get_back_reference(model_field), depth - 1)
+        if model_field.many_to_one or model_field.one_to_one:
+            if depth > 0:
+                if model_field.concrete:
+                    return FieldSpec(model_field.name, target, is_optional=model_field.null)
+                return FieldSpec(self._get_field_name(model_field), target, is_optional=True, default_none=True)
+            if model_field.concrete:
+                target_type = FIELD_TYPES.get(model_field.target_field.get_internal_type(), Any)
+                return FieldSpec(model_field.attname, target_type, is_optional=model_field.null)
+        elif depth > 0:
+            return FieldSpec(self._get_field_name(model_field), target, is_list=True)
+        raise ConversionError(
+            f"The 'depth' is not enough to follow the '{self._get_field_name(model_field)}' relation of {model}"
+        )
+
+    def _get_class_name(self, name: str) -> str:
+        class_name = name
+        index = 1
+        while class_name in self._names:
+            index += 1
+            class_name = f"{name}{index}"
+        self._names.add(class_name)
+        return class_name
+
+    def _make_dataclass(self, spec: DataclassSpec) -> type:
+        dc_fields = []
+        for field_spec in spec.fields:
+            field_type = field_spec.type.dc if isinstance(field_spec.type, DataclassSpec) else field_spec.type
+            if field_spec.is_list:
+                dc_fields.append((field_spec.name, List[field_type], field(default_factory=list)))
+            elif field_spec.default_none:
+                dc_fields.append((field_spec.name, Optional[field_type], None))
+            elif field_spec.is_optional:
+                dc_fields.append((field_spec.name, Optional[field_type]))
+            else:
+                dc_fields.append((field_spec.name, field_type))
+        dc = dataclasses.make_dataclass(spec.name, dc_fields, slots=self._slots, frozen=self._frozen)
+        if self._module is not None:
+            dc.__module__ = self._module
+        return dc
+
+    def _get_class_source(self, spec: DataclassSpec, imports: dict) -> str:
+        lines = [f"@dataclass(slots={self._slots}, frozen={self._frozen})", f"class {spec.name}:"]
+        for field_spec in spec.fields:
+            type_name = self._get_type_source(field_spec.type, imports)
+            if field_spec.is_list:
+                imports.setdefault("dataclasses", set()).add("field")
+                imports.setdefault("typing", set()).add("List")
+                lines.append(f"    {field_spec.name}: List[{type_name}] = field(default_factory=list)")
+            elif field_spec.is_optional:
+                imports.setdefault("typing", set()).add("Optional")
+                default = " = None" if field_spec.default_none else ""
+                lines.append(f"    {field_spec.name}: Optional[{type_name}]{default}")
+            else:
+                lines.append(f"    {field_spec.name}: {type_name}")
+        if not spec.fields:
+            lines.append("    pass")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _get_type_source(field_type, imports: dict) -> str:
+        if isinstance(field_type, DataclassSpec):
+            return field_type.name
+        if field_type is Any:
+            imports.setdefault("typing", set()).add("Any")
+            return "Any"
+        if field_type.__module__ != "builtins":
+            imports.setdefault(field_type.__module__, set()).add(field_type.__name__)
+        return field_type.__name__
+
+    def _get_model_fields(self, model: type[Model], fields: tuple | None, exclude: frozenset) -> list:
+        if fields is None:
+            return [model_field for model_field in model._meta.concrete_fields if model_field.name not in exclude]
+        model_fields = {self._get_field_name(model_field): model_field for model_field in model._meta.get_fields()}
+        result = []
+        for field_name in fields:
+            if field_name in exclude:
+                continue
+            model_field = model_fields.get(field_name)
+            if model_field is None:
+                raise ConversionError(f"The {model} has no field named '{field_name}'")
+            result.append(model_field)
+        return result
+
+    @staticmethod
+    def _get_back_reference(model_field) -> tuple[str, ...]:
+        if model_field.auto_created and not model_field.concrete and not model_field.many_to_many:
+            return (model_field.field.name,)
+        return ()
+
+    @staticmethod
+    def _get_field_name(model_field) -> str:
+        if model_field.auto_created and not model_field.concrete:
+            return model_field.get_accessor_name()
+        return model_field.name
+
+
+def model_to_dataclass(
+    model: type[Model],
+    fields: Iterable[str] | None = None,
+    exclude: Iterable[str] = (),
+    depth: int = 0,
+    name: str | None = None,
+    slots: bool = True,
+    frozen: bool = True,
+    module: str | None = None,
+) -> type:
+    """Build a DTO dataclass mirroring the ``model`` for ``FromOrmToDataclass``.
+
+    Pass ``module`` to make the generated classes picklable, e.g. for ``iter_dto_parallel``.
+    """
+    return DataclassBuilder(depth, slots, frozen, module).build(model, fields, exclude, name)
+
+
+def model_to_dataclass_source(
+    model: type[Model],
+    fields: Iterable[str] | None = None,
+    exclude: Iterable[str] = (),
+    depth: int = 0,
+    name: str | None = None,
+    slots: bool = True,
+    frozen: bool = True,
+) -> str:
+    """Return the source of the DTO dataclass ``model_to_dataclass`` builds, to be saved in the code base."""
+    return DataclassBuilder(depth, slots, frozen).build_source(model, fields, exclude, name)
@@ -0,0 +1,217 @@
+import dataclasses
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import router, transaction
+from django.db.models import Model
+
+from auto_dataclass.exceptions import ConversionError
+from auto_dataclass.plan import DataclassPlan, FieldKind, PlanCache
+
+BATCH_SIZE = 1000
+
+
+@dataclass(slots=True, eq=False)
+class ChildrenPlan:
+    """A ``List[...]`` field backed by a reverse foreign key, inserted after its parents."""
+
+    name: str
+    fk_attname: str
+    target: "ModelPlan"
+
+
+@dataclass(slots=True, eq=False)
+class ModelPlan:
+    model: type[Model]
+    values: tuple[tuple[str, str], ...] = ()
+    relations: tuple[tuple[str, str, str], ...] = ()
+    children: tuple[ChildrenPlan, ...] = ()
+    update_fields: tuple[str, ...] = ()
+
+
+class FromDataclassToOrm:
+    """Converts DTOs back to unsaved model instances and persists them in batches.
+
+    The dataclass plans say which model fields the DTOs hold: value fields are set by
+    field name or attname (``brand_id``), nested dataclass fields of foreign keys set
+    the foreign key to the pk of the nested DTO and ``List[...]`` fields of reverse
+    foreign keys are children, saved after their parents with the foreign key filled.
+    DTO fields the model doesn't have are ignored. ``fields`` projects the DTO fields
+    to persist, like in ``FromOrmToDataclass``.
+    """
+
+    def __init__(self, plans: PlanCache | None = None):
+        self._plans = plans if plans is not None else PlanCache()
+        self._model_plans = {}
+
+    def to_models(
+        self, dtos: Iterable[dataclass], dc: dataclass, model: type[Model], *args, fields: Iterable[str] | None = None
+    ) -> list[Model]:
+        """Return unsaved ``model`` instances of the ``dc`` DTOs, without their children."""
+        model_plan = self._get_model_plan(dc, model, args, fields)
+        return [self._build(dto, model_plan) for dto in dtos]
+
+    def bulk_create(
+        self,
+        dtos: Iterable[dataclass],
+        dc: dataclass,
+        model: type[Model],
+        *args,
+        batch_size: int = BATCH_SIZE,
+        fields: Iterable[str] | None = None,
+    ) -> list[Model]:
+        """Insert the ``dc`` DTOs and their children with one ``bulk_create`` per model and batch.
+
+        Children are inserted once all their parents are, so the database backend must
+        return the primary keys of inserted rows, or the DTOs must hold them.
+        Everything is inserted in one transaction.
+        """
+        model_plan = self._get_model_plan(dc, model, args, fields)
+        with transaction.atomic(using=router.db_for_write(model)):
+            return self._create(list(dtos), model_plan, batch_size)
+
+    def bulk_update(
+        self,
+        dtos: Iterable[dataclass],
+        dc: dataclass,
+        model: type[Model],
+        *args,
+        batch_size: int = BATCH_SIZE,
+        fields: Iterable[str] | None = None,
+    ) -> list[Model]:
+        """Update the rows of the ``dc`` DTOs and their children with one ``bulk_update`` per model and batch.
+
+        The DTOs must hold the primary keys; every model field read from the DTOs is updated.
+        """
+        model_plan = self._get_model_plan(dc, model, args, fields)
+        with transaction.atomic(using=router.db_for_write(model)):
+            return self._update(list(dtos), model_plan, batch_size)
+
+    def _create(
+        self, dtos: list, model_plan: ModelPlan, batch_size: int, back_refs: tuple | None = None
+    ) -> list[Model]:
+        objs = self._build_many(dtos, model_plan, back_refs)
+        model_plan.model._default_manager.bulk_create(objs, batch_size=batch_size)
+        for children in model_plan.children:
+            child_dtos, parent_pks = self._collect_children(dtos, objs, children)
+            if child_dtos:
+                self._create(child_dtos, children.target, batch_size, (children.fk_attname, parent_pks))
+        return objs
+
+    def _update(
+        self, dtos: list, model_plan: ModelPlan, batch_size: int, back_refs: tuple | None = None
+    ) -> list[Model]:
+        objs = self._build_many(dtos, model_plan, back_refs)
+        for obj in objs:
+            if obj.pk is None:
+                raise ConversionError(f"The {model_plan.model} objects can't be updated without primary key")
+        if model_plan.update_fields:
+            model_plan.model._default_manager.bulk_update(objs, model_plan.update_fields, batch_size=batch_size)
+        for children in model_plan.children:
+            child_dtos, parent_pks = self._collect_children(dtos, objs, children)
+            if child_dtos:
+                self._update(child_dtos, children.target, batch_size, (children.fk_attname, parent_pks))
+        return objs
+
+    def _build_many(self, dtos: list, model_plan: ModelPlan, back_refs: tuple | None) -> list[Model]:
+        objs = [self._build(dto, model_plan) for dto in dtos]
+        if back_refs is not None:
+            fk_attname, parent_pks = back_refs
+            for obj, parent_pk in zip(objs, parent_pks):
+                setattr(obj, fk_attname, parent_pk)
+        return objs
+
+    @staticmethod
+    def _build(dto: dataclass, model_plan: ModelPlan) -> Model:
+        kwargs = {attname: getattr(dto, name) for name, attname in model_plan.values}
+        for name, attname, pk_name in model_plan.relations:
+            related_dto = getattr(dto, name)
+            kwargs[attname] = None if related_dto is None else getattr(related_dto, pk_name)
+        return model_plan.model(**kwargs)
+
+    @staticmethod
+    def _collect_children(dtos: list, objs: list[Model], children: ChildrenPlan) -> tuple[list, list]:
+        child_dtos = []
+        parent_pks = []
+        for dto, obj in zip(dtos, objs):
+            items = getattr(dto, children.name)
+            if not items:
+                continue
+            if obj.pk is None:
+                raise ConversionError(
+                    f"The '{children.name}' objects can't refer to {type(obj)} objects without primary key, "
+                    f"the database backend doesn't return the primary keys of inserted rows"
+                )
+            for item in items:
+                child_dtos.append(item)
+                parent_pks.append(obj.pk)
+        return child_dtos, parent_pks
+
+    def _get_model_plan(
+        self, dc: dataclass, model: type[Model], future_dataclasses: tuple, fields: Iterable[str] | None
+    ) -> ModelPlan:
+        if not dataclasses.is_dataclass(dc):
+            raise ConversionError(f"The 'dc' arg should be dataclass type, not {type(dc)} type")
+        if not (isinstance(model, type) and issubclass(model, Model)):
+            raise ConversionError(f"The 'model' arg should be django.db.models.Model type, not {model}")
+        plan = self._plans.get(dc, future_dataclasses, fields)
+        model_plan = self._model_plans.get((plan, model))
+        if model_plan is None:
+            compiled = {}
+            model_plan = self._compile(plan, model, compiled)
+            if plan.is_cached:
+                self._model_plans.update(compiled)
+        return model_plan
+
+    def _compile(self, plan: DataclassPlan, model: type[Model], compiled: dict) -> ModelPlan:
+        model_plan = self._model_plans.get((plan, model)) or compiled.get((plan, model))
+        if model_plan is not None:
+            return model_plan
+        model_plan = compiled[(plan, model)] = ModelPlan(model)
+        values, relations, children, update_fields = [], [], [], []
+        pk_field = model._meta.pk
+        for field in plan.fields:
+            if field.kind is FieldKind.EXCLUDED:
+                continue
+            if field.kind is FieldKind.UNRESOLVED:
+                raise field.unresolved_error()
+            model_field = pk_field if field.name == "pk" else self._get_model_field(model, field.name)
+            if model_field is None:
+                continue
+            if field.kind is FieldKind.VALUE and model_field.concrete and not model_field.many_to_many:
+                values.append((field.name, model_field.attname))
+            elif field.kind is FieldKind.OBJECT and model_field.concrete and model_field.is_relation:
+                related_pk_name = self._get_pk_name(field.target, model_field.related_model)
+                relations.append((field.name, model_field.attname, related_pk_name))
+            elif field.kind is FieldKind.LIST and model_field.one_to_many:
+                target = self._compile(field.target, model_field.related_model, compiled)
+                children.append(ChildrenPlan(field.name, model_field.field.attname, target))
+                continue
+            else:
+                raise ConversionError(
+                    f"The field '{field.name}' of {plan.dc} can't be persisted to {model}, "
+                    f"exclude it with the 'fields' argument"
+                )
+            if model_field is not pk_field:
+                update_fields.append(model_field.name)
+        model_plan.values = tuple(values)
+        model_plan.relations = tuple(relations)
+        model_plan.children = tuple(children)
+        model_plan.update_fields = tuple(dict.fromkeys(update_fields))
+        return model_plan
+
+    @staticmethod
+    def _get_model_field(model: type[Model], name: str):
+        try:
+            return model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+
+    @staticmethod
+    def _get_pk_name(plan: DataclassPlan, model: type[Model]) -> str:
+        pk_names = ("pk", model._meta.pk.name, model._meta.pk.attname)
+        for field in plan.fields:
+            if field.kind is FieldKind.VALUE and field.name in pk_names:
+                return field.name
+        raise ConversionError(f"The {plan.dc} has no primary key field of {model} to refer to")
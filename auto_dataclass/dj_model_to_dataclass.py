@@ -1,110 +1,657 @@
 import dataclasses
-from abc import ABC, abstractmethod
+import os
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass, is_dataclass
-from types import UnionType
-from typing import Type, ForwardRef, get_origin, Union
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from itertools import count, islice
+from asgiref.sync import sync_to_async
+from django.core.exceptions import SynchronousOnlyOperation
+from django.db import connections
 from django.db.models.manager import Manager
-from django.db.models import Model
+from django.db.models import Model, Prefetch, QuerySet, prefetch_related_objects
 
+from auto_dataclass.codegen import ConverterGenerator
+from auto_dataclass.columnar import ColumnarBuilder, ColumnarDTOs
+from auto_dataclass.dj_cache import DTOCache
+from auto_dataclass.dj_parallel import ChunkTask, get_pk_ranges, init_worker, iter_converted_chunks
+from auto_dataclass.dj_queries import QueryCounter, active_query_counter
+from auto_dataclass.dj_queryset import QuerySetOptimizer
+from auto_dataclass.dj_tree import TreeLoader
+from auto_dataclass.dj_values import ValuesPlan, ValuesPlanCompiler
 from auto_dataclass.exceptions import ConversionError
+from auto_dataclass.lazy import LazyDTO, LazyList
+from auto_dataclass.plan import (
+    MISSING,
+    DataclassPlan,
+    FieldKind,
+    FieldPlan,
+    PlanCache,
+    convert_field,
+    get_attribute,
+)
+from auto_dataclass.profiling import CONSTRUCT, DATACLASS, FIELD, RELATED, ChunkStats, ConversionProfiler
+from auto_dataclass.serializer import JSON_CHUNK_SIZE, JSONSerializer
+from auto_dataclass.sources import ToDTOConverter
 
-T = Type["T"]
+STREAM_CHUNK_SIZE = 2000
 
 
-class ToDTOConverter(ABC):
-    @abstractmethod
-    def to_dto(self, data, dc: dataclass) -> dataclass:
-        pass
+class FromOrmToDataclass(ToDTOConverter):
 
+    def __init__(
+        self,
+        codegen: bool = False,
+        cache: DTOCache | None = None,
+        profiler: ConversionProfiler | None = None,
+        coerce: bool = False,
+        plans: PlanCache | None = None,
+    ):
+        self._plans = self._get_plan_cache(plans, coerce)
+        self._values_plans = {}
+        self._serializers = {}
+        self._generator = ConverterGenerator() if codegen else None
+        self._cache = cache
+        self.profiler = profiler
 
-class FromOrmToDataclass(ToDTOConverter):
+    def to_dto(
+        self, data: Model, dc: dataclass, *args, lazy: bool = False, fields: Iterable[str] | None = None
+    ) -> dataclass:
+        checked_dc = self._check_dataclass_arg(dc)
+        future_dataclasses = self._check_future_dataclasses_arg(args)
+        checked_data = self._is_data_dj_model_type(data)
+        converter = self._get_object_converter(checked_dc, future_dataclasses, lazy=lazy, fields=fields)
+        if self._cache is None or lazy:
+            return converter(checked_data)
+        return self._get_cached_dataclass_object(checked_data, checked_dc, converter, fields)
+
+    def iter_dto(
+        self,
+        data: Iterable[Model],
+        dc: dataclass,
+        *args,
+        chunk_size: int | None = None,
+        identity_map: bool = False,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> Iterator[dataclass]:
+        """Lazily convert every model object of ``data`` to the ``dc`` dataclass.
+
+        The arguments are validated and the conversion plan is resolved once for the
+        whole iterable. When ``data`` is a QuerySet and ``chunk_size`` is passed, rows
+        are fetched with ``QuerySet.iterator(chunk_size=chunk_size)``, so they are not
+        cached by the QuerySet.
+
+        With ``identity_map`` every related model object is converted once per call and
+        its DTO is shared by all the objects referencing it, keyed by dataclass plan, model and pk.
 
-    def __init__(self):
-        self._future_dataclasses = []
+        With ``lazy`` nested dataclass fields are ``LazyDTO`` proxies converted on the first
+        attribute access and ``List[...]`` fields are ``LazyList`` sequences, fetched and
+        converted on the first access to their items.
 
-    def to_dto(self, data: Model, dc: dataclass, *args) -> dataclass:
+        ``fields`` projects the conversion to the given field paths, like ``id`` or
+        ``photos.image``. The other fields get their default value, or ``None``,
+        without reading the model objects.
+        """
         checked_dc = self._check_dataclass_arg(dc)
-        self._future_dataclasses.append(checked_dc)
-        self._check_future_dataclasses_arg(args)
+        future_dataclasses = self._check_future_dataclasses_arg(args)
+        checked_data = self._is_data_iterable_type(data)
+        if identity_map and lazy:
+            raise ConversionError("The 'identity_map' and 'lazy' arguments can't be used together")
+        if chunk_size is not None and isinstance(checked_data, QuerySet):
+            checked_data = checked_data.iterator(chunk_size=chunk_size)
+        converter = self._get_object_converter(
+            checked_dc, future_dataclasses, {} if identity_map else None, lazy, fields
+        )
+        return self._iter_dataclass_objs(checked_data, converter)
+
+    def to_dto_many(
+        self,
+        data: Iterable[Model],
+        dc: dataclass,
+        *args,
+        chunk_size: int | None = None,
+        identity_map: bool = False,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> list[dataclass]:
+        return list(
+            self.iter_dto(
+                data, dc, *args, chunk_size=chunk_size, identity_map=identity_map, lazy=lazy, fields=fields
+            )
+        )
+
+    def to_columns(
+        self, data: Iterable[Model], dc: dataclass, *args, chunk_size: int | None = None, use_numpy: bool = False
+    ) -> ColumnarDTOs:
+        """Convert the model objects of ``data`` to columns of the ``dc`` dataclass fields.
+
+        No DTO is created while converting, ``ColumnarDTOs`` keeps one array per value field
+        and offsets for the nested fields, and materializes the DTO of a row when indexed.
+        ``use_numpy`` stores the columns as NumPy arrays, which requires NumPy.
+        """
+        checked_dc = self._check_dataclass_arg(dc)
+        future_dataclasses = self._check_future_dataclasses_arg(args)
+        checked_data = self._is_data_iterable_type(data)
+        if chunk_size is not None and isinstance(checked_data, QuerySet):
+            checked_data = checked_data.iterator(chunk_size=chunk_size)
+        plan = self._get_plan(checked_dc, future_dataclasses)
+        return ColumnarBuilder(use_numpy).build(self._iter_dataclass_objs(checked_data, lambda obj: obj), plan)
+
+    def iter_dto_values(
+        self,
+        data: QuerySet,
+        dc: dataclass,
+        *args,
+        chunk_size: int | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> Iterator[dataclass]:
+        """Lazily convert the QuerySet rows to the ``dc`` dataclass without model objects.
+
+        The needed columns are derived from the dataclass fields and fetched with a single
+        ``values_list`` query. Nested dataclass fields are read through forward relations,
+        ``List[...]`` fields are not supported.
+        """
+        checked_dc = self._check_dataclass_arg(dc)
+        future_dataclasses = self._check_future_dataclasses_arg(args)
+        queryset = self._is_data_dj_queryset_type(data)
+        values_plan = self._get_values_plan(self._get_plan(checked_dc, future_dataclasses, fields), queryset)
+        rows = queryset.values_list(*values_plan.columns)
+        if chunk_size is not None:
+            rows = rows.iterator(chunk_size=chunk_size)
+        return map(values_plan.converter, rows)
+
+    def iter_dto_parallel(
+        self,
+        data: QuerySet,
+        dc: dataclass,
+        *args,
+        workers: int | None = None,
+        chunk_size: int = 10000,
+        ordered: bool = True,
+        executor: Executor | None = None,
+    ) -> Iterator[dataclass]:
+        """Lazily convert the QuerySet to the ``dc`` dataclass in parallel worker processes.
+
+        The QuerySet is split into primary key ranges of ``chunk_size`` rows and every
+        worker fetches and converts its ranges with its own database connection. DTOs are
+        yielded by primary key when ``ordered`` is set, chunk by chunk as they are ready
+        otherwise. ``dc`` and the future dataclasses must be importable by the workers.
+        A process pool of ``workers`` processes is created unless ``executor`` is passed.
+        """
+        checked_dc = self._check_dataclass_arg(dc)
+        future_dataclasses = self._check_future_dataclasses_arg(args)
+        queryset = self._is_data_dj_queryset_type(data)
+        if chunk_size < 1:
+            raise ConversionError(f"The 'chunk_size' must be a positive number, not {chunk_size}")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        elif workers < 1:
+            raise ConversionError(f"The 'workers' must be a positive number, not {workers}")
+        self._get_plan(checked_dc, future_dataclasses)
+        task = ChunkTask.from_queryset(
+            queryset, checked_dc, future_dataclasses, self._generator is not None, self._plans.coerce
+        )
+        return self._iter_parallel_chunks(queryset, task, chunk_size, workers, ordered, executor)
+
+    def iter_dto_stream(
+        self,
+        data: QuerySet,
+        dc: dataclass,
+        *args,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        identity_map: bool = False,
+        max_depth: int = 3,
+        fields: Iterable[str] | None = None,
+        on_chunk: Callable[[ChunkStats], None] | None = None,
+    ) -> Iterator[dataclass]:
+        """Lazily convert the QuerySet holding at most ``chunk_size`` rows and their relations at once.
+
+        The QuerySet is optimized for ``dc`` as by ``optimize_queryset`` and read with
+        ``QuerySet.iterator``, a server-side cursor where the database supports it. For every
+        chunk the ``List[...]`` fields are prefetched with one ``IN`` query per relation and
+        the chunk is converted and released before its DTOs are yielded, so rows are only
+        fetched as fast as the DTOs are consumed. ``identity_map`` shares DTOs within a chunk.
+        ``on_chunk`` receives the ``ChunkStats`` of every chunk.
+        """
+        checked_dc = self._check_dataclass_arg(dc)
+        future_dataclasses = self._check_future_dataclasses_arg(args)
+        queryset = self._is_data_dj_queryset_type(data)
+        if chunk_size < 1:
+            raise ConversionError(f"The 'chunk_size' must be a positive number, not {chunk_size}")
+        plan = self._get_plan(checked_dc, future_dataclasses, fields)
+        queryset, prefetch_lookups = self._get_chunked_queryset(queryset, plan, max_depth)
+        get_converter = partial(self._get_object_converter, checked_dc, future_dataclasses, fields=fields)
+        return self._iter_streamed_chunks(
+            queryset.iterator(chunk_size=chunk_size), chunk_size, prefetch_lookups, get_converter,
+            identity_map, on_chunk,
+        )
+
+    @staticmethod
+    def _iter_streamed_chunks(
+        rows: Iterator[Model],
+        chunk_size: int,
+        prefetch_lookups: list[str | Prefetch],
+        get_converter: Callable,
+        identity_map: bool,
+        on_chunk: Callable[[ChunkStats], None] | None,
+    ) -> Iterator[dataclass]:
+        for index in count():
+            started_at = time.perf_counter()
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            if prefetch_lookups:
+                prefetch_related_objects(chunk, *prefetch_lookups)
+            converter = get_converter({} if identity_map else None)
+            dtos = [converter(obj) for obj in chunk]
+            if on_chunk is not None:
+                stats = ChunkStats(index, len(chunk), time.perf_counter() - started_at)
+                if tracemalloc.is_tracing():
+                    stats.memory, stats.peak_memory = tracemalloc.get_traced_memory()
+                    tracemalloc.reset_peak()
+                on_chunk(stats)
+            del chunk
+            yield from dtos
+
+    @staticmethod
+    def _iter_parallel_chunks(
+        queryset: QuerySet, task: ChunkTask, chunk_size: int, workers: int, ordered: bool, executor: Executor | None
+    ) -> Iterator[dataclass]:
+        tasks = [
+            dataclasses.replace(task, first_pk=first_pk, last_pk=last_pk)
+            for first_pk, last_pk in get_pk_ranges(queryset, chunk_size)
+        ]
+        if executor is not None:
+            for chunk in iter_converted_chunks(executor, tasks, ordered, workers * 2):
+                yield from chunk
+            return
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as process_pool:
+            for chunk in iter_converted_chunks(process_pool, tasks, ordered, workers * 2):
+                yield from chunk
+
+    def to_json(self, dto: dataclass, dc: dataclass, *args, fields: Iterable[str] | None = None) -> bytes:
+        """Serialize the ``dc`` DTO to JSON bytes, reading the fields from its conversion plan.
+
+        With ``fields`` only the projected field paths are written.
+        """
+        checked_dc = self._check_dataclass_arg(dc)
+        future_dataclasses = self._check_future_dataclasses_arg(args)
+        return self._get_serializer(checked_dc, future_dataclasses, fields).dumps(dto)
+
+    def iter_json(
+        self,
+        dtos: Iterable[dataclass],
+        dc: dataclass,
+        *args,
+        chunk_size: int = JSON_CHUNK_SIZE,
+        fields: Iterable[str] | None = None,
+    ) -> Iterator[bytes]:
+        """Serialize the ``dc`` DTOs to a JSON array yielded by chunks of about ``chunk_size`` bytes.
+
+        DTOs are consumed one by one, so a lazy iterable like ``iter_dto`` is streamed
+        without holding the whole response, e.g. by ``StreamingHttpResponse``.
+        """
+        checked_dc = self._check_dataclass_arg(dc)
+        future_dataclasses = self._check_future_dataclasses_arg(args)
+        return self._get_serializer(checked_dc, future_dataclasses, fields).iter_chunks(dtos, chunk_size)
+
+    def write_json(
+        self, dtos: Iterable[dataclass], fp, dc: dataclass, *args, fields: Iterable[str] | None = None
+    ) -> None:
+        """Write the ``dc`` DTOs as a JSON array to the binary file-like ``fp``."""
+        for chunk in self.iter_json(dtos, dc, *args, fields=fields):
+            fp.write(chunk)
+
+    def _get_serializer(
+        self, dc: dataclass, future_dataclasses: tuple, fields: Iterable[str] | None = None
+    ) -> JSONSerializer:
+        plan = self._get_plan(dc, future_dataclasses, fields)
+        serializer = self._serializers.get(plan)
+        if serializer is None:
+            serializer = JSONSerializer(plan)
+            if plan.is_cached:
+                self._serializers[plan] = serializer
+        return serializer
+
+    def to_dto_tree(
+        self, data: Iterable[Model], dc: dataclass, *args, nodes: QuerySet | None = None
+    ) -> list[dataclass]:
+        """Convert the tree roots of ``data`` with all their descendants to the ``dc`` dataclass.
+
+        The tree is built iteratively from an in-memory parent index, so deep trees don't
+        hit the recursion limit. Descendants are taken from the ``nodes`` QuerySet with a
+        single query, or fetched with one query per tree level when it is not passed.
+        """
+        checked_dc = self._check_dataclass_arg(dc)
+        future_dataclasses = self._check_future_dataclasses_arg(args)
+        roots = list(self._is_data_iterable_type(data))
+        if not roots:
+            return []
+        model = type(self._is_data_dj_model_type(roots[0]))
+        plan = self._get_plan(checked_dc, future_dataclasses)
+        loader = TreeLoader(plan, model)
+        levels, children = loader.load(roots, nodes)
+        dataclass_objs = {}
+        for level in reversed(levels):
+            for node in level:
+                node_children = [
+                    dataclass_objs[child.pk] for child in children.get(node.pk, ()) if child.pk in dataclass_objs
+                ]
+                dataclass_objs[node.pk] = self._convert_tree_node(node, plan, loader.field, node_children)
+        return [dataclass_objs[root.pk] for root in roots]
+
+    def optimize_queryset(
+        self, data: QuerySet, dc: dataclass, *args, max_depth: int = 3, fields: Iterable[str] | None = None
+    ) -> QuerySet:
+        """Return the QuerySet with the relation loading needed to convert it to ``dc``.
+
+        Nested dataclass fields are joined with ``select_related``, ``List[...]`` fields
+        are prefetched and ``only`` limits the loaded columns to the dataclass fields,
+        or to the ``fields`` projection. Relations nested deeper than ``max_depth`` are
+        not preloaded.
+        """
+        checked_dc = self._check_dataclass_arg(dc)
+        future_dataclasses = self._check_future_dataclasses_arg(args)
+        queryset = self._is_data_dj_queryset_type(data)
+        plan = self._get_plan(checked_dc, future_dataclasses, fields)
+        return QuerySetOptimizer(max_depth).optimize(queryset, plan)
+
+    async def ato_dto(self, data: Model, dc: dataclass, *args, max_depth: int = 3) -> dataclass:
+        """Async version of ``to_dto`` for async views.
+
+        The relations read by ``dc`` are prefetched for ``data`` with a single thread
+        switch, so the conversion doesn't query the database from the event loop.
+        """
+        checked_dc = self._check_dataclass_arg(dc)
+        future_dataclasses = self._check_future_dataclasses_arg(args)
         checked_data = self._is_data_dj_model_type(data)
-        return self._to_dataclass_obj(checked_data, checked_dc)
+        plan = self._get_plan(checked_dc, future_dataclasses)
+        prefetch_lookups = QuerySetOptimizer(max_depth).get_prefetch_lookups(type(checked_data), plan)
+        if prefetch_lookups:
+            await sync_to_async(prefetch_related_objects)([checked_data], *prefetch_lookups)
+        return self._convert_loaded(checked_data, self._get_object_converter(checked_dc, future_dataclasses))
 
-    def _to_dataclass_obj(self, data: Model, dc: dataclass) -> dataclass:
-        obj_for_dataclass = {}
-        for field in dataclasses.fields(dc):
-            if self._is_field_name_exists_in_data(data, field):
-
-                field_data = getattr(data, field.name)
-                origin_type, is_iterable = self._get_origin_field_type(field.type)
-
-                if is_iterable and is_dataclass(origin_type) and field_data is not None:
-                    obj_for_dataclass[field.name] = self._get_list_of_dataclass_objects(
-                        field_data, origin_type
-                    )
-                elif is_dataclass(origin_type) and field_data is not None:
-                    obj_for_dataclass[field.name] = self._get_dataclass_object(
-                        field_data, origin_type
-                    )
-                else:
-                    obj_for_dataclass[field.name] = field_data
-            else:
-                obj_for_dataclass[field.name] = self._get_default_value_or_error(field, data)
+    async def aiter_dto(
+        self,
+        data: QuerySet,
+        dc: dataclass,
+        *args,
+        chunk_size: int | None = None,
+        identity_map: bool = False,
+        max_depth: int = 3,
+    ) -> AsyncIterator[dataclass]:
+        """Async version of ``iter_dto`` for async views, e.g. ``async for dto in aiter_dto(...)``.
 
-        return dc(**obj_for_dataclass)
+        The QuerySet is optimized for ``dc`` as by ``optimize_queryset`` and fetched with
+        Django's async QuerySet API. With ``chunk_size`` rows are fetched by chunks and the
+        ``List[...]`` fields are prefetched for every chunk. Relations nested deeper than
+        ``max_depth`` can't be loaded lazily from the event loop and raise ``ConversionError``.
+        """
+        checked_dc = self._check_dataclass_arg(dc)
+        future_dataclasses = self._check_future_dataclasses_arg(args)
+        queryset = self._is_data_dj_queryset_type(data)
+        plan = self._get_plan(checked_dc, future_dataclasses)
+        converter = self._get_object_converter(
+            checked_dc, future_dataclasses, {} if identity_map else None
+        )
+        if chunk_size is None:
+            async for obj in QuerySetOptimizer(max_depth).optimize(queryset, plan):
+                yield self._convert_loaded(obj, converter)
+            return
+
+        queryset, prefetch_lookups = self._get_chunked_queryset(queryset, plan, max_depth)
+        chunk = []
+        async for obj in queryset.aiterator(chunk_size=chunk_size):
+            chunk.append(obj)
+            if len(chunk) < chunk_size:
+                continue
+            await self._aprefetch_chunk(chunk, prefetch_lookups)
+            for chunk_obj in chunk:
+                yield self._convert_loaded(chunk_obj, converter)
+            chunk = []
+        await self._aprefetch_chunk(chunk, prefetch_lookups)
+        for chunk_obj in chunk:
+            yield self._convert_loaded(chunk_obj, converter)
 
     @staticmethod
-    def _is_field_name_exists_in_data(data: Model, field: dataclasses.Field) -> bool | None:
-        if hasattr(data, field.name):
-            return True
-        return False
+    def _get_chunked_queryset(
+        queryset: QuerySet, plan: DataclassPlan, max_depth: int
+    ) -> tuple[QuerySet, list[str | Prefetch]]:
+        """Return the QuerySet optimized for ``plan`` without prefetches and the lookups to prefetch per chunk."""
+        optimizer = QuerySetOptimizer(max_depth)
+        lookups = optimizer.get_lookups(queryset, plan)
+        prefetch_lookups = lookups.prefetch_related
+        lookups.prefetch_related = []
+        return optimizer.apply_lookups(queryset.prefetch_related(None), lookups), prefetch_lookups
 
     @staticmethod
-    def _get_default_value_or_error(field: dataclasses.Field, data: Model):
-        if field.default is dataclasses.MISSING:
-            if field.default_factory is dataclasses.MISSING:
-                raise ConversionError(
-                    f"Field name '{field.name}' doesn't exist in {data}"
+    async def _aprefetch_chunk(chunk: list[Model], prefetch_lookups: list[str | Prefetch]) -> None:
+        if chunk and prefetch_lookups:
+            await sync_to_async(prefetch_related_objects)(chunk, *prefetch_lookups)
+
+    @staticmethod
+    def _convert_loaded(data: Model, converter: Callable[[Model], dataclass]) -> dataclass:
+        try:
+            return converter(data)
+        except SynchronousOnlyOperation as exc:
+            raise ConversionError(
+                f"The {data} has a relation that is not loaded and can't be fetched from async code. "
+                f"Increase 'max_depth' or load it in the QuerySet."
+            ) from exc
+
+    def _get_cached_dataclass_object(
+        self, data: Model, dc: dataclass, converter: Callable[[Model], dataclass], fields: Iterable[str] | None
+    ) -> dataclass:
+        key = self._cache.get_key(data, dc, self._plans.get_projection_key(fields))
+        if key is None:
+            return converter(data)
+        dataclass_obj = self._cache.get(key)
+        if dataclass_obj is MISSING:
+            dataclass_obj = converter(data)
+            self._cache.set(key, dataclass_obj)
+        return dataclass_obj
+
+    def _get_values_plan(self, plan: DataclassPlan, queryset: QuerySet) -> ValuesPlan:
+        annotations = tuple(queryset.query.annotations)
+        key = (plan, queryset.model, annotations)
+        values_plan = self._values_plans.get(key)
+        if values_plan is None:
+            values_plan = ValuesPlanCompiler(annotations).compile(plan, queryset.model)
+            if plan.is_cached:
+                self._values_plans[key] = values_plan
+        return values_plan
+
+    def _iter_dataclass_objs(
+        self, data: Iterable[Model], converter: Callable[[Model], dataclass]
+    ) -> Iterator[dataclass]:
+        data_iterator = iter(data)
+        for first_obj in data_iterator:
+            yield converter(self._is_data_dj_model_type(first_obj))
+            break
+        for obj in data_iterator:
+            yield converter(obj)
+
+    def _get_object_converter(
+        self,
+        dc: dataclass,
+        future_dataclasses: tuple = (),
+        identity_map: dict | None = None,
+        lazy: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> Callable[[Model], dataclass]:
+        plan = self._get_plan(dc, future_dataclasses, fields)
+        if lazy:
+            return partial(self._convert_lazy, plan=plan)
+        query_counter = active_query_counter.get()
+        if query_counter is not None:
+            return partial(
+                self._convert_counting_queries,
+                plan=plan,
+                path=plan.dc.__name__,
+                counter=query_counter,
+                identity_map=identity_map,
+            )
+        if self.profiler is not None:
+            return partial(
+                self._convert_profiling,
+                plan=plan,
+                path=plan.dc.__name__,
+                profiler=self.profiler,
+                identity_map=identity_map,
+            )
+        if self._generator is not None and plan.is_cached:
+            if identity_map is None:
+                return self._generator.get_converter(plan)
+            return partial(self._generator.get_converter(plan, shared=True), identity_map=identity_map)
+        return partial(self._convert, plan=plan, identity_map=identity_map)
+
+    def _get_plan(
+        self, dc: dataclass, future_dataclasses: tuple = (), fields: Iterable[str] | None = None
+    ) -> DataclassPlan:
+        """Return the conversion plan of ``dc``, projected to ``fields`` when they are passed."""
+        return self._plans.get(dc, future_dataclasses, fields)
+
+    def _convert(self, data: Model, plan: DataclassPlan, identity_map: dict | None = None) -> dataclass:
+        obj_for_dataclass = {}
+        for position, field in enumerate(plan.fields):
+            obj_for_dataclass[field.name] = convert_field(
+                data, field, position, get_attribute, self._convert_relation, identity_map
+            )
+        return plan.dc(**obj_for_dataclass)
+
+    def _convert_relation(self, field_data, field: FieldPlan, identity_map: dict | None = None):
+        if field.kind is FieldKind.OBJECT:
+            return self._get_shared_dataclass_object(field_data, field.target, identity_map, self._convert)
+        return self._get_list_of_dataclass_objects(field_data, field.target, identity_map)
+
+    def _convert_lazy(self, data: Model, plan: DataclassPlan) -> dataclass:
+        obj_for_dataclass = {}
+        for position, field in enumerate(plan.fields):
+            obj_for_dataclass[field.name] = convert_field(data, field, position, get_attribute, self._get_lazy_relation)
+        return plan.dc(**obj_for_dataclass)
+
+    def _get_lazy_relation(self, field_data, field: FieldPlan) -> LazyDTO | LazyList:
+        if field.kind is FieldKind.OBJECT:
+            return LazyDTO(partial(self._convert_lazy, field_data, field.target), field.target.dc)
+        orm_objects = self._get_related_objects(field_data, field.target)
+        return LazyList(partial(self._get_lazy_list, orm_objects, field.target))
+
+    def _get_lazy_list(self, orm_objects: Iterable[Model], plan: DataclassPlan) -> list[dataclass]:
+        return [self._convert_lazy(orm_obj, plan) for orm_obj in orm_objects]
+
+    @staticmethod
+    def _get_shared_dataclass_object(
+        data: Model, plan: DataclassPlan, identity_map: dict | None, convert: Callable, *args
+    ) -> dataclass:
+        """Convert ``data`` with ``convert(data, plan, *args, identity_map)`` once per ``identity_map``."""
+        pk = data.pk
+        if identity_map is None or pk is None:
+            return convert(data, plan, *args, identity_map)
+        key = (plan, type(data), pk)
+        dataclass_obj = identity_map.get(key)
+        if dataclass_obj is None:
+            dataclass_obj = identity_map[key] = convert(data, plan, *args, identity_map)
+        return dataclass_obj
+
+    def _convert_counting_queries(
+        self, data: Model, plan: DataclassPlan, path: str, counter: QueryCounter, identity_map: dict | None = None
+    ) -> dataclass:
+        obj_for_dataclass = {}
+        parent_path = counter.path
+        try:
+            for position, field in enumerate(plan.fields):
+                field_path = f"{path}.{field.name}"
+                counter.path = field_path
+                obj_for_dataclass[field.name] = convert_field(
+                    data, field, position, get_attribute, self._count_relation_queries,
+                    field_path, counter, identity_map,
                 )
-            return field.default_factory()
-        return field.default
-
-    def _get_origin_field_type(self, field_type) -> tuple:
-        is_iterable = False
-        origin_type = get_origin(field_type)
-        if origin_type is Union or origin_type is UnionType:
-            field_type = field_type.__args__[0]
-        if hasattr(field_type, "__origin__"):
-            field_type = field_type.__args__[0]
-            is_iterable = True
-        if isinstance(field_type, ForwardRef):
-            field_type = field_type.__forward_arg__
-            field_type = self._get_future_object_type(field_type)
-        if isinstance(field_type, str):
-            field_type = self._get_future_object_type(field_type)
-        return field_type, is_iterable
-
-    def _get_dataclass_object(self, field_data: Model, field_type: type) -> dataclass:
-        return self._to_dataclass_obj(field_data, field_type)
+        finally:
+            counter.path = parent_path
+        return plan.dc(**obj_for_dataclass)
+
+    def _count_relation_queries(
+        self, field_data, field: FieldPlan, path: str, counter: QueryCounter, identity_map: dict | None
+    ):
+        convert = self._convert_counting_queries
+        if field.kind is FieldKind.OBJECT:
+            return self._get_shared_dataclass_object(field_data, field.target, identity_map, convert, path, counter)
+        return [
+            self._get_shared_dataclass_object(orm_obj, field.target, identity_map, convert, f"{path}[]", counter)
+            for orm_obj in self._get_related_objects(field_data, field.target)
+        ]
+
+    def _convert_profiling(
+        self,
+        data: Model,
+        plan: DataclassPlan,
+        path: str,
+        profiler: ConversionProfiler,
+        identity_map: dict | None = None,
+    ) -> dataclass:
+        timer = profiler.timer
+        start = timer()
+        obj_for_dataclass = {}
+        for position, field in enumerate(plan.fields):
+            field_path = f"{path}.{field.name}"
+            field_start = timer()
+            obj_for_dataclass[field.name] = convert_field(
+                data, field, position, get_attribute, self._profile_relation, field_path, profiler, identity_map
+            )
+            if field.kind is not FieldKind.EXCLUDED:
+                profiler.record(FIELD, field_path, timer() - field_start)
+        construct_start = timer()
+        dataclass_obj = plan.dc(**obj_for_dataclass)
+        end = timer()
+        profiler.record(CONSTRUCT, plan.dc.__name__, end - construct_start)
+        profiler.record(DATACLASS, plan.dc.__name__, end - start)
+        return dataclass_obj
+
+    def _profile_relation(
+        self, field_data, field: FieldPlan, path: str, profiler: ConversionProfiler, identity_map: dict | None
+    ):
+        convert = self._convert_profiling
+        if field.kind is FieldKind.OBJECT:
+            return self._get_shared_dataclass_object(field_data, field.target, identity_map, convert, path, profiler)
+        related_start = profiler.timer()
+        orm_objects = list(self._get_related_objects(field_data, field.target))
+        profiler.record(RELATED, path, profiler.timer() - related_start)
+        return [
+            self._get_shared_dataclass_object(orm_obj, field.target, identity_map, convert, f"{path}[]", profiler)
+            for orm_obj in orm_objects
+        ]
+
+    def _convert_tree_node(
+        self, data: Model, plan: DataclassPlan, tree_field: FieldPlan, children: list[dataclass]
+    ) -> dataclass:
+        obj_for_dataclass = {}
+        for position, field in enumerate(plan.fields):
+            if field is tree_field:
+                obj_for_dataclass[field.name] = children
+            else:
+                obj_for_dataclass[field.name] = convert_field(
+                    data, field, position, get_attribute, self._convert_relation
+                )
+        return plan.dc(**obj_for_dataclass)
 
     def _get_list_of_dataclass_objects(
-        self, field_data: Manager, field_type: T
+        self, field_data: Manager, plan: DataclassPlan, identity_map: dict | None = None
     ) -> list[dataclass]:
-        values_lst = []
+        return [
+            self._get_shared_dataclass_object(orm_obj, plan, identity_map, self._convert)
+            for orm_obj in self._get_related_objects(field_data, plan)
+        ]
+
+    @staticmethod
+    def _get_related_objects(field_data: Manager, plan: DataclassPlan) -> Iterable[Model]:
         try:
-            for orm_obj in field_data.all():
-                values_lst.append(self._to_dataclass_obj(orm_obj, field_type))
+            return field_data.all()
         except AttributeError:
-            raise ConversionError(f"The {field_data} is not iterable, but specified type is List[{field_type}]")
-        return values_lst
-
-    def _get_future_object_type(self, obj_type: str) -> dataclass:
-        if self._future_dataclasses:
-            for dc in self._future_dataclasses:
-                if dc.__name__ == obj_type:
-                    return dc
-            raise ConversionError(
-                f"The 'args' argument must contain future reference '{obj_type}'."
-            )
+            raise ConversionError(f"The {field_data} is not iterable, but specified type is List[{plan.dc}]")
 
     @staticmethod
     def _check_dataclass_arg(dc: dataclass) -> dataclass:
@@ -112,16 +659,33 @@ class FromOrmToDataclass(ToDTOConverter):
             return dc
         raise ConversionError(f"The 'dc' arg should be dataclass type, not {type(dc)} type")
 
-    def _check_future_dataclasses_arg(self, future_dataclasses: tuple[dataclass]) -> None:
+    @staticmethod
+    def _check_future_dataclasses_arg(future_dataclasses: tuple[dataclass]) -> tuple[dataclass]:
         if future_dataclasses is None:
-            return
+            return ()
         for dc in future_dataclasses:
             if not is_dataclass(dc):
                 raise ConversionError(
                     f"The 'args' argument should contain 'dataclass' classes. "
                     f"Received {dc} with type {type(dc)}."
                 )
-            self._future_dataclasses.append(dc)
+        return future_dataclasses
+
+    @staticmethod
+    def _is_data_iterable_type(data: Iterable[Model]) -> Iterable[Model]:
+        if isinstance(data, Iterable) and not isinstance(data, (Model, str, bytes, Mapping)):
+            return data
+        raise ConversionError(
+            f"Data must be an iterable of django.db.models.Model objects. Instead, received '{type(data)}'"
+        )
+
+    @staticmethod
+    def _is_data_dj_queryset_type(data: QuerySet) -> QuerySet:
+        if isinstance(data, QuerySet):
+            return data
+        raise ConversionError(
+            f"Data must be a django.db.models.QuerySet type. Instead, received '{type(data)}'"
+        )
 
     @staticmethod
     def _is_data_dj_model_type(data: Model) -> Model:
@@ -0,0 +1,118 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+import django
+from django.apps import apps
+from django.db.models import Model, QuerySet
+from django.db.models.sql import Query
+
+_worker_converters = {}
+
+
+@dataclass(slots=True, frozen=True)
+class ChunkTask:
+    """A primary key range of a QuerySet to convert in a worker process.
+
+    Tasks are pickled to the workers, so ``dc`` and the future dataclasses must be
+    importable by their module path. The QuerySet is shipped as its model, SQL
+    query and prefetch lookups, since pickling a QuerySet fetches all its rows.
+    """
+
+    model: type[Model]
+    query: Query
+    prefetch_lookups: tuple
+    db: str | None
+    dc: type
+    future_dataclasses: tuple
+    codegen: bool
+    coerce: bool
+    first_pk: Any = None
+    last_pk: Any = None
+
+    @classmethod
+    def from_queryset(
+        cls, queryset: QuerySet, dc: type, future_dataclasses: tuple, codegen: bool, coerce: bool
+    ) -> "ChunkTask":
+        return cls(
+            queryset.model,
+            queryset.query,
+            tuple(queryset._prefetch_related_lookups),
+            queryset._db,
+            dc,
+            future_dataclasses,
+            codegen,
+            coerce,
+        )
+
+    def get_queryset(self) -> QuerySet:
+        queryset = self.model._default_manager.using(self.db)
+        queryset.query = self.query.chain()
+        return queryset.prefetch_related(*self.prefetch_lookups)
+
+
+def get_pk_ranges(queryset: QuerySet, chunk_size: int) -> list[tuple[Any, Any]]:
+    """Split the QuerySet into inclusive primary key ranges of ``chunk_size`` rows."""
+    ranges = []
+    first_pk = last_pk = None
+    count = 0
+    for pk in queryset.order_by("pk").values_list("pk", flat=True).iterator(chunk_size=chunk_size):
+        if count == 0:
+            first_pk = pk
+        last_pk = pk
+        count += 1
+        if count == chunk_size:
+            ranges.append((first_pk, last_pk))
+            count = 0
+    if count:
+        ranges.append((first_pk, last_pk))
+    return ranges
+
+
+def init_worker() -> None:
+    """Set Django up in worker processes started with the ``spawn`` method."""
+    if not apps.ready:
+        django.setup()
+
+
+def convert_chunk(task: ChunkTask) -> list:
+    from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+
+    options = (task.codegen, task.coerce)
+    converter = _worker_converters.get(options)
+    if converter is None:
+        converter = _worker_converters[options] = FromOrmToDataclass(codegen=task.codegen, coerce=task.coerce)
+    queryset = task.get_queryset().filter(pk__gte=task.first_pk, pk__lte=task.last_pk).order_by("pk")
+    return converter.to_dto_many(queryset, task.dc, *task.future_dataclasses)
+
+
+def iter_converted_chunks(
+    executor: Executor, tasks: Iterable[ChunkTask], ordered: bool, max_pending: int
+) -> Iterator[list]:
+    """Yield the converted chunks keeping at most ``max_pending`` tasks submitted at once.
+
+    Chunks are yielded in the order of ``tasks`` when ``ordered`` is set, as soon as
+    they are converted otherwise.
+    """
+    tasks = iter(tasks)
+    pending: deque[Future] = deque()
+    try:
+        while True:
+            for task in tasks:
+                pending.append(executor.submit(convert_chunk, task))
+                if len(pending) >= max_pending:
+                    break
+            if not pending:
+                return
+            if ordered:
+                yield pending.popleft().result()
+                continue
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,78 @@
+import warnings
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from django.db import connections
+
+from auto_dataclass.exceptions import TooManyQueriesError
+
+active_query_counter: ContextVar["QueryCounter | None"] = ContextVar("active_query_counter", default=None)
+
+
+class LazyLoadWarning(UserWarning):
+    pass
+
+
+class QueryCounter:
+    """Counts the queries issued while converting, by the dataclass field path that caused them.
+
+    Paths look like ``ProductDataclass.photos[].tags``, where ``[]`` marks the items of a
+    ``List[...]`` field. Queries issued outside of a field access (e.g. fetching the
+    QuerySet itself) are only counted in ``total``. When the lazy loads exceed
+    ``threshold``, a ``LazyLoadWarning`` is emitted once, or ``TooManyQueriesError`` is
+    raised if ``raise_error`` is set.
+    """
+
+    def __init__(self, threshold: int | None = None, raise_error: bool = False):
+        self.threshold = threshold
+        self.raise_error = raise_error
+        self.queries = Counter()
+        self.total = 0
+        self.path = None
+        self._warned = False
+
+    @property
+    def lazy_loads(self) -> int:
+        return sum(self.queries.values())
+
+    def __call__(self, execute, sql, params, many, context):
+        self.total += 1
+        if self.path is not None:
+            self.queries[self.path] += 1
+            self._check_threshold()
+        return execute(sql, params, many, context)
+
+    def _check_threshold(self) -> None:
+        if self.threshold is None or self.lazy_loads <= self.threshold:
+            return
+        message = (
+            f"Conversion issued {self.lazy_loads} lazy load queries, the threshold is {self.threshold}. "
+            f"Queries by field path: {dict(self.queries)}"
+        )
+        if self.raise_error:
+            raise TooManyQueriesError(message, dict(self.queries))
+        if not self._warned:
+            self._warned = True
+            warnings.warn(message, LazyLoadWarning, stacklevel=2)
+
+
+@contextmanager
+def count_queries(
+    threshold: int | None = None, raise_error: bool = False, using: str | None = None
+) -> Iterator[QueryCounter]:
+    """Count the queries issued by conversions inside the block by dataclass field path.
+
+    The queries of the ``using`` database alias are counted, of all databases when it is
+    ``None``. Conversions started inside the block track the field paths they load.
+    """
+    counter = QueryCounter(threshold, raise_error)
+    token = active_query_counter.set(counter)
+    try:
+        with ExitStack() as stack:
+            for connection in ([connections[using]] if using else connections.all()):
+                stack.enter_context(connection.execute_wrapper(counter))
+            yield counter
+    finally:
+        active_query_counter.reset(token)
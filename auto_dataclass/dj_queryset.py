@@ -0,0 +1,136 @@
+from dataclasses import dataclass, field
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, Prefetch, QuerySet
+from django.db.models.constants import LOOKUP_SEP
+
+from auto_dataclass.plan import DataclassPlan, FieldKind
+
+
+@dataclass(slots=True)
+class QuerySetLookups:
+    select_related: list[str] = field(default_factory=list)
+    prefetch_related: list[str | Prefetch] = field(default_factory=list)
+    only: list[str] = field(default_factory=list)
+
+
+class QuerySetOptimizer:
+    """Applies the relation loading needed by a dataclass plan to a QuerySet.
+
+    Nested dataclass fields backed by forward or one-to-one relations are joined
+    with ``select_related``, ``List[...]`` fields are loaded with ``prefetch_related``
+    using their own optimized QuerySets, and ``only`` restricts every model to the
+    columns the dataclasses read. Relations deeper than ``max_depth`` are left to
+    lazy loading, which bounds self-referential dataclasses.
+    """
+
+    def __init__(self, max_depth: int = 3):
+        self._max_depth = max_depth
+
+    def optimize(self, queryset: QuerySet, plan: DataclassPlan) -> QuerySet:
+        return self.apply_lookups(queryset.prefetch_related(None), self.get_lookups(queryset, plan))
+
+    def get_lookups(self, queryset: QuerySet, plan: DataclassPlan) -> QuerySetLookups:
+        """Return the lookups of ``plan`` merged with the prefetches of ``queryset``.
+
+        A plain prefetch of a relation the plan loads is replaced by the optimized one,
+        relations prefetched with a ``Prefetch`` object or through a longer lookup keep
+        the prefetch of the QuerySet.
+        """
+        lookups = QuerySetLookups()
+        self._collect_lookups(queryset.model, plan, "", 0, lookups, tuple(queryset.query.annotations))
+        optimized_paths = {lookup.prefetch_to for lookup in lookups.prefetch_related}
+        queryset_lookups = [
+            lookup for lookup in queryset._prefetch_related_lookups
+            if not (isinstance(lookup, str) and lookup in optimized_paths)
+        ]
+        prefetched_paths = self._get_prefetched_paths(queryset_lookups)
+        lookups.prefetch_related = [
+            *queryset_lookups,
+            *(lookup for lookup in lookups.prefetch_related if lookup.prefetch_to not in prefetched_paths),
+        ]
+        return lookups
+
+    def get_prefetch_lookups(self, model: type[Model], plan: DataclassPlan) -> list[Prefetch]:
+        """Return the lookups loading every relation of ``plan`` for already fetched model objects."""
+        lookups = QuerySetLookups()
+        self._collect_lookups(model, plan, "", 0, lookups, select_related=False)
+        return lookups.prefetch_related
+
+    def _collect_lookups(
+        self,
+        model: type[Model],
+        plan: DataclassPlan,
+        prefix: str,
+        depth: int,
+        lookups: QuerySetLookups,
+        annotations: tuple[str, ...] = (),
+        select_related: bool = True,
+    ) -> None:
+        for field_plan in plan.fields:
+            if field_plan.kind in (FieldKind.UNRESOLVED, FieldKind.EXCLUDED) or field_plan.name in annotations:
+                continue
+            model_field = self._get_model_field(model, field_plan.name)
+            if model_field is None or not (model_field.is_relation or model_field.concrete):
+                self._add_all_columns(model, prefix, lookups)
+            elif field_plan.kind is FieldKind.OBJECT and (model_field.many_to_one or model_field.one_to_one):
+                if model_field.concrete:
+                    lookups.only.append(prefix + field_plan.name)
+                if depth < self._max_depth and not select_related:
+                    related_queryset = self._get_related_queryset(model_field, field_plan.target, depth)
+                    lookups.prefetch_related.append(Prefetch(prefix + field_plan.name, related_queryset))
+                elif depth < self._max_depth:
+                    lookups.select_related.append(prefix + field_plan.name)
+                    self._collect_lookups(
+                        model_field.related_model, field_plan.target,
+                        f"{prefix}{field_plan.name}__", depth + 1, lookups
+                    )
+            elif field_plan.kind is FieldKind.LIST and (model_field.one_to_many or model_field.many_to_many):
+                if depth < self._max_depth:
+                    related_queryset = self._get_related_queryset(model_field, field_plan.target, depth)
+                    lookups.prefetch_related.append(Prefetch(prefix + field_plan.name, related_queryset))
+            elif model_field.concrete:
+                lookups.only.append(prefix + field_plan.name)
+
+    def _get_related_queryset(self, model_field, plan: DataclassPlan, depth: int) -> QuerySet:
+        related_model = model_field.related_model
+        lookups = QuerySetLookups()
+        if model_field.one_to_many or model_field.one_to_one and not model_field.concrete:
+            lookups.only.append(model_field.field.name)
+        self._collect_lookups(related_model, plan, "", depth + 1, lookups)
+        return self.apply_lookups(related_model._default_manager.all(), lookups)
+
+    @staticmethod
+    def apply_lookups(queryset: QuerySet, lookups: QuerySetLookups) -> QuerySet:
+        if lookups.select_related:
+            queryset = queryset.select_related(*lookups.select_related)
+        if lookups.prefetch_related:
+            queryset = queryset.prefetch_related(*lookups.prefetch_related)
+        if lookups.only:
+            queryset = queryset.only(*lookups.only)
+        return queryset
+
+    @staticmethod
+    def _get_prefetched_paths(prefetch_lookups: list[str | Prefetch]) -> set[str]:
+        """Return the paths of ``prefetch_lookups``, including the relations they traverse."""
+        paths = set()
+        for lookup in prefetch_lookups:
+            if isinstance(lookup, Prefetch):
+                lookup_paths = (lookup.prefetch_through, lookup.prefetch_to)
+            else:
+                lookup_paths = (lookup,)
+            for path in lookup_paths:
+                parts = path.split(LOOKUP_SEP)
+                paths.update(LOOKUP_SEP.join(parts[:index]) for index in range(1, len(parts) + 1))
+        return paths
+
+    @staticmethod
+    def _add_all_columns(model: type[Model], prefix: str, lookups: QuerySetLookups) -> None:
+        lookups.only.extend(prefix + model_field.name for model_field in model._meta.concrete_fields)
+
+    @staticmethod
+    def _get_model_field(model: type[Model], name: str):
+        try:
+            return model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
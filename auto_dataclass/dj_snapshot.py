@@ -0,0 +1,143 @@
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+from django.db.models.signals import post_delete
+
+from auto_dataclass.exceptions import ConversionError
+from auto_dataclass.plan import MISSING
+
+SNAPSHOT_CHUNK_SIZE = 2000
+
+
+@dataclass(slots=True)
+class SnapshotDelta:
+    """The DTOs added or changed by a refresh, keyed by pk, and the pks of the removed rows."""
+
+    changed: dict = field(default_factory=dict)
+    deleted: list = field(default_factory=list)
+
+
+class DTOSnapshot:
+    """A DTO snapshot of a QuerySet, keyed by pk and refreshed incrementally.
+
+    Every refresh converts only the rows whose ``watermark_field`` (a modification
+    time like ``updated_at``, or ``pk`` for append-only tables) is at least the highest
+    value seen so far, and merges the DTOs that actually changed into ``dtos``.
+
+    With ``track_deletions`` the rows that left the QuerySet are reported as deleted at
+    a cost proportional to the changes: deleted rows are collected from ``post_delete``
+    signals of this process, and rows changed out of the QuerySet filter are found with
+    one ``values_list`` query of the pks of the changed rows. Deletions without signals,
+    like raw SQL or other processes, are only found by a full ``values_list`` query of
+    all the pks, run every ``full_scan_every`` refreshes when it is set. Rows with a ``NULL``
+    watermark are only converted by the first refresh, and rows committed with a
+    watermark older than the current one are missed, so the field should be set by
+    the database in the committing transaction, like ``auto_now``. Changes of related
+    rows are seen only when they update the watermark of the QuerySet rows.
+    """
+
+    def __init__(
+        self,
+        converter,
+        queryset: QuerySet,
+        dc: dataclass,
+        *args,
+        watermark_field: str = "updated_at",
+        fields: Iterable[str] | None = None,
+        chunk_size: int = SNAPSHOT_CHUNK_SIZE,
+        track_deletions: bool = True,
+        full_scan_every: int | None = None,
+    ):
+        if not isinstance(queryset, QuerySet):
+            raise ConversionError(
+                f"Data must be a django.db.models.QuerySet type. Instead, received '{type(queryset)}'"
+            )
+        self._converter = converter
+        self._queryset = queryset
+        self._dc = dc
+        self._args = args
+        self._fields = fields
+        self._chunk_size = chunk_size
+        self._track_deletions = track_deletions
+        self._full_scan_every = full_scan_every
+        self._watermark_field, self._watermark_attname = self._get_watermark_field(queryset, watermark_field)
+        self._deleted_pks = set()
+        self._refreshes = 0
+        self._lock = threading.Lock()
+        self.watermark = None
+        self.dtos = {}
+        if track_deletions:
+            post_delete.connect(self._on_delete, sender=queryset.model)
+
+    def disconnect(self) -> None:
+        """Stop collecting the deleted rows from ``post_delete`` signals."""
+        post_delete.disconnect(self._on_delete, sender=self._queryset.model)
+
+    def refresh(self) -> SnapshotDelta:
+        delta = SnapshotDelta()
+        queryset = self._queryset.all()
+        left_pks = set()
+        if self.watermark is not None:
+            watermark_filter = {f"{self._watermark_field}__gte": self.watermark}
+            if self._track_deletions and self._watermark_field != "pk":
+                left_pks = self._get_changed_pks(watermark_filter)
+            queryset = queryset.filter(**watermark_filter)
+        watermark = self.watermark
+        rows = queryset.iterator(chunk_size=self._chunk_size)
+        while chunk := list(islice(rows, self._chunk_size)):
+            dtos = self._converter.to_dto_many(chunk, self._dc, *self._args, fields=self._fields)
+            for obj, dto in zip(chunk, dtos):
+                left_pks.discard(obj.pk)
+                if self.dtos.get(obj.pk, MISSING) != dto:
+                    delta.changed[obj.pk] = dto
+                watermark = self._get_max_watermark(watermark, getattr(obj, self._watermark_attname))
+        self.dtos.update(delta.changed)
+        if self._track_deletions:
+            delta.deleted = self._get_deleted_pks(left_pks)
+            for pk in delta.deleted:
+                del self.dtos[pk]
+        self.watermark = watermark
+        return delta
+
+    def _get_changed_pks(self, watermark_filter: dict) -> set:
+        """Return the pks of all the model rows changed since the watermark, in the QuerySet or not."""
+        pk_queryset = self._queryset.model._base_manager.filter(**watermark_filter).values_list("pk", flat=True)
+        return set(pk_queryset.iterator(chunk_size=self._chunk_size))
+
+    def _get_deleted_pks(self, left_pks: set) -> list:
+        with self._lock:
+            deleted_pks, self._deleted_pks = self._deleted_pks, set()
+        deleted_pks |= left_pks
+        self._refreshes += 1
+        if self._full_scan_every and self._refreshes % self._full_scan_every == 0 and self.dtos:
+            pk_queryset = self._queryset.prefetch_related(None).order_by().values_list("pk", flat=True)
+            pks = set(pk_queryset.iterator(chunk_size=self._chunk_size))
+            deleted_pks.update(pk for pk in self.dtos if pk not in pks)
+        return [pk for pk in deleted_pks if pk in self.dtos]
+
+    def _on_delete(self, sender, instance: Model, **kwargs) -> None:
+        with self._lock:
+            self._deleted_pks.add(instance.pk)
+
+    @staticmethod
+    def _get_max_watermark(watermark: Any, value: Any) -> Any:
+        if value is None:
+            return watermark
+        return value if watermark is None or value > watermark else watermark
+
+    @staticmethod
+    def _get_watermark_field(queryset: QuerySet, name: str) -> tuple[str, str]:
+        if name == "pk":
+            return name, queryset.model._meta.pk.attname
+        try:
+            model_field = queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            raise ConversionError(f"The {queryset.model} has no '{name}' field to use as the watermark")
+        if not model_field.concrete:
+            raise ConversionError(f"The '{name}' field of {queryset.model} is not a column to use as the watermark")
+        return name, model_field.attname
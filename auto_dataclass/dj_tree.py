@@ -0,0 +1,83 @@
+from collections import defaultdict
+from typing import Iterable
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+
+from auto_dataclass.exceptions import ConversionError
+from auto_dataclass.plan import DataclassPlan, FieldKind, FieldPlan
+
+IN_BATCH_SIZE = 1000
+
+
+class TreeLoader:
+    """Loads the descendants of tree roots without recursion.
+
+    The tree field is the ``List[...]`` field of a dataclass that refers to the same
+    dataclass and is backed by a reverse foreign key of the model to itself, like
+    ``Category.sub_categories``. Descendants are taken from ``nodes`` with a single
+    query, or fetched one query per tree level when ``nodes`` is not passed.
+    """
+
+    def __init__(self, plan: DataclassPlan, model: type[Model]):
+        self.field, self._parent_attname = self._get_tree_field(plan, model)
+        self._model = model
+
+    def load(self, roots: list[Model], nodes: QuerySet | None = None) -> tuple[list[list[Model]], dict]:
+        """Return the tree levels starting from the roots and the children of every node by pk."""
+        if nodes is None:
+            return self._load_by_level(roots)
+        children = defaultdict(list)
+        for node in nodes:
+            children[getattr(node, self._parent_attname)].append(node)
+        return self._get_levels(roots, children), children
+
+    def _load_by_level(self, roots: list[Model]) -> tuple[list[list[Model]], dict]:
+        children = defaultdict(list)
+        levels = [roots]
+        visited = {root.pk for root in roots}
+        while levels[-1]:
+            level = []
+            for node in self._fetch_children([node.pk for node in levels[-1]]):
+                if node.pk not in visited:
+                    visited.add(node.pk)
+                    children[getattr(node, self._parent_attname)].append(node)
+                    level.append(node)
+            levels.append(level)
+        return levels[:-1], children
+
+    def _fetch_children(self, parent_pks: list) -> Iterable[Model]:
+        queryset = self._model._default_manager.all()
+        for start in range(0, len(parent_pks), IN_BATCH_SIZE):
+            batch = parent_pks[start:start + IN_BATCH_SIZE]
+            yield from queryset.filter(**{f"{self._parent_attname}__in": batch})
+
+    @staticmethod
+    def _get_levels(roots: list[Model], children: dict) -> list[list[Model]]:
+        levels = [roots]
+        visited = {root.pk for root in roots}
+        while levels[-1]:
+            level = []
+            for node in levels[-1]:
+                for child in children.get(node.pk, ()):
+                    if child.pk not in visited:
+                        visited.add(child.pk)
+                        level.append(child)
+            levels.append(level)
+        return levels[:-1]
+
+    @staticmethod
+    def _get_tree_field(plan: DataclassPlan, model: type[Model]) -> tuple[FieldPlan, str]:
+        for field_plan in plan.fields:
+            if field_plan.kind is not FieldKind.LIST or field_plan.target is not plan:
+                continue
+            try:
+                model_field = model._meta.get_field(field_plan.name)
+            except FieldDoesNotExist:
+                continue
+            if model_field.one_to_many and model_field.related_model is model:
+                return field_plan, model_field.field.attname
+        raise ConversionError(
+            f"The {plan.dc} must have a List['{plan.dc.__name__}'] field "
+            f"for the reverse relation of {model} to itself"
+        )
@@ -0,0 +1,125 @@
+import dataclasses
+from dataclasses import dataclass
+from typing import Callable
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model
+
+from auto_dataclass.exceptions import ConversionError
+from auto_dataclass.plan import DataclassPlan, FieldKind, FieldPlan
+
+
+@dataclass(slots=True, frozen=True)
+class ValuesPlan:
+    columns: tuple[str, ...]
+    converter: Callable[[tuple], object]
+
+
+class ValuesPlanCompiler:
+    """Builds the ``values_list`` columns and the row converter for a dataclass plan.
+
+    Scalar fields are read from model columns or QuerySet annotations, nested
+    dataclass fields follow forward relations with ``__`` lookups. The row
+    converter is generated once and builds the DTOs straight from the row tuples.
+    """
+
+    def __init__(self, annotations: tuple[str, ...] = ()):
+        self._annotations = annotations
+        self._columns = {}
+        self._namespace = {}
+        self._sources = []
+
+    def compile(self, plan: DataclassPlan, model: type[Model]) -> ValuesPlan:
+        func_name = self._add_converter(plan, model, "", ())
+        for source in self._sources:
+            exec(source, self._namespace)
+        return ValuesPlan(tuple(self._columns), self._namespace[func_name])
+
+    def _add_converter(
+        self, plan: DataclassPlan, model: type[Model], prefix: str, path: tuple
+    ) -> str:
+        func_name = f"convert_{plan.dc.__name__}_{len(self._sources)}"
+        self._sources.append("")
+        source_index = len(self._sources) - 1
+        self._namespace[f"{func_name}_dc"] = plan.dc
+        path = (*path, plan)
+        args = []
+        for index, field_plan in enumerate(plan.fields):
+            field_ref = f"{func_name}_field_{index}"
+            self._namespace[field_ref] = field_plan
+            value = self._get_field_value(field_plan, field_ref, model, prefix, path)
+            args.append(f"{field_plan.name}={value}" if field_plan.kw_only else value)
+        self._sources[source_index] = (
+            f"def {func_name}(row):\n"
+            f"    return {func_name}_dc({', '.join(args)})"
+        )
+        return func_name
+
+    def _get_field_value(
+        self, field_plan: FieldPlan, field_ref: str, model: type[Model], prefix: str, path: tuple
+    ) -> str:
+        if field_plan.kind is FieldKind.UNRESOLVED:
+            raise field_plan.unresolved_error()
+        if field_plan.kind is FieldKind.EXCLUDED:
+            return f"{field_ref}.get_excluded_value()"
+        model_field = self._get_model_field(model, field_plan.name)
+        if field_plan.kind is FieldKind.VALUE:
+            if not prefix and field_plan.name in self._annotations:
+                return self._coerce(field_plan, field_ref, self._get_column(field_plan.name))
+            if field_plan.name == "pk" or (
+                model_field is not None and model_field.concrete
+                and (not model_field.is_relation or field_plan.name == model_field.attname)
+            ):
+                return self._coerce(field_plan, field_ref, self._get_column(prefix + field_plan.name))
+            if model_field is None:
+                return self._get_default(field_plan, field_ref, model)
+            raise ConversionError(
+                f"The relation '{field_plan.name}' of {model} can be converted "
+                f"from values() rows only to a dataclass field"
+            )
+        if field_plan.kind is FieldKind.LIST:
+            raise ConversionError(
+                f"The field '{field_plan.name}' with type List[{field_plan.target.dc}] "
+                f"can't be converted from values() rows"
+            )
+        if model_field is None:
+            return self._get_default(field_plan, field_ref, model)
+        if not (model_field.many_to_one or model_field.one_to_one):
+            raise ConversionError(
+                f"The relation '{field_plan.name}' of {model} can't be converted "
+                f"from values() rows to {field_plan.target.dc}"
+            )
+        if field_plan.target in path:
+            if field_plan.default is dataclasses.MISSING and field_plan.default_factory is dataclasses.MISSING:
+                raise ConversionError(
+                    f"The recursive field '{field_plan.name}' of {field_plan.target.dc} "
+                    f"can't be converted from values() rows without a default value"
+                )
+            return self._get_default(field_plan, field_ref, model)
+        related_model = model_field.related_model
+        relation_prefix = f"{prefix}{field_plan.name}__"
+        pk_column = self._get_column(relation_prefix + related_model._meta.pk.name)
+        func_name = self._add_converter(field_plan.target, related_model, relation_prefix, path)
+        return f"(None if {pk_column} is None else {func_name}(row))"
+
+    @staticmethod
+    def _coerce(field_plan: FieldPlan, field_ref: str, value: str) -> str:
+        return value if field_plan.coercer is None else f"{field_ref}.coercer({value})"
+
+    def _get_column(self, column: str) -> str:
+        return f"row[{self._columns.setdefault(column, len(self._columns))}]"
+
+    @staticmethod
+    def _get_default(field_plan: FieldPlan, field_ref: str, model: type[Model]) -> str:
+        if field_plan.default_factory is not dataclasses.MISSING:
+            return f"{field_ref}.default_factory()"
+        if field_plan.default is not dataclasses.MISSING:
+            return f"{field_ref}.default"
+        raise ConversionError(f"Field name '{field_plan.name}' doesn't exist in {model}")
+
+    @staticmethod
+    def _get_model_field(model: type[Model], name: str):
+        try:
+            return model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
@@ -2,3 +2,9 @@ class ConversionError(Exception):
     def __init__(self, msg, *args, **kwargs):
         super().__init__(msg, *args, **kwargs)
         self.msg = msg
+
+
+class TooManyQueriesError(ConversionError):
+    def __init__(self, msg, queries: dict, *args, **kwargs):
+        super().__init__(msg, *args, **kwargs)
+        self.queries = queries
@@ -0,0 +1,104 @@
+import dataclasses
+from collections.abc import Callable, Sequence
+
+from auto_dataclass.plan import MISSING
+
+
+def _materialized(obj):
+    return obj
+
+
+def materialize(obj):
+    """Return ``obj`` with its lazy fields replaced by the converted DTOs and lists, recursively.
+
+    ``dataclasses`` functions like ``asdict``, ``astuple`` and ``replace`` check the real
+    type of their argument, so they need the materialized DTOs instead of the proxies.
+    """
+    if isinstance(obj, (LazyDTO, LazyList)):
+        obj = obj.materialize()
+    if isinstance(obj, list):
+        return [materialize(item) for item in obj]
+    if dataclasses.is_dataclass(type(obj)):
+        changes = {field.name: materialize(getattr(obj, field.name)) for field in dataclasses.fields(obj) if field.init}
+        return dataclasses.replace(obj, **changes)
+    return obj
+
+
+class LazyDTO:
+    """Proxy of a ``dc`` DTO, converted on the first access to its attributes.
+
+    The proxy reports ``isinstance`` of ``dc`` without converting the DTO, compares
+    and hashes like it, and pickles or copies to the converted DTO itself.
+    """
+
+    __slots__ = ("_factory", "_dc", "_dto")
+
+    def __init__(self, factory: Callable, dc: type):
+        self._factory = factory
+        self._dc = dc
+        self._dto = MISSING
+
+    def materialize(self):
+        if self._dto is MISSING:
+            self._dto = self._factory()
+            self._factory = None
+        return self._dto
+
+    @property
+    def __class__(self):
+        return self._dc
+
+    def __getattr__(self, name: str):
+        return getattr(self.materialize(), name)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (LazyDTO, LazyList)):
+            other = other.materialize()
+        return self.materialize() == other
+
+    def __hash__(self) -> int:
+        return hash(self.materialize())
+
+    def __repr__(self) -> str:
+        return repr(self.materialize())
+
+    def __reduce__(self):
+        return _materialized, (self.materialize(),)
+
+
+class LazyList(Sequence):
+    """List of nested DTOs, fetched and converted on the first access to its items."""
+
+    __slots__ = ("_factory", "_items")
+
+    def __init__(self, factory: Callable):
+        self._factory = factory
+        self._items = MISSING
+
+    def materialize(self) -> list:
+        if self._items is MISSING:
+            self._items = self._factory()
+            self._factory = None
+        return self._items
+
+    def __getitem__(self, index):
+        return self.materialize()[index]
+
+    def __len__(self) -> int:
+        return len(self.materialize())
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (LazyDTO, LazyList)):
+            other = other.materialize()
+        return self.materialize() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.materialize())
+
+    def __reduce__(self):
+        return _materialized, (self.materialize(),)
@@ -0,0 +1,305 @@
+import dataclasses
+import sys
+import threading
+from dataclasses import dataclass, is_dataclass
+from enum import Enum
+from types import UnionType
+from typing import Any, Callable, ForwardRef, Iterable, Union, get_origin, get_type_hints
+
+from auto_dataclass.coercion import get_coercer
+from auto_dataclass.exceptions import ConversionError
+
+MISSING = object()
+
+
+class FieldKind(Enum):
+    VALUE = "value"
+    OBJECT = "object"
+    LIST = "list"
+    UNRESOLVED = "unresolved"
+    EXCLUDED = "excluded"
+
+
+@dataclass(slots=True, eq=False)
+class FieldPlan:
+    name: str
+    kind: FieldKind
+    default: Any
+    default_factory: Callable | Any
+    target: "DataclassPlan | None" = None
+    kw_only: bool = False
+    forward_ref: str | None = None
+    annotation: Any = None
+    coercer: Callable | None = None
+
+    def get_default(self, data) -> Any:
+        if self.default is dataclasses.MISSING:
+            if self.default_factory is dataclasses.MISSING:
+                raise ConversionError(
+                    f"Field name '{self.name}' doesn't exist in {data}"
+                )
+            return self.default_factory()
+        return self.default
+
+    def get_excluded_value(self) -> Any:
+        if self.default_factory is not dataclasses.MISSING:
+            return self.default_factory()
+        if self.default is not dataclasses.MISSING:
+            return self.default
+        return None
+
+    def unresolved_error(self) -> ConversionError:
+        return ConversionError(
+            f"The 'args' argument must contain future reference '{self.forward_ref}'."
+        )
+
+
+@dataclass(slots=True, eq=False)
+class DataclassPlan:
+    dc: type
+    fields: tuple[FieldPlan, ...] = ()
+    is_resolved: bool = True
+    is_cached: bool = True
+
+
+def get_attribute(data, name: str, position: int) -> Any:
+    return getattr(data, name, MISSING)
+
+
+def convert_field(data, field: FieldPlan, position: int, get_value: Callable, convert_relation: Callable, *args) -> Any:
+    """Return the value of ``field`` read from ``data`` with ``get_value(data, name, position)``.
+
+    Excluded and missing fields get their default and value fields are coerced, the
+    related objects of nested fields are converted by ``convert_relation(field_data, field, *args)``.
+    """
+    if field.kind is FieldKind.EXCLUDED:
+        return field.get_excluded_value()
+    field_data = get_value(data, field.name, position)
+    if field_data is MISSING:
+        return field.get_default(data)
+    if field.kind is FieldKind.VALUE:
+        return field_data if field.coercer is None else field.coercer(field_data)
+    if field.kind is FieldKind.UNRESOLVED:
+        raise field.unresolved_error()
+    if field_data is None:
+        return None
+    return convert_relation(field_data, field, *args)
+
+
+def unwrap_field_type(field_type) -> tuple:
+    """Return the inner field type and whether it is a collection of that type.
+
+    Forward references are returned as the referenced class name.
+    """
+    is_iterable = False
+    origin_type = get_origin(field_type)
+    if origin_type is Union or origin_type is UnionType:
+        field_type = field_type.__args__[0]
+    if hasattr(field_type, "__origin__"):
+        field_type = field_type.__args__[0]
+        is_iterable = True
+    if isinstance(field_type, ForwardRef):
+        field_type = field_type.__forward_arg__
+    return field_type, is_iterable
+
+
+def is_optional_type(field_type) -> bool:
+    origin_type = get_origin(field_type)
+    return (origin_type is Union or origin_type is UnionType) and type(None) in field_type.__args__
+
+
+class PlanCompiler:
+    """Inspects dataclasses once and builds the field plans used for conversion.
+
+    Forward references are resolved through ``typing.get_type_hints`` against the
+    dataclass module globals, with the ``future_dataclasses`` names taking precedence.
+    Compiled plans are stored in ``cache`` only when the whole dataclass graph was
+    resolved, otherwise every plan of the graph is marked as unresolved. With
+    ``coerce`` the value fields get a coercer chosen by their annotation.
+    """
+
+    def __init__(self, future_dataclasses: tuple, cache: dict, coerce: bool = False):
+        self._future_dataclasses = {}
+        for dc in future_dataclasses:
+            self._future_dataclasses.setdefault(dc.__name__, dc)
+        self._cache = cache
+        self._coerce = coerce
+
+    def compile(self, dc: type) -> DataclassPlan:
+        plan = self._cache.get(dc)
+        if plan is not None:
+            return plan
+        compiled = {}
+        plan = self._compile(dc, compiled)
+        if all(compiled_plan.is_resolved for compiled_plan in compiled.values()):
+            self._cache.update(compiled)
+        else:
+            for compiled_plan in compiled.values():
+                compiled_plan.is_resolved = False
+                compiled_plan.is_cached = False
+        return plan
+
+    def _compile(self, dc: type, compiled: dict) -> DataclassPlan:
+        plan = self._cache.get(dc) or compiled.get(dc)
+        if plan is not None:
+            return plan
+        plan = DataclassPlan(dc)
+        compiled[dc] = plan
+        field_types = self._get_field_types(dc)
+        fields = []
+        for field in dataclasses.fields(dc):
+            if not field.init:
+                continue
+            field_plan = self._compile_field(dc, field, field_types[field.name], compiled)
+            if field_plan.kind is FieldKind.UNRESOLVED:
+                plan.is_resolved = plan.is_cached = False
+            fields.append(field_plan)
+        plan.fields = tuple(fields)
+        return plan
+
+    def _get_field_types(self, dc: type) -> dict:
+        try:
+            return get_type_hints(dc, localns=self._future_dataclasses)
+        except NameError:
+            return {field.name: field.type for field in dataclasses.fields(dc)}
+
+    def _resolve_future(self, dc: type, name: str) -> type | None:
+        future_type = self._future_dataclasses.get(name)
+        if future_type is None:
+            future_type = getattr(sys.modules.get(dc.__module__), name, None)
+        return future_type if is_dataclass(future_type) else None
+
+    def _compile_field(
+        self, dc: type, field: dataclasses.Field, field_type, compiled: dict
+    ) -> FieldPlan:
+        field_plan = FieldPlan(
+            field.name,
+            FieldKind.VALUE,
+            field.default,
+            field.default_factory,
+            kw_only=field.kw_only is True,
+            annotation=field_type,
+        )
+        is_optional = is_optional_type(field_type)
+        field_type, is_iterable = unwrap_field_type(field_type)
+        if isinstance(field_type, str):
+            future_type = self._resolve_future(dc, field_type)
+            if future_type is None:
+                field_plan.kind = FieldKind.UNRESOLVED
+                field_plan.forward_ref = field_type
+                return field_plan
+            field_type = future_type
+        if is_dataclass(field_type):
+            field_plan.kind = FieldKind.LIST if is_iterable else FieldKind.OBJECT
+            field_plan.target = self._compile(field_type, compiled)
+        elif self._coerce and not is_iterable:
+            field_plan.coercer = get_coercer(dc, field.name, field_type, is_optional)
+        return field_plan
+
+
+class PlanCache:
+    """Caches the compiled and projected plans of dataclasses, shareable between converters.
+
+    Forward references are resolved per call signature, so plans are cached by
+    the dataclass and future dataclasses pair instead of growing a shared registry.
+    Projected plans are cached by the full plan and the normalized field paths, up to
+    ``max_projections`` of them. Projections past the limit are compiled on every call
+    and marked as not cached, so the converters don't cache code or serializers by them.
+
+    Cached plans are never mutated, so reads take no lock. Compilation is serialized,
+    so concurrent threads get the same plan objects.
+    """
+
+    def __init__(self, coerce: bool = False, max_projections: int = 1024):
+        self.coerce = coerce
+        self.max_projections = max_projections
+        self.registries = {}
+        self.projections = {}
+        self._lock = threading.Lock()
+
+    def get(self, dc: type, future_dataclasses: tuple = (), fields: Iterable[str] | None = None) -> DataclassPlan:
+        registry = (dc, *future_dataclasses)
+        plans = self.registries.get(registry)
+        if plans is None:
+            plans = self.registries.setdefault(registry, {})
+        plan = plans.get(dc)
+        if plan is None:
+            with self._lock:
+                plan = PlanCompiler(registry, plans, self.coerce).compile(dc)
+        projection = self.get_projection_key(fields)
+        if projection is None:
+            return plan
+        key = (plan, projection)
+        projected_plan = self.projections.get(key)
+        if projected_plan is None:
+            is_cached = plan.is_cached and len(self.projections) < self.max_projections
+            projected_plan = project_plan(plan, projection, is_cached)
+            if is_cached:
+                with self._lock:
+                    projected_plan = self.projections.setdefault(key, projected_plan)
+        return projected_plan
+
+    @staticmethod
+    def get_projection_key(fields: Iterable[str] | None) -> tuple | None:
+        """Return the normalized projection tree of ``fields``, the same for equal projections.
+
+        Names are stripped, empty paths are skipped and the paths are sorted, so
+        ``"id, name"`` and ``["name", "id"]`` give the same key.
+        """
+        if fields is None:
+            return None
+        if isinstance(fields, str):
+            fields = fields.split(",")
+        return freeze_projection(parse_projection(fields))
+
+
+def freeze_projection(projection: dict) -> tuple:
+    """Return the projection tree as sorted ``(name, sub_projection)`` pairs."""
+    frozen = []
+    for name, sub_projection in projection.items():
+        frozen.append((name, None if sub_projection is None else freeze_projection(sub_projection)))
+    return tuple(sorted(frozen))
+
+
+def parse_projection(fields: Iterable[str]) -> dict:
+    """Parse ``photos.image`` like field paths into a tree, ``None`` marking a whole field."""
+    projection = {}
+    for path in fields:
+        if not path.strip():
+            continue
+        node = projection
+        names = [name.strip() for name in path.split(".")]
+        for name in names[:-1]:
+            child = node.setdefault(name, {})
+            if child is None:
+                break
+            node = child
+        else:
+            node[names[-1]] = None
+    return projection
+
+
+def project_plan(plan: DataclassPlan, projection: dict | tuple, is_cached: bool = True) -> DataclassPlan:
+    """Return a plan converting only the ``projection`` fields of ``plan``.
+
+    Excluded fields are kept as ``FieldKind.EXCLUDED``, so they get their default
+    value, or ``None``, without reading the source object.
+    """
+    projection = dict(projection)
+    field_names = {field.name for field in plan.fields}
+    for name in projection:
+        if name not in field_names:
+            raise ConversionError(f"The {plan.dc} has no field '{name}' to project")
+    fields = []
+    for field in plan.fields:
+        if field.name not in projection:
+            fields.append(dataclasses.replace(field, kind=FieldKind.EXCLUDED, target=None))
+            continue
+        sub_projection = projection[field.name]
+        if sub_projection is None:
+            fields.append(field)
+        elif field.target is None:
+            raise ConversionError(f"The field '{field.name}' of {plan.dc} has no nested fields to project")
+        else:
+            fields.append(dataclasses.replace(field, target=project_plan(field.target, sub_projection, is_cached)))
+    return DataclassPlan(plan.dc, tuple(fields), plan.is_resolved, plan.is_cached and is_cached)
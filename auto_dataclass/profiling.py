@@ -0,0 +1,73 @@
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable
+
+DATACLASS = "dataclass"
+FIELD = "field"
+RELATED = "related"
+CONSTRUCT = "construct"
+
+
+@dataclass(slots=True)
+class TimingStat:
+    count: int = 0
+    total: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+
+
+@dataclass(slots=True)
+class ChunkStats:
+    """Reported for every chunk of ``iter_dto_stream``, with the memory traced by ``tracemalloc`` when it is on."""
+
+    index: int
+    rows: int
+    seconds: float
+    memory: int | None = None
+    peak_memory: int | None = None
+
+
+class ConversionProfiler:
+    """Collects conversion counts and cumulative time.
+
+    Times are recorded by kind: ``dataclass`` for a whole DTO conversion with its nested
+    fields, ``field`` for a field path like ``ProductDataclass.photos[].tags`` including
+    attribute access and nested conversion, ``related`` for fetching the objects of a
+    ``List[...]`` field and ``construct`` for the dataclass constructor call. Override
+    ``record`` to forward the timings somewhere else. A profiler can be shared by threads.
+    """
+
+    def __init__(self, timer: Callable[[], float] = time.perf_counter):
+        self.timer = timer
+        self.stats = defaultdict(TimingStat)
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, key: str, seconds: float) -> None:
+        with self._lock:
+            self.stats[(kind, key)].add(seconds)
+
+    def report(self) -> list[dict]:
+        """Return the timings sorted by the cumulative time, as JSON serializable rows."""
+        with self._lock:
+            stats = [(kind, key, stat.count, stat.total) for (kind, key), stat in self.stats.items()]
+        return [
+            {"kind": kind, "key": key, "count": count, "total": total, "mean": total / count}
+            for kind, key, count, total in sorted(stats, key=lambda row: row[3], reverse=True)
+        ]
+
+    def format_report(self, limit: int | None = None) -> str:
+        lines = [f"{'kind':<10} {'key':<50} {'count':>9} {'total ms':>10} {'mean us':>9}"]
+        for row in self.report()[:limit]:
+            lines.append(
+                f"{row['kind']:<10} {row['key']:<50} {row['count']:>9} "
+                f"{row['total'] * 1e3:>10.3f} {row['mean'] * 1e6:>9.2f}"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stats.clear()
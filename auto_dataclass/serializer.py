@@ -0,0 +1,89 @@
+import dataclasses
+import json
+from collections.abc import Callable, Iterable, Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from auto_dataclass.exceptions import ConversionError
+from auto_dataclass.lazy import LazyDTO, LazyList
+from auto_dataclass.plan import DataclassPlan, FieldKind
+
+JSON_CHUNK_SIZE = 64 * 1024
+
+
+class PlannedDTO:
+    """A DTO paired with the plan node it is encoded by."""
+
+    __slots__ = ("dto", "plan")
+
+    def __init__(self, dto, plan: DataclassPlan):
+        self.dto = dto
+        self.plan = plan
+
+
+class JSONSerializer:
+    """Serializes DTOs to JSON following their dataclass plans, without ``dataclasses.asdict``.
+
+    DTOs are handed to the C accelerated ``json`` encoder, which asks for a shallow dict of
+    every DTO when it reaches it, so the tree is never copied as a whole. Nested DTOs are
+    paired with their plan node, so a dataclass projected differently at several paths is
+    encoded with the fields of each path. Values the encoder doesn't support (dates,
+    ``Decimal``, ``UUID``...) are encoded like ``DjangoJSONEncoder`` does unless ``default``
+    is passed.
+    """
+
+    def __init__(self, plan: DataclassPlan, default: Callable | None = None):
+        self._plan = plan
+        self._fields = {}
+        self._default = default or DjangoJSONEncoder().default
+        self._encoder = json.JSONEncoder(default=self._encode_object, separators=(",", ":"), ensure_ascii=False)
+
+    def dumps(self, dto) -> bytes:
+        return self._encoder.encode(PlannedDTO(dto, self._plan)).encode()
+
+    def iter_chunks(self, dtos: Iterable, chunk_size: int = JSON_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield a JSON array of ``dtos`` in chunks of about ``chunk_size`` bytes."""
+        encode = self._encoder.encode
+        plan = self._plan
+        parts = ["["]
+        size = 1
+        separator = ""
+        for dto in dtos:
+            part = separator + encode(PlannedDTO(dto, plan))
+            separator = ","
+            parts.append(part)
+            size += len(part)
+            if size >= chunk_size:
+                yield "".join(parts).encode()
+                parts = []
+                size = 0
+        parts.append("]")
+        yield "".join(parts).encode()
+
+    def _encode_object(self, obj):
+        if obj.__class__ is PlannedDTO:
+            return self._encode_dto(obj.dto, obj.plan)
+        if isinstance(obj, (LazyDTO, LazyList)):
+            return obj.materialize()
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return {dc_field.name: getattr(obj, dc_field.name) for dc_field in dataclasses.fields(obj)}
+        try:
+            return self._default(obj)
+        except TypeError:
+            raise ConversionError(f"The {obj!r} of type {type(obj)} is not JSON serializable")
+
+    def _encode_dto(self, dto, plan: DataclassPlan) -> dict:
+        fields = self._fields.get(plan)
+        if fields is None:
+            fields = self._fields[plan] = tuple(
+                (field.name, field.kind is FieldKind.LIST, field.target)
+                for field in plan.fields
+                if field.kind is not FieldKind.EXCLUDED
+            )
+        obj = {}
+        for name, is_list, target in fields:
+            value = getattr(dto, name)
+            if target is not None and value is not None:
+                value = [PlannedDTO(item, target) for item in value] if is_list else PlannedDTO(value, target)
+            obj[name] = value
+        return obj
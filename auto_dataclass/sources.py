@@ -0,0 +1,145 @@
+import dataclasses
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from auto_dataclass.exceptions import ConversionError
+from auto_dataclass.plan import MISSING, DataclassPlan, FieldKind, FieldPlan, PlanCache, convert_field
+
+
+class ToDTOConverter(ABC):
+    @abstractmethod
+    def to_dto(self, data, dc: dataclass) -> dataclass:
+        pass
+
+    @staticmethod
+    def _get_plan_cache(plans: PlanCache | None, coerce: bool) -> PlanCache:
+        if plans is None:
+            return PlanCache(coerce)
+        if plans.coerce != coerce:
+            raise ConversionError(
+                f"The 'coerce' argument is {coerce}, but the shared plans are compiled with coerce={plans.coerce}"
+            )
+        return plans
+
+
+class SourceAdapter(ABC):
+    """Reads the field values of source objects for ``FromSourceToDataclass``.
+
+    ``get_value`` returns ``MISSING`` for absent fields, so the dataclass default is used.
+    ``position`` is the index of the field in the dataclass fields.
+    """
+
+    source_type = "source"
+
+    @abstractmethod
+    def get_value(self, data, name: str, position: int) -> Any:
+        pass
+
+    def is_source(self, data) -> bool:
+        return True
+
+
+class MappingAdapter(SourceAdapter):
+    """Reads fields by key from mappings, like JSON, Redis or msgpack payloads."""
+
+    source_type = "mapping"
+
+    def get_value(self, data: Mapping, name: str, position: int) -> Any:
+        return data.get(name, MISSING)
+
+    def is_source(self, data) -> bool:
+        return isinstance(data, Mapping)
+
+
+class SequenceAdapter(SourceAdapter):
+    """Reads fields by position from sequences, like DB-API rows, in the dataclass fields order.
+
+    Nested dataclass fields are read from nested sequences, fields past the row end
+    get their default.
+    """
+
+    source_type = "sequence"
+
+    def get_value(self, data: Sequence, name: str, position: int) -> Any:
+        return data[position] if position < len(data) else MISSING
+
+    def is_source(self, data) -> bool:
+        return isinstance(data, Sequence) and not isinstance(data, (str, bytes))
+
+
+class AttributeAdapter(SourceAdapter):
+    """Reads fields by attribute from any object, like attrs, pydantic or plain objects."""
+
+    source_type = "object"
+
+    def get_value(self, data, name: str, position: int) -> Any:
+        return getattr(data, name, MISSING)
+
+
+class FromSourceToDataclass(ToDTOConverter):
+    """Converts mappings, sequences or plain objects to dataclasses, without Django.
+
+    The source is read by ``adapter``. Passing the same ``PlanCache`` as ``plans`` to other converters
+    shares the compiled plans of the dataclasses with them.
+    """
+
+    def __init__(self, adapter: SourceAdapter, coerce: bool = False, plans: PlanCache | None = None):
+        self._adapter = adapter
+        self._plans = self._get_plan_cache(plans, coerce)
+
+    def to_dto(self, data, dc: dataclass, *args, fields: Iterable[str] | None = None) -> dataclass:
+        plan = self._get_plan(dc, args, fields)
+        return self._convert(self._check_source(data), plan)
+
+    def iter_dto(
+        self, data: Iterable, dc: dataclass, *args, fields: Iterable[str] | None = None
+    ) -> Iterator[dataclass]:
+        plan = self._get_plan(dc, args, fields)
+        if not isinstance(data, Iterable) or isinstance(data, (str, bytes, Mapping)):
+            raise ConversionError(
+                f"Data must be an iterable of {self._adapter.source_type} objects. Instead, received '{type(data)}'"
+            )
+        return self._iter_dataclass_objs(data, plan)
+
+    def to_dto_many(self, data: Iterable, dc: dataclass, *args, fields: Iterable[str] | None = None) -> list[dataclass]:
+        return list(self.iter_dto(data, dc, *args, fields=fields))
+
+    def _iter_dataclass_objs(self, data: Iterable, plan: DataclassPlan) -> Iterator[dataclass]:
+        data_iterator = iter(data)
+        for first_obj in data_iterator:
+            yield self._convert(self._check_source(first_obj), plan)
+            break
+        for obj in data_iterator:
+            yield self._convert(obj, plan)
+
+    def _get_plan(self, dc: dataclass, future_dataclasses: tuple, fields: Iterable[str] | None) -> DataclassPlan:
+        if not dataclasses.is_dataclass(dc):
+            raise ConversionError(f"The 'dc' arg should be dataclass type, not {type(dc)} type")
+        for future_dc in future_dataclasses:
+            if not dataclasses.is_dataclass(future_dc):
+                raise ConversionError(
+                    f"The 'args' argument should contain 'dataclass' classes. "
+                    f"Received {future_dc} with type {type(future_dc)}."
+                )
+        return self._plans.get(dc, future_dataclasses, fields)
+
+    def _convert(self, data, plan: DataclassPlan) -> dataclass:
+        get_value = self._adapter.get_value
+        obj_for_dataclass = {}
+        for position, field in enumerate(plan.fields):
+            obj_for_dataclass[field.name] = convert_field(data, field, position, get_value, self._convert_relation)
+        return plan.dc(**obj_for_dataclass)
+
+    def _convert_relation(self, field_data, field: FieldPlan):
+        if field.kind is FieldKind.OBJECT:
+            return self._convert(self._check_source(field_data), field.target)
+        return [self._convert(self._check_source(item), field.target) for item in field_data]
+
+    def _check_source(self, data):
+        if self._adapter.is_source(data):
+            return data
+        raise ConversionError(
+            f"Data must be a {self._adapter.source_type} object. Instead, received '{type(data)}'"
+        )
@@ -0,0 +1,123 @@
+"""Conversion engine benchmarks on an in-memory SQLite Django project.
+
+Run from the repository root:
+
+    python -m benchmarks --rows 1000 100000 1000000 --output results.json
+    python -m benchmarks --rows 1000 100000 1000000 --baseline results.json
+
+Every case reports the best of ``--repeat`` runs as rows/s and per-row latency, and
+the peak memory traced by ``tracemalloc`` during a separate run. Cases marked with
+``*`` include the database query, the others convert already fetched model objects.
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Iterator
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.settings import setup
+
+setup()
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from benchmarks.scenarios import SCENARIOS, Case, reset_tables
+
+CONVERTERS = {
+    "interpreted": lambda: FromOrmToDataclass(),
+    "codegen": lambda: FromOrmToDataclass(codegen=True),
+}
+
+
+def measure(case: Case, converter: FromOrmToDataclass, data, repeat: int, memory: bool) -> tuple:
+    case.run(converter, data)
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        case.run(converter, data)
+        best = min(best, time.perf_counter() - start)
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        result = case.run(converter, data)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del result
+    return best, peak
+
+
+def run(options: argparse.Namespace) -> Iterator[dict]:
+    for rows in options.rows:
+        for scenario_name in options.scenarios:
+            scenario = SCENARIOS[scenario_name]
+            reset_tables()
+            scenario.populate(rows)
+            data = scenario.load()
+            for case in scenario.cases:
+                for converter_name in case.converters:
+                    seconds, peak = measure(
+                        case, CONVERTERS[converter_name](), data, options.repeat, not options.no_memory
+                    )
+                    yield {
+                        "scenario": scenario.name,
+                        "case": case.name + ("*" if case.includes_query else ""),
+                        "converter": converter_name,
+                        "rows": rows,
+                        "seconds": seconds,
+                        "rows_per_second": rows / seconds,
+                        "us_per_row": seconds / rows * 1e6,
+                        "peak_memory_mb": peak / 2 ** 20 if peak is not None else None,
+                    }
+
+
+def get_key(result: dict) -> tuple:
+    return result["scenario"], result["case"], result["converter"], result["rows"]
+
+
+def format_result(result: dict, baseline: dict | None) -> str:
+    line = (
+        f"{result['scenario']:<15} {result['case']:<26} {result['converter']:<12} {result['rows']:>9,} "
+        f"{result['rows_per_second']:>12,.0f} rows/s {result['us_per_row']:>9.2f} us/row"
+    )
+    if result["peak_memory_mb"] is not None:
+        line += f" {result['peak_memory_mb']:>9.1f} MB"
+    if baseline is not None:
+        base_result = baseline.get(get_key(result))
+        if base_result is not None:
+            line += f" {result['rows_per_second'] / base_result['rows_per_second']:>6.2f}x"
+    return line
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 100000])
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--output", help="save the results as JSON")
+    parser.add_argument("--baseline", help="compare rows/s with the results saved by --output")
+    options = parser.parse_args()
+
+    baseline = None
+    if options.baseline:
+        with open(options.baseline) as baseline_file:
+            baseline = {get_key(result): result for result in json.load(baseline_file)}
+
+    results = []
+    for result in run(options):
+        results.append(result)
+        print(format_result(result, baseline), flush=True)
+
+    if options.output:
+        with open(options.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
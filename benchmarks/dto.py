@@ -0,0 +1,85 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional
+
+
+@dataclass(frozen=True)
+class WideRowDataclass:
+    id: int
+    name: str
+    code: str
+    description: str
+    email: str
+    city: str
+    country: str
+    quantity: int
+    reserved: int
+    views: int
+    rating: float
+    weight: float
+    price: Decimal
+    discount: Decimal
+    is_active: bool
+    is_featured: bool
+    created_at: datetime
+    updated_at: datetime
+    published_on: date
+    external_id: int
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    description: str
+    price: int
+    brand: BrandDataclass
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    id: int
+    image: str
+
+
+@dataclass(frozen=True)
+class ProductWithPhotosDataclass:
+    id: int
+    name: str
+    description: str
+    price: int
+    photos: List[PhotoDataclass] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class CategoriesDTO:
+    id: int
+    name: str
+    sub_categories: List['CategoriesDTO'] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class ForwardRefProductDataclass:
+    id: int
+    name: str
+    brand: Optional['ForwardRefBrandDataclass']
+    photos: List['ForwardRefPhotoDataclass'] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class ForwardRefBrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ForwardRefPhotoDataclass:
+    id: int
+    image: str
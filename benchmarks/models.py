@@ -0,0 +1,49 @@
+from django.db import models
+
+
+class WideRow(models.Model):
+    name = models.CharField(max_length=128)
+    code = models.CharField(max_length=32)
+    description = models.TextField()
+    email = models.CharField(max_length=128)
+    city = models.CharField(max_length=64)
+    country = models.CharField(max_length=64)
+    quantity = models.IntegerField()
+    reserved = models.IntegerField()
+    views = models.IntegerField()
+    rating = models.FloatField()
+    weight = models.FloatField()
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    discount = models.DecimalField(max_digits=10, decimal_places=2)
+    is_active = models.BooleanField()
+    is_featured = models.BooleanField()
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    published_on = models.DateField()
+    external_id = models.BigIntegerField()
+
+
+class Brand(models.Model):
+    name = models.CharField(max_length=128)
+
+
+class Product(models.Model):
+    name = models.CharField(max_length=128)
+    description = models.TextField()
+    price = models.IntegerField()
+    brand = models.ForeignKey(Brand, related_name="products", on_delete=models.CASCADE)
+
+
+class Photo(models.Model):
+    product = models.ForeignKey(Product, related_name="photos", on_delete=models.CASCADE)
+    image = models.CharField(max_length=128)
+
+
+class Category(models.Model):
+    name = models.CharField(max_length=128)
+    parent = models.ForeignKey(
+        "Category", related_name="sub_categories", null=True, on_delete=models.CASCADE
+    )
+
+
+MODELS = (WideRow, Brand, Product, Photo, Category)
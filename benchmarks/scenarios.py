@@ -0,0 +1,188 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable
+
+from django.db import connection
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from benchmarks.dto import (
+    CategoriesDTO,
+    ForwardRefProductDataclass,
+    ProductDataclass,
+    ProductWithPhotosDataclass,
+    WideRowDataclass,
+)
+from benchmarks.models import MODELS, Brand, Category, Photo, Product, WideRow
+
+BATCH_SIZE = 5000
+PHOTOS_PER_PRODUCT = 3
+PRODUCTS_PER_BRAND = 100
+CATEGORY_CHILDREN = 4
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    run: Callable[[FromOrmToDataclass, Any], Any]
+    converters: tuple[str, ...] = ("interpreted", "codegen")
+    includes_query: bool = False
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    populate: Callable[[int], None]
+    load: Callable[[], Any]
+    cases: tuple[Case, ...]
+
+
+def reset_tables() -> None:
+    with connection.schema_editor() as editor:
+        existing_tables = connection.introspection.table_names()
+        for model in reversed(MODELS):
+            if model._meta.db_table in existing_tables:
+                editor.delete_model(model)
+        for model in MODELS:
+            editor.create_model(model)
+
+
+def populate_wide_rows(rows: int) -> None:
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    WideRow.objects.bulk_create(
+        (
+            WideRow(
+                name=f"name {i}", code=f"C{i}", description="description", email=f"user{i}@example.com",
+                city="city", country="country", quantity=i, reserved=i % 7, views=i * 3,
+                rating=i / 10, weight=i / 100, price=Decimal("10.50"), discount=Decimal("1.25"),
+                is_active=True, is_featured=i % 2 == 0, created_at=now, updated_at=now,
+                published_on=date(2024, 1, 1), external_id=i * 1000,
+            )
+            for i in range(rows)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+
+
+def populate_products(rows: int) -> None:
+    brands = max(rows // PRODUCTS_PER_BRAND, 1)
+    Brand.objects.bulk_create(
+        (Brand(id=i + 1, name=f"brand {i}") for i in range(brands)), batch_size=BATCH_SIZE
+    )
+    Product.objects.bulk_create(
+        (
+            Product(id=i + 1, name=f"product {i}", description="description", price=i, brand_id=i % brands + 1)
+            for i in range(rows)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    Photo.objects.bulk_create(
+        (
+            Photo(product_id=i // PHOTOS_PER_PRODUCT + 1, image=f"image {i}")
+            for i in range(rows * PHOTOS_PER_PRODUCT)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+
+
+def populate_categories(rows: int) -> None:
+    Category.objects.bulk_create(
+        (
+            Category(id=i + 1, name=f"category {i}", parent_id=(i - 1) // CATEGORY_CHILDREN + 1 if i else None)
+            for i in range(rows)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+
+
+def convert_each(dc: type) -> Callable[[FromOrmToDataclass, Any], Any]:
+    def run(converter: FromOrmToDataclass, data: list) -> list:
+        return [converter.to_dto(obj, dc) for obj in data]
+    return run
+
+
+def convert_many(dc: type, **kwargs) -> Callable[[FromOrmToDataclass, Any], Any]:
+    def run(converter: FromOrmToDataclass, data: list) -> list:
+        return converter.to_dto_many(data, dc, **kwargs)
+    return run
+
+
+def convert_columns(dc: type) -> Callable[[FromOrmToDataclass, Any], Any]:
+    def run(converter: FromOrmToDataclass, data: list) -> Any:
+        return converter.to_columns(data, dc)
+    return run
+
+
+def convert_values(queryset_factory: Callable, dc: type) -> Callable[[FromOrmToDataclass, Any], Any]:
+    def run(converter: FromOrmToDataclass, data: list) -> list:
+        return list(converter.iter_dto_values(queryset_factory(), dc))
+    return run
+
+
+def convert_tree(converter: FromOrmToDataclass, roots: list) -> list:
+    return converter.to_dto_tree(roots, CategoriesDTO, nodes=Category.objects.all())
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(
+            "flat_wide",
+            populate_wide_rows,
+            lambda: list(WideRow.objects.all()),
+            (
+                Case("to_dto", convert_each(WideRowDataclass)),
+                Case("to_dto_many", convert_many(WideRowDataclass)),
+                Case("to_columns", convert_columns(WideRowDataclass), converters=("interpreted",)),
+                Case(
+                    "iter_dto_values",
+                    convert_values(WideRow.objects.all, WideRowDataclass),
+                    converters=("interpreted",),
+                    includes_query=True,
+                ),
+            ),
+        ),
+        Scenario(
+            "nested_fk",
+            populate_products,
+            lambda: list(Product.objects.select_related("brand")),
+            (
+                Case("to_dto", convert_each(ProductDataclass)),
+                Case("to_dto_many", convert_many(ProductDataclass)),
+                Case("to_dto_many_identity_map", convert_many(ProductDataclass, identity_map=True)),
+                Case(
+                    "iter_dto_values",
+                    convert_values(Product.objects.all, ProductDataclass),
+                    converters=("interpreted",),
+                    includes_query=True,
+                ),
+            ),
+        ),
+        Scenario(
+            "list_reverse",
+            populate_products,
+            lambda: list(Product.objects.prefetch_related("photos")),
+            (
+                Case("to_dto", convert_each(ProductWithPhotosDataclass)),
+                Case("to_dto_many", convert_many(ProductWithPhotosDataclass)),
+            ),
+        ),
+        Scenario(
+            "recursive_tree",
+            populate_categories,
+            lambda: list(Category.objects.filter(parent__isnull=True)),
+            (
+                Case("to_dto_tree", convert_tree, converters=("interpreted",), includes_query=True),
+            ),
+        ),
+        Scenario(
+            "forward_ref",
+            populate_products,
+            lambda: list(Product.objects.select_related("brand").prefetch_related("photos")),
+            (
+                Case("to_dto", convert_each(ForwardRefProductDataclass)),
+                Case("to_dto_many", convert_many(ForwardRefProductDataclass)),
+            ),
+        ),
+    )
+}
@@ -0,0 +1,14 @@
+"""Configures an in-memory SQLite Django project for the benchmarks."""
+import django
+from django.conf import settings
+
+
+def setup() -> None:
+    if settings.configured:
+        return
+    settings.configure(
+        DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+        INSTALLED_APPS=["benchmarks"],
+        USE_TZ=True,
+    )
+    django.setup()
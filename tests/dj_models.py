@@ -0,0 +1,81 @@
+"""Django models backed by an in-memory SQLite database for the QuerySet tests.
+
+The database uses a shared cache, so the async tests see it from Django's worker thread.
+"""
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": "file:dj_models?mode=memory&cache=shared"}
+        },
+        INSTALLED_APPS=["dj_models"],
+        USE_TZ=True,
+    )
+    django.setup()
+
+from django.db import connection, models
+
+
+class Brand(models.Model):
+    name = models.CharField(max_length=128)
+
+    class Meta:
+        app_label = "dj_models"
+
+
+class Product(models.Model):
+    name = models.CharField(max_length=128)
+    description = models.TextField(max_length=1000)
+    price = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    brand = models.ForeignKey(Brand, related_name="products", null=True, on_delete=models.SET_NULL)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "dj_models"
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=128)
+
+    class Meta:
+        app_label = "dj_models"
+
+
+class Photo(models.Model):
+    product = models.ForeignKey(Product, related_name="photos", on_delete=models.CASCADE)
+    image = models.CharField(max_length=128)
+    tags = models.ManyToManyField(Tag, related_name="photos")
+
+    class Meta:
+        app_label = "dj_models"
+
+
+class Category(models.Model):
+    name = models.CharField(max_length=128)
+    parent = models.ForeignKey(
+        "Category", related_name="sub_categories", null=True, blank=True, on_delete=models.CASCADE
+    )
+
+    class Meta:
+        app_label = "dj_models"
+
+
+MODELS = (Brand, Product, Tag, Photo, Category)
+
+
+def create_tables() -> None:
+    existing_tables = connection.introspection.table_names()
+    with connection.schema_editor() as editor:
+        for model in MODELS:
+            if model._meta.db_table not in existing_tables:
+                editor.create_model(model)
+
+
+def delete_data() -> None:
+    for model in reversed(MODELS):
+        model.objects.all().delete()
+
+
+create_tables()
@@ -0,0 +1,118 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from unittest import IsolatedAsyncioTestCase
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+from dj_models import Brand, Category, Photo, Product, Tag, delete_data
+
+
+@dataclass(frozen=True)
+class TagDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    id: int
+    image: str
+    tags: List[TagDataclass] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    brand: Optional[BrandDataclass]
+    photos: List[PhotoDataclass] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class CategoriesDTO:
+    id: int
+    name: str
+    sub_categories: List['CategoriesDTO'] = field(default_factory=list)
+
+
+class TestAsyncFuncs(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        brand = Brand.objects.create(name="brand")
+        tag = Tag.objects.create(name="tag")
+        for index in range(5):
+            product = Product.objects.create(name=f"product {index}", description="", brand=brand)
+            for _ in range(2):
+                Photo.objects.create(product=product, image="image").tags.add(tag)
+
+        root = Category.objects.create(name="root")
+        child = Category.objects.create(name="child", parent=root)
+        Category.objects.create(name="grandchild", parent=child)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        self.converter = FromOrmToDataclass()
+        self.expected = self.converter.to_dto_many(Product.objects.order_by("id"), ProductDataclass)
+
+    async def test_aiter_dto(self) -> None:
+        result = [dto async for dto in self.converter.aiter_dto(Product.objects.order_by("id"), ProductDataclass)]
+
+        self.assertEqual(result, self.expected)
+
+    async def test_aiter_dto_with_chunk_size(self) -> None:
+        queryset = Product.objects.order_by("id")
+
+        result = [dto async for dto in self.converter.aiter_dto(queryset, ProductDataclass, chunk_size=2)]
+
+        self.assertEqual(result, self.expected)
+
+    async def test_aiter_dto_prefetched_with_chunk_size(self) -> None:
+        queryset = Product.objects.prefetch_related("photos").order_by("id")
+
+        result = [dto async for dto in self.converter.aiter_dto(queryset, ProductDataclass, chunk_size=2)]
+
+        self.assertEqual(result, self.expected)
+
+    async def test_aiter_dto_with_codegen_and_identity_map(self) -> None:
+        converter = FromOrmToDataclass(codegen=True)
+        queryset = Product.objects.order_by("id")
+
+        result = [dto async for dto in converter.aiter_dto(queryset, ProductDataclass, identity_map=True)]
+
+        self.assertEqual(result, self.expected)
+        self.assertIs(result[0].brand, result[1].brand)
+
+    async def test_ato_dto(self) -> None:
+        product = await Product.objects.order_by("id").afirst()
+
+        result = await self.converter.ato_dto(product, ProductDataclass)
+
+        self.assertEqual(result, self.expected[0])
+
+    async def test_ato_dto_with_loaded_relations(self) -> None:
+        product = await Product.objects.select_related("brand").prefetch_related("photos__tags").order_by("id").afirst()
+
+        result = await self.converter.ato_dto(product, ProductDataclass)
+
+        self.assertEqual(result, self.expected[0])
+
+    async def test_aiter_dto_relation_deeper_than_max_depth(self) -> None:
+        queryset = Category.objects.filter(parent__isnull=True)
+
+        with self.assertRaises(ConversionError):
+            [dto async for dto in self.converter.aiter_dto(queryset, CategoriesDTO, max_depth=1)]
+
+    async def test_aiter_dto_wrong_data(self) -> None:
+        with self.assertRaises(ConversionError):
+            [dto async for dto in self.converter.aiter_dto([], ProductDataclass)]
@@ -0,0 +1,121 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from unittest import TestCase
+from unittest.mock import Mock, MagicMock
+
+from django.db.models import Model
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+
+
+class TestCodegenToDTOFunc(TestCase):
+    @dataclass
+    class TestDataclass:
+        id: int
+        name: str
+
+    def setUp(self) -> None:
+        self.converter = FromOrmToDataclass(codegen=True)
+
+    def test_to_dto_python_types(self) -> None:
+        result = self.converter.to_dto(self.get_db_model_object(), self.TestDataclass)
+
+        self.assertEqual(result, self.TestDataclass(id=1, name="first"))
+
+    def test_to_dto_nested_objects(self) -> None:
+        InnerTestDataclass = self.TestDataclass
+
+        @dataclass
+        class OuterTestDataclass:
+            dc: Optional[InnerTestDataclass]
+            dcs: List[InnerTestDataclass]
+            empty_dc: Optional[InnerTestDataclass]
+            names: List[str] = field(default_factory=list)
+
+        mock_related_manager = MagicMock()
+        mock_related_manager.all.return_value = [self.get_db_model_object()]
+        mock_model = Mock(spec=Model)
+        mock_model.dc = self.get_db_model_object()
+        mock_model.dcs = mock_related_manager
+        mock_model.empty_dc = None
+
+        result = self.converter.to_dto(mock_model, OuterTestDataclass)
+
+        self.assertEqual(
+            result,
+            OuterTestDataclass(
+                dc=InnerTestDataclass(id=1, name="first"),
+                dcs=[InnerTestDataclass(id=1, name="first")],
+                empty_dc=None,
+                names=[],
+            )
+        )
+
+    def test_to_dto_recursive_relation(self) -> None:
+        @dataclass
+        class RecursiveTestDataclass:
+            id: int
+            dc: Optional['RecursiveTestDataclass']
+
+        inner_mock_model = Mock(spec=Model)
+        inner_mock_model.id = 2
+        inner_mock_model.dc = None
+        outer_mock_model = Mock(spec=Model)
+        outer_mock_model.id = 1
+        outer_mock_model.dc = inner_mock_model
+
+        result = self.converter.to_dto(outer_mock_model, RecursiveTestDataclass)
+
+        self.assertEqual(result, RecursiveTestDataclass(id=1, dc=RecursiveTestDataclass(id=2, dc=None)))
+
+    def test_to_dto_kw_only_fields(self) -> None:
+        @dataclass(kw_only=True)
+        class KwOnlyTestDataclass:
+            name: str
+            id: int
+
+        result = self.converter.to_dto(self.get_db_model_object(), KwOnlyTestDataclass)
+
+        self.assertEqual(result, KwOnlyTestDataclass(id=1, name="first"))
+
+    def test_converter_is_generated_once(self) -> None:
+        self.converter.to_dto(self.get_db_model_object(), self.TestDataclass)
+        plan = self.converter._get_plan(self.TestDataclass)
+        converter = self.converter._generator.get_converter(plan)
+
+        self.converter.to_dto(self.get_db_model_object(), self.TestDataclass)
+
+        self.assertIs(self.converter._generator.get_converter(plan), converter)
+
+    def test_error_missed_field(self) -> None:
+        mock_model = Mock(spec=Model)
+        mock_model.id = 1
+
+        with self.assertRaises(ConversionError) as cm:
+            self.converter.to_dto(mock_model, self.TestDataclass)
+        self.assertEqual(f"Field name 'name' doesn't exist in {mock_model}", str(cm.exception))
+
+    def test_error_incorrect_field_type(self) -> None:
+        InnerTestDataclass = self.TestDataclass
+
+        @dataclass
+        class OuterTestDataclass:
+            dc: List[InnerTestDataclass]
+
+        mock_model = Mock(spec=Model)
+        mock_model.dc = self.get_db_model_object()
+
+        with self.assertRaises(ConversionError) as cm:
+            self.converter.to_dto(mock_model, OuterTestDataclass)
+        self.assertEqual(
+            f"The {mock_model.dc} is not iterable, but specified type is List[{InnerTestDataclass}]",
+            str(cm.exception)
+        )
+
+    @staticmethod
+    def get_db_model_object():
+        model = Mock(spec=Model)
+        model.id = 1
+        model.name = "first"
+        return model
@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+from unittest import TestCase
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+from auto_dataclass.sources import FromSourceToDataclass, MappingAdapter
+from dj_models import Brand, Photo, Product, delete_data
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: str
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    price: float
+    brand_id: Optional[int]
+    brand: Optional[BrandDataclass]
+
+
+@dataclass(frozen=True)
+class ProductBrandIdDataclass:
+    id: int
+    brand_id: int
+
+
+@dataclass(frozen=True)
+class ProductNameDataclass:
+    id: int
+    name: Decimal
+
+
+@dataclass(frozen=True)
+class ValuesDataclass:
+    name: str
+    count: int
+    is_active: bool
+    day: date
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    id: int
+    image: str
+
+
+class TestCoercion(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        brand = Brand.objects.create(name="brand")
+        Product.objects.create(name="product", description="", price=Decimal("1.50"), brand=brand)
+        Product.objects.create(name="no brand", description="", price=Decimal("2.25"))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def setUp(self) -> None:
+        self.queryset = Product.objects.order_by("id")
+
+    def assert_coerced(self, result) -> None:
+        self.assertEqual([product.price for product in result], [1.5, 2.25])
+        self.assertIs(type(result[0].price), float)
+        self.assertIs(type(result[0].brand.id), str)
+        self.assertIsNone(result[1].brand_id)
+
+    def test_coerce(self) -> None:
+        self.assert_coerced(FromOrmToDataclass(coerce=True).to_dto_many(self.queryset, ProductDataclass))
+
+    def test_coerce_codegen(self) -> None:
+        converter = FromOrmToDataclass(codegen=True, coerce=True)
+
+        self.assert_coerced(converter.to_dto_many(self.queryset, ProductDataclass))
+
+    def test_coerce_values(self) -> None:
+        converter = FromOrmToDataclass(coerce=True)
+
+        self.assert_coerced(list(converter.iter_dto_values(self.queryset, ProductDataclass)))
+
+    def test_coerce_columns(self) -> None:
+        columns = FromOrmToDataclass(coerce=True).to_columns(self.queryset, ProductDataclass)
+
+        self.assertEqual(list(columns.columns["price"]), [1.5, 2.25])
+
+    def test_without_coerce(self) -> None:
+        result = FromOrmToDataclass().to_dto_many(self.queryset, ProductDataclass)
+
+        self.assertEqual(result[0].price, Decimal("1.50"))
+        self.assertIs(type(result[0].brand.id), int)
+
+    def test_none_not_optional(self) -> None:
+        for converter in (FromOrmToDataclass(coerce=True), FromOrmToDataclass(codegen=True, coerce=True)):
+            with self.assertRaisesRegex(ConversionError, "'brand_id'.*not Optional"):
+                converter.to_dto_many(self.queryset, ProductBrandIdDataclass)
+
+    def test_invalid_value(self) -> None:
+        with self.assertRaisesRegex(ConversionError, "'product'.*can't be coerced"):
+            FromOrmToDataclass(coerce=True).to_dto(self.queryset.first(), ProductNameDataclass)
+
+    def test_file_to_str(self) -> None:
+        photo = Photo.objects.create(product=self.queryset.first(), image="image.png")
+
+        self.assertEqual(FromOrmToDataclass(coerce=True).to_dto(photo, PhotoDataclass).image, "image.png")
+
+
+class TestValueCoercion(TestCase):
+    def setUp(self) -> None:
+        self.converter = FromSourceToDataclass(MappingAdapter(), coerce=True)
+        self.row = {"name": "name", "count": 1, "is_active": True, "day": date(2024, 1, 2)}
+
+    def coerce(self, **values) -> ValuesDataclass:
+        return self.converter.to_dto({**self.row, **values}, ValuesDataclass)
+
+    def test_valid_values(self) -> None:
+        result = self.coerce(name=Decimal("1.5"), count="3", is_active="false", day=datetime(2024, 1, 2, 3, 4))
+
+        self.assertEqual(result, ValuesDataclass(name="1.5", count=3, is_active=False, day=date(2024, 1, 2)))
+        self.assertIs(type(result.day), date)
+        self.assertEqual(self.coerce(count=3.0, is_active=0), ValuesDataclass("name", 3, False, date(2024, 1, 2)))
+        self.assertEqual(self.coerce(is_active="True").is_active, True)
+
+    def test_invalid_values(self) -> None:
+        for values in (
+            {"name": object()},
+            {"name": b"name"},
+            {"name": ["name"]},
+            {"count": 3.9},
+            {"count": Decimal("3.5")},
+            {"count": True},
+            {"count": object()},
+            {"is_active": "no such"},
+            {"is_active": 2},
+            {"is_active": 1.0},
+        ):
+            with self.subTest(values=values), self.assertRaisesRegex(ConversionError, "can't be coerced"):
+                self.coerce(**values)
@@ -0,0 +1,149 @@
+import importlib.util
+from array import array
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import List, Optional
+from unittest import TestCase, skipIf, skipUnless
+
+from django.db.models import BooleanField, Value
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+from dj_models import Brand, Category, Photo, Product, Tag, delete_data
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+@dataclass(frozen=True)
+class TagDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    id: int
+    image: str
+    tags: List[TagDataclass] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    price: float
+    brand: Optional[BrandDataclass]
+    photos: List[PhotoDataclass] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class CategoriesDTO:
+    id: int
+    name: str
+    sub_categories: List['CategoriesDTO'] = field(default_factory=list)
+
+
+class TestToColumnsFunc(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        brand = Brand.objects.create(name="brand")
+        tag = Tag.objects.create(name="tag")
+        for index in range(3):
+            product = Product.objects.create(
+                name=f"product {index}", description="", price=index, brand=brand if index else None
+            )
+            for _ in range(index):
+                Photo.objects.create(product=product, image="image").tags.add(tag)
+
+        root = Category.objects.create(name="root")
+        child = Category.objects.create(name="child", parent=root)
+        Category.objects.create(name="grandchild", parent=child)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def setUp(self) -> None:
+        self.converter = FromOrmToDataclass()
+        self.queryset = Product.objects.order_by("id")
+        self.expected = self.converter.to_dto_many(self.queryset, ProductDataclass)
+
+    def test_to_columns(self) -> None:
+        result = self.converter.to_columns(self.queryset, ProductDataclass)
+
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result.columns["id"], array("q", [product.id for product in self.expected]))
+        self.assertEqual(result.columns["price"], [Decimal(0), Decimal(1), Decimal(2)])
+        self.assertEqual(result.columns["name"], ["product 0", "product 1", "product 2"])
+        self.assertEqual(result.offsets["brand"], array("q", [0, 0, 1, 2]))
+        self.assertEqual(result.offsets["photos"], array("q", [0, 0, 1, 3]))
+        self.assertEqual(len(result.children["photos"]), 3)
+        self.assertEqual(result.children["photos"].offsets["tags"], array("q", [0, 1, 2, 3]))
+
+    def test_to_columns_materializes_dtos(self) -> None:
+        result = self.converter.to_columns(self.queryset, ProductDataclass, chunk_size=2)
+
+        self.assertEqual(list(result), self.expected)
+        self.assertEqual(result[-1], self.expected[-1])
+        self.assertEqual(result[1:], self.expected[1:])
+
+    def test_to_columns_keeps_the_values_of_other_types(self) -> None:
+        @dataclass(frozen=True)
+        class ValuesDataclass:
+            id: float
+            price: float
+            is_active: int
+
+        queryset = self.queryset.annotate(is_active=Value(True, output_field=BooleanField()))
+        expected = self.converter.to_dto_many(queryset, ValuesDataclass)
+
+        result = self.converter.to_columns(queryset, ValuesDataclass)
+
+        for index, dto in enumerate(expected):
+            self.assertEqual(result[index], dto)
+            self.assertEqual(
+                [type(value) for value in (result[index].id, result[index].price, result[index].is_active)],
+                [int, Decimal, bool],
+            )
+        self.assertIsInstance(result.columns["price"], list)
+
+    def test_to_columns_coerced(self) -> None:
+        result = FromOrmToDataclass(coerce=True).to_columns(self.queryset, ProductDataclass)
+
+        self.assertEqual(result.columns["price"], array("d", [0, 1, 2]))
+
+    def test_to_columns_recursive(self) -> None:
+        queryset = Category.objects.filter(parent__isnull=True)
+
+        result = self.converter.to_columns(queryset, CategoriesDTO)
+
+        self.assertEqual(list(result), self.converter.to_dto_many(queryset, CategoriesDTO))
+
+    def test_to_columns_index_error(self) -> None:
+        result = self.converter.to_columns(self.queryset, ProductDataclass)
+
+        with self.assertRaises(IndexError):
+            result[3]
+
+    @skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_to_columns_numpy(self) -> None:
+        result = self.converter.to_columns(self.queryset, ProductDataclass, use_numpy=True)
+
+        self.assertEqual(result.columns["id"].dtype.name, "int64")
+        self.assertEqual(result.columns["name"].dtype.name, "object")
+        self.assertEqual(list(result), self.expected)
+
+    @skipIf(HAS_NUMPY, "NumPy is installed")
+    def test_to_columns_numpy_not_installed(self) -> None:
+        with self.assertRaises(ConversionError):
+            self.converter.to_columns(self.queryset, ProductDataclass, use_numpy=True)
+
+    def test_to_columns_wrong_data(self) -> None:
+        with self.assertRaises(ConversionError):
+            self.converter.to_columns([object()], ProductDataclass)
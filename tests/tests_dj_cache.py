@@ -0,0 +1,197 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Optional
+from unittest import TestCase, mock
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from auto_dataclass.cache import LRUCache
+from auto_dataclass.dj_cache import DjangoCacheBackend, DTOCache
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from dj_models import Brand, Product, delete_data
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    brand: Optional[BrandDataclass]
+
+
+class TestLRUCache(TestCase):
+    def test_lru_eviction(self) -> None:
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b", None))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_ttl_expiration(self) -> None:
+        now = [0.0]
+        cache = LRUCache(ttl=10, timer=lambda: now[0])
+        cache.set("a", 1)
+
+        now[0] = 9.9
+        self.assertEqual(cache.get("a"), 1)
+        now[0] = 10
+        self.assertIsNone(cache.get("a", None))
+        self.assertEqual(len(cache), 0)
+
+
+class TestDTOCache(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        brand = Brand.objects.create(name="brand")
+        Product.objects.create(name="product", description="", brand=brand)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def setUp(self) -> None:
+        self.cache = DTOCache()
+        self.converter = FromOrmToDataclass(cache=self.cache)
+
+    def tearDown(self) -> None:
+        self.cache.disconnect()
+
+    def test_to_dto_hit(self) -> None:
+        first = self.converter.to_dto(Product.objects.get(), ProductDataclass)
+
+        with CaptureQueriesContext(connection) as context:
+            second = self.converter.to_dto(Product.objects.get(), ProductDataclass)
+
+        self.assertIs(second, first)
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual(self.cache.stats(), {"hits": 1, "misses": 1, "hit_ratio": 0.5})
+
+    def test_to_dto_key_includes_dataclass_and_projection(self) -> None:
+        product = Product.objects.select_related("brand").get()
+
+        self.converter.to_dto(product, ProductDataclass)
+        projected = self.converter.to_dto(product, ProductDataclass, fields=["id"])
+        self.converter.to_dto(product, ProductDataclass, fields="id")
+
+        self.assertIsNone(projected.name)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_to_dto_new_version_is_converted(self) -> None:
+        product = Product.objects.get()
+        self.converter.to_dto(product, ProductDataclass)
+
+        product.updated_at += timedelta(seconds=1)
+        product.name = "new name"
+        result = self.converter.to_dto(product, ProductDataclass)
+
+        self.assertEqual(result.name, "new name")
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_post_save_invalidation(self) -> None:
+        self.cache.connect(Brand)
+        brand = Brand.objects.get()
+        self.converter.to_dto(brand, BrandDataclass)
+
+        brand.name = "new name"
+        brand.save()
+        result = self.converter.to_dto(brand, BrandDataclass)
+        Brand.objects.filter(pk=brand.pk).update(name="brand")
+
+        self.assertEqual(result.name, "new name")
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_post_delete_invalidation(self) -> None:
+        self.cache.connect()
+        brand = Brand.objects.create(name="deleted")
+        self.converter.to_dto(brand, BrandDataclass)
+        key = self.cache.get_key(brand, BrandDataclass)
+        deleted_brand = Brand(pk=brand.pk, name="deleted")
+
+        brand.delete()
+
+        self.assertNotEqual(self.cache.get_key(deleted_brand, BrandDataclass), key)
+
+    def test_versioned_invalidation(self) -> None:
+        self.cache.connect(Product)
+        product = Product.objects.create(name="versioned", description="")
+        stale_product = Product.objects.get(pk=product.pk)
+        self.converter.to_dto(stale_product, ProductDataclass)
+
+        product.name = "new name"
+        product.save()
+        stale_result = self.converter.to_dto(stale_product, ProductDataclass)
+        result = self.converter.to_dto(product, ProductDataclass)
+        product.delete()
+
+        self.assertEqual((stale_result.name, result.name), ("versioned", "new name"))
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 3))
+
+    def test_invalidation_by_another_cache_of_the_backend(self) -> None:
+        other_cache = DTOCache(self.cache.backend)
+        brand = Brand.objects.get()
+        self.converter.to_dto(brand, BrandDataclass)
+
+        brand.name = "new name"
+        other_cache.invalidate(brand)
+        result = self.converter.to_dto(brand, BrandDataclass)
+
+        self.assertEqual(result.name, "new name")
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_unsaved_and_deferred_objects_are_not_cached(self) -> None:
+        self.converter.to_dto(Product(name="unsaved"), ProductDataclass)
+        self.converter.to_dto(Product.objects.only("id", "name").get(), ProductDataclass)
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_lazy_is_not_cached(self) -> None:
+        self.converter.to_dto(Product.objects.get(), ProductDataclass, lazy=True)
+
+        self.assertEqual(len(self.cache.backend), 0)
+
+
+class TestDjangoCacheBackend(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        Brand.objects.create(name="brand")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def test_to_dto_with_django_cache(self) -> None:
+        backend = DjangoCacheBackend(timeout=60)
+        cache = DTOCache(backend)
+        converter = FromOrmToDataclass(cache=cache)
+        brand = Brand.objects.get()
+
+        first = converter.to_dto(brand, BrandDataclass)
+        second = converter.to_dto(brand, BrandDataclass)
+        cache.invalidate(brand)
+        converter.to_dto(brand, BrandDataclass)
+        backend.clear()
+
+        self.assertEqual(second, first)
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 2, "hit_ratio": 1 / 3})
+
+    def test_timeout(self) -> None:
+        key = DTOCache().get_key(Brand.objects.get(), BrandDataclass)
+
+        with mock.patch.object(caches["default"], "set") as cache_set:
+            DjangoCacheBackend().set(key, "dto")
+            DjangoCacheBackend(timeout=None).set(key, "dto")
+
+        self.assertEqual([call.args[2] for call in cache_set.call_args_list], [DEFAULT_TIMEOUT, None])
@@ -0,0 +1,99 @@
+import dataclasses
+from decimal import Decimal
+from typing import List, Optional
+from unittest import TestCase
+
+from auto_dataclass.dj_dataclass_builder import model_to_dataclass, model_to_dataclass_source
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+from dj_models import Brand, Category, Photo, Product, delete_data
+
+
+class TestModelToDataclassFunc(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        brand = Brand.objects.create(name="brand")
+        product = Product.objects.create(name="product", description="", price=Decimal("1.50"), brand=brand)
+        Photo.objects.create(product=product, image="image")
+        root = Category.objects.create(name="root")
+        Category.objects.create(name="child", parent=root)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def test_model_to_dataclass_fields(self) -> None:
+        dc = model_to_dataclass(Product, exclude=["updated_at"])
+
+        self.assertEqual(dc.__name__, "ProductDTO")
+        self.assertEqual(
+            {dc_field.name: dc_field.type for dc_field in dataclasses.fields(dc)},
+            {"id": int, "name": str, "description": str, "price": Decimal, "brand_id": Optional[int]},
+        )
+        self.assertEqual(dc.__slots__, ("id", "name", "description", "price", "brand_id"))
+        self.assertTrue(dc.__dataclass_params__.frozen)
+
+    def test_model_to_dataclass_with_relations(self) -> None:
+        dc = model_to_dataclass(Product, fields=["id", "name", "brand", "photos"], depth=2, name="ProductInfo")
+        product = Product.objects.get()
+
+        result = FromOrmToDataclass().to_dto(product, dc)
+
+        self.assertEqual(type(result).__name__, "ProductInfo")
+        self.assertEqual(result.name, "product")
+        self.assertEqual(result.brand.name, "brand")
+        self.assertEqual(result.photos[0].image, "image")
+        self.assertEqual([dc_field.name for dc_field in dataclasses.fields(type(result.photos[0]))], ["id", "image"])
+
+    def test_model_to_dataclass_with_codegen(self) -> None:
+        dc = model_to_dataclass(Category, fields=["id", "name", "sub_categories"], depth=1)
+        root = Category.objects.get(parent__isnull=True)
+
+        result = FromOrmToDataclass(codegen=True).to_dto(root, dc)
+
+        self.assertEqual(result.sub_categories[0].name, "child")
+        self.assertFalse(hasattr(result.sub_categories[0], "parent_id"))
+
+    def test_model_to_dataclass_without_slots(self) -> None:
+        dc = model_to_dataclass(Brand, slots=False, frozen=False, module=__name__)
+
+        self.assertFalse(hasattr(dc, "__slots__"))
+        self.assertEqual(dc.__module__, __name__)
+
+    def test_model_to_dataclass_source(self) -> None:
+        source = model_to_dataclass_source(Product, fields=["id", "brand", "photos"], depth=1)
+        namespace = {}
+        exec(source, namespace)
+
+        self.assertEqual(
+            source,
+            "from dataclasses import dataclass, field\n"
+            "from typing import List, Optional\n"
+            "\n\n"
+            "@dataclass(slots=True, frozen=True)\n"
+            "class BrandDTO:\n"
+            "    id: int\n"
+            "    name: str\n"
+            "\n\n"
+            "@dataclass(slots=True, frozen=True)\n"
+            "class PhotoDTO:\n"
+            "    id: int\n"
+            "    image: str\n"
+            "\n\n"
+            "@dataclass(slots=True, frozen=True)\n"
+            "class ProductDTO:\n"
+            "    id: int\n"
+            "    brand: Optional[BrandDTO]\n"
+            "    photos: List[PhotoDTO] = field(default_factory=list)",
+        )
+        self.assertEqual(
+            namespace["ProductDTO"].__annotations__["photos"], List[namespace["PhotoDTO"]]
+        )
+
+    def test_model_to_dataclass_unknown_field(self) -> None:
+        with self.assertRaises(ConversionError):
+            model_to_dataclass(Product, fields=["id", "unknown"])
+
+    def test_model_to_dataclass_relation_without_depth(self) -> None:
+        with self.assertRaises(ConversionError):
+            model_to_dataclass(Product, fields=["id", "photos"])
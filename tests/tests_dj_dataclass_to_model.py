@@ -0,0 +1,145 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import List, Optional
+from unittest import TestCase
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from auto_dataclass.dj_dataclass_to_model import FromDataclassToOrm
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+from dj_models import Brand, Category, Photo, Product, delete_data
+
+
+@dataclass(frozen=True)
+class TagDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    image: str
+    id: Optional[int] = None
+    tags: List[TagDataclass] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    name: str
+    description: str
+    price: Decimal
+    brand: Optional[BrandDataclass] = None
+    id: Optional[int] = None
+    photos: List[PhotoDataclass] = field(default_factory=list)
+    photos_count: int = 0
+
+
+@dataclass(frozen=True)
+class CategoriesDTO:
+    name: str
+    id: Optional[int] = None
+    sub_categories: List["CategoriesDTO"] = field(default_factory=list)
+
+
+class TestFromDataclassToOrm(TestCase):
+    def setUp(self) -> None:
+        self.converter = FromDataclassToOrm()
+        self.brand = Brand.objects.create(name="brand")
+        self.dtos = [
+            ProductDataclass(
+                name=f"product {index}",
+                description="",
+                price=Decimal(index),
+                brand=BrandDataclass(id=self.brand.id, name="brand"),
+                photos=[PhotoDataclass(image=f"image {index}.{photo}") for photo in range(3)],
+                photos_count=3,
+            )
+            for index in range(5)
+        ]
+
+    def tearDown(self) -> None:
+        delete_data()
+
+    def test_to_models(self) -> None:
+        products = self.converter.to_models(self.dtos, ProductDataclass, Product, fields=["name", "brand", "price"])
+
+        self.assertEqual([product.name for product in products], [dto.name for dto in self.dtos])
+        self.assertEqual({product.brand_id for product in products}, {self.brand.id})
+        self.assertTrue(all(product.pk is None for product in products))
+
+    def test_bulk_create(self) -> None:
+        with CaptureQueriesContext(connection) as context:
+            products = self.converter.bulk_create(
+                self.dtos, ProductDataclass, Product, batch_size=2,
+                fields=["name", "description", "price", "brand", "photos.image"],
+            )
+
+        inserts = [query for query in context.captured_queries if query["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 3 + 8)
+        self.assertEqual(Product.objects.count(), 5)
+        self.assertEqual(Photo.objects.filter(product__in=products).count(), 15)
+        result = FromOrmToDataclass().to_dto_many(
+            Product.objects.prefetch_related("photos").order_by("id"), ProductDataclass, fields=["name", "photos.image"]
+        )
+        self.assertEqual(
+            [[photo.image for photo in dto.photos] for dto in result],
+            [[photo.image for photo in dto.photos] for dto in self.dtos],
+        )
+
+    def test_bulk_create_recursive(self) -> None:
+        tree = CategoriesDTO(
+            name="root",
+            sub_categories=[CategoriesDTO(name="child", sub_categories=[CategoriesDTO(name="grandchild")])],
+        )
+
+        self.converter.bulk_create([tree], CategoriesDTO, Category)
+
+        grandchild = Category.objects.select_related("parent__parent").get(name="grandchild")
+        self.assertEqual(grandchild.parent.parent.name, "root")
+
+    def test_bulk_update(self) -> None:
+        products = self.converter.bulk_create(
+            self.dtos, ProductDataclass, Product, fields=["name", "description", "price", "photos.image"]
+        )
+        dtos = FromOrmToDataclass().to_dto_many(
+            Product.objects.prefetch_related("photos").filter(pk__in=[product.pk for product in products]),
+            ProductDataclass,
+            fields=["id", "name", "description", "price", "photos.id", "photos.image"],
+        )
+        changed = [
+            ProductDataclass(
+                id=dto.id, name=dto.name.upper(), description="changed", price=dto.price,
+                photos=[PhotoDataclass(id=photo.id, image="changed") for photo in dto.photos],
+            )
+            for dto in dtos
+        ]
+
+        with CaptureQueriesContext(connection) as context:
+            self.converter.bulk_update(
+                changed, ProductDataclass, Product, fields=["id", "name", "description", "photos.id", "photos.image"]
+            )
+
+        updates = [query for query in context.captured_queries if query["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 2)
+        self.assertEqual(set(Product.objects.values_list("description", flat=True)), {"changed"})
+        self.assertEqual(set(Photo.objects.values_list("image", flat=True)), {"changed"})
+
+    def test_bulk_update_without_pk(self) -> None:
+        with self.assertRaises(ConversionError):
+            self.converter.bulk_update(self.dtos, ProductDataclass, Product, fields=["name"])
+
+    def test_many_to_many_field_is_not_supported(self) -> None:
+        with self.assertRaisesRegex(ConversionError, "'tags'.*exclude it"):
+            self.converter.bulk_create(self.dtos, ProductDataclass, Product)
+
+    def test_wrong_model_arg(self) -> None:
+        with self.assertRaises(ConversionError):
+            self.converter.to_models(self.dtos, ProductDataclass, ProductDataclass)
@@ -0,0 +1,130 @@
+import dataclasses
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+from unittest import TestCase
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.dj_parallel import ChunkTask, convert_chunk, get_pk_ranges
+from auto_dataclass.exceptions import ConversionError
+from dj_models import Brand, Product, delete_data
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    brand: Optional[BrandDataclass]
+
+
+@dataclass(frozen=True)
+class PriceDataclass:
+    id: int
+    price: float
+
+
+class TestIterDtoParallelFunc(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        brand = Brand.objects.create(name="brand")
+        for index in range(7):
+            Product.objects.create(name=f"product {index}", description="", price=Decimal("1.50"), brand=brand)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def setUp(self) -> None:
+        self.converter = FromOrmToDataclass()
+        self.expected = self.converter.to_dto_many(Product.objects.order_by("pk"), ProductDataclass)
+
+    def test_get_pk_ranges(self) -> None:
+        pks = list(Product.objects.order_by("pk").values_list("pk", flat=True))
+
+        result = get_pk_ranges(Product.objects.all(), 3)
+
+        self.assertEqual(result, [(pks[0], pks[2]), (pks[3], pks[5]), (pks[6], pks[6])])
+
+    def test_get_pk_ranges_of_empty_queryset(self) -> None:
+        self.assertEqual(get_pk_ranges(Product.objects.none(), 3), [])
+
+    def test_convert_chunk_of_pickled_task(self) -> None:
+        pks = self.expected[1].id, self.expected[3].id
+        task = ChunkTask.from_queryset(Product.objects.select_related("brand"), ProductDataclass, (), True, False)
+        task = pickle.loads(pickle.dumps(dataclasses.replace(task, first_pk=pks[0], last_pk=pks[1])))
+
+        with CaptureQueriesContext(connection) as context:
+            result = convert_chunk(task)
+
+        self.assertEqual(result, self.expected[1:4])
+        self.assertEqual(len(context.captured_queries), 1)
+
+    def test_pickling_task_runs_no_queries(self) -> None:
+        queryset = Product.objects.filter(name__startswith="product").prefetch_related("photos")
+        task = ChunkTask.from_queryset(queryset, ProductDataclass, (), False, False)
+
+        with CaptureQueriesContext(connection) as context:
+            pickled_task = pickle.dumps(task)
+
+        self.assertEqual(len(context.captured_queries), 0)
+        self.assertIsNone(queryset._result_cache)
+        unpickled_queryset = pickle.loads(pickled_task).get_queryset()
+        self.assertEqual(list(unpickled_queryset.order_by("pk")), list(queryset.order_by("pk")))
+        self.assertEqual(unpickled_queryset._prefetch_related_lookups, ("photos",))
+
+    def test_iter_dto_parallel_ordered(self) -> None:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = list(
+                self.converter.iter_dto_parallel(
+                    Product.objects.all(), ProductDataclass, workers=2, chunk_size=2, executor=executor
+                )
+            )
+
+        self.assertEqual(result, self.expected)
+
+    def test_iter_dto_parallel_unordered(self) -> None:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            result = list(
+                self.converter.iter_dto_parallel(
+                    Product.objects.all(), ProductDataclass, workers=3, chunk_size=3, ordered=False, executor=executor,
+                )
+            )
+
+        self.assertCountEqual(result, self.expected)
+
+    def test_iter_dto_parallel_with_codegen(self) -> None:
+        converter = FromOrmToDataclass(codegen=True)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = list(converter.iter_dto_parallel(Product.objects.all(), ProductDataclass, executor=executor))
+
+        self.assertEqual(result, self.expected)
+
+    def test_iter_dto_parallel_with_coerce(self) -> None:
+        for converter in (FromOrmToDataclass(coerce=True), FromOrmToDataclass(codegen=True, coerce=True)):
+            with self.subTest(converter=converter), ThreadPoolExecutor(max_workers=2) as executor:
+                result = list(
+                    converter.iter_dto_parallel(Product.objects.all(), PriceDataclass, chunk_size=3, executor=executor)
+                )
+
+                self.assertEqual(result, converter.to_dto_many(Product.objects.order_by("pk"), PriceDataclass))
+                self.assertEqual({type(dto.price) for dto in result}, {float})
+
+    def test_iter_dto_parallel_wrong_args(self) -> None:
+        with self.assertRaises(ConversionError):
+            self.converter.iter_dto_parallel(Product.objects.all(), ProductDataclass, chunk_size=0)
+        with self.assertRaises(ConversionError):
+            self.converter.iter_dto_parallel(Product.objects.all(), ProductDataclass, workers=0)
+        with self.assertRaises(ConversionError):
+            self.converter.iter_dto_parallel([], ProductDataclass)
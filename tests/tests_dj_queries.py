@@ -0,0 +1,97 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from unittest import TestCase
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.dj_queries import LazyLoadWarning, count_queries
+from auto_dataclass.exceptions import TooManyQueriesError
+from dj_models import Brand, Photo, Product, Tag, delete_data
+
+
+@dataclass(frozen=True)
+class TagDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    id: int
+    image: str
+    tags: List[TagDataclass] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    brand: Optional[BrandDataclass]
+    photos: List[PhotoDataclass] = field(default_factory=list)
+
+
+class TestCountQueries(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        brand = Brand.objects.create(name="brand")
+        tag = Tag.objects.create(name="tag")
+        for index in range(3):
+            product = Product.objects.create(name=f"product {index}", description="", brand=brand)
+            for _ in range(2):
+                Photo.objects.create(product=product, image="image").tags.add(tag)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def setUp(self) -> None:
+        self.converter = FromOrmToDataclass(codegen=True)
+
+    def test_count_queries_by_field_path(self) -> None:
+        with count_queries() as counter:
+            result = self.converter.to_dto_many(Product.objects.all(), ProductDataclass)
+
+        self.assertEqual(len(result), 3)
+        self.assertEqual(
+            dict(counter.queries),
+            {
+                "ProductDataclass.brand": 3,
+                "ProductDataclass.photos": 3,
+                "ProductDataclass.photos[].tags": 6,
+            }
+        )
+        self.assertEqual(counter.lazy_loads, 12)
+        self.assertEqual(counter.total, 13)
+
+    def test_count_queries_without_lazy_loads(self) -> None:
+        queryset = self.converter.optimize_queryset(Product.objects.all(), ProductDataclass)
+
+        with count_queries(threshold=0, raise_error=True) as counter:
+            self.converter.to_dto_many(queryset, ProductDataclass)
+
+        self.assertEqual(counter.lazy_loads, 0)
+        self.assertEqual(counter.total, 3)
+
+    def test_count_queries_threshold_warning(self) -> None:
+        with self.assertWarns(LazyLoadWarning):
+            with count_queries(threshold=2):
+                self.converter.to_dto_many(Product.objects.all(), ProductDataclass)
+
+    def test_error_count_queries_threshold(self) -> None:
+        with self.assertRaises(TooManyQueriesError) as cm:
+            with count_queries(threshold=2, raise_error=True):
+                self.converter.to_dto_many(Product.objects.all(), ProductDataclass)
+        self.assertEqual(sum(cm.exception.queries.values()), 3)
+
+    def test_conversion_outside_block_is_not_counted(self) -> None:
+        with count_queries() as counter:
+            pass
+
+        self.converter.to_dto_many(Product.objects.all(), ProductDataclass)
+
+        self.assertEqual(counter.total, 0)
@@ -0,0 +1,131 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+from unittest import TestCase
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+from dj_models import Brand, Category, Photo, Product, Tag, delete_data
+
+
+@dataclass(frozen=True)
+class TagDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    id: int
+    image: str
+    tags: List[TagDataclass] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    brand: Optional[BrandDataclass]
+    photos: List[PhotoDataclass] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class CategoriesDTO:
+    id: int
+    name: str
+    sub_categories: List['CategoriesDTO'] = field(default_factory=list)
+
+
+class TestOptimizeQuerySetFunc(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        brand = Brand.objects.create(name="brand")
+        tag = Tag.objects.create(name="tag")
+        for index in range(3):
+            product = Product.objects.create(name=f"product {index}", description="", brand=brand)
+            for _ in range(2):
+                Photo.objects.create(product=product, image="image").tags.add(tag)
+
+        root = Category.objects.create(name="root")
+        for index in range(2):
+            child = Category.objects.create(name=f"child {index}", parent=root)
+            Category.objects.create(name=f"grandchild {index}", parent=child)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def setUp(self) -> None:
+        self.converter = FromOrmToDataclass()
+
+    def test_optimize_queryset_query_count(self) -> None:
+        expected = self.converter.to_dto_many(Product.objects.order_by("id"), ProductDataclass)
+
+        with CaptureQueriesContext(connection) as context:
+            queryset = self.converter.optimize_queryset(Product.objects.order_by("id"), ProductDataclass)
+            result = self.converter.to_dto_many(queryset, ProductDataclass)
+
+        self.assertEqual(result, expected)
+        self.assertEqual(len(context.captured_queries), 3)
+
+    def test_optimize_queryset_lookups(self) -> None:
+        queryset = self.converter.optimize_queryset(Product.objects.all(), ProductDataclass)
+
+        self.assertEqual(queryset.query.select_related, {"brand": {}})
+        self.assertEqual([lookup.prefetch_to for lookup in queryset._prefetch_related_lookups], ["photos"])
+        self.assertEqual(queryset.query.deferred_loading, ({"id", "name", "brand", "brand__id", "brand__name"}, False))
+
+        photos_queryset = queryset._prefetch_related_lookups[0].queryset
+        self.assertEqual(photos_queryset.query.deferred_loading, ({"product", "id", "image"}, False))
+
+    def test_optimize_queryset_property_loads_all_columns(self) -> None:
+        @dataclass
+        class PropertyDataclass:
+            id: int
+            pk: int
+
+        queryset = self.converter.optimize_queryset(Product.objects.all(), PropertyDataclass)
+
+        self.assertIn("description", queryset.query.deferred_loading[0])
+
+    def test_optimize_queryset_recursive_depth(self) -> None:
+        queryset = self.converter.optimize_queryset(
+            Category.objects.filter(parent__isnull=True), CategoriesDTO, max_depth=3
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            result = self.converter.to_dto_many(queryset, CategoriesDTO)
+
+        self.assertEqual(len(context.captured_queries), 4)
+        self.assertEqual(result[0].sub_categories[1].sub_categories[0].name, "grandchild 1")
+
+    def test_optimize_prefetched_queryset(self) -> None:
+        expected = self.converter.to_dto_many(Product.objects.order_by("id"), ProductDataclass)
+
+        for prefetch in ("photos", "photos__tags"):
+            with self.subTest(prefetch=prefetch):
+                queryset = self.converter.optimize_queryset(
+                    Product.objects.prefetch_related(prefetch).order_by("id"), ProductDataclass
+                )
+
+                self.assertEqual(self.converter.to_dto_many(queryset, ProductDataclass), expected)
+                self.assertEqual(queryset.query.select_related, {"brand": {}})
+
+    def test_stream_prefetched_queryset(self) -> None:
+        queryset = Product.objects.prefetch_related("photos").order_by("id")
+
+        result = list(self.converter.iter_dto_stream(queryset, ProductDataclass, chunk_size=2))
+
+        self.assertEqual(result, self.converter.to_dto_many(queryset, ProductDataclass))
+
+    def test_error_optimize_queryset_incorrect_data_type(self) -> None:
+        with self.assertRaises(ConversionError):
+            self.converter.optimize_queryset(list(Product.objects.all()), ProductDataclass)
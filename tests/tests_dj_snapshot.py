@@ -0,0 +1,147 @@
+from dataclasses import dataclass, field
+from typing import List
+from unittest import TestCase
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.dj_snapshot import DTOSnapshot
+from auto_dataclass.exceptions import ConversionError
+from dj_models import Photo, Product, delete_data
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    id: int
+    image: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    photos: List[PhotoDataclass] = field(default_factory=list)
+
+
+class TestDTOSnapshot(TestCase):
+    def setUp(self) -> None:
+        self.products = [
+            Product.objects.create(name=f"product {index}", description="") for index in range(5)
+        ]
+        Photo.objects.create(product=self.products[0], image="image")
+        self.converter = FromOrmToDataclass()
+        self.queryset = Product.objects.prefetch_related("photos").order_by("id")
+
+    def tearDown(self) -> None:
+        delete_data()
+
+    def test_first_refresh_converts_everything(self) -> None:
+        snapshot = DTOSnapshot(self.converter, self.queryset, ProductDataclass)
+
+        delta = snapshot.refresh()
+
+        expected = {dto.id: dto for dto in self.converter.to_dto_many(self.queryset, ProductDataclass)}
+        self.assertEqual(delta.changed, expected)
+        self.assertEqual(delta.deleted, [])
+        self.assertEqual(snapshot.dtos, expected)
+        self.assertEqual(snapshot.watermark, max(product.updated_at for product in self.products))
+
+    def test_refresh_merges_changes_and_deletions(self) -> None:
+        snapshot = DTOSnapshot(self.converter, self.queryset, ProductDataclass)
+        snapshot.refresh()
+        self.products[1].name = "changed"
+        self.products[1].save()
+        new_product = Product.objects.create(name="new", description="")
+        deleted_pk = self.products[2].pk
+        self.products[2].delete()
+
+        delta = snapshot.refresh()
+
+        self.assertEqual(
+            delta.changed,
+            {
+                self.products[1].pk: ProductDataclass(id=self.products[1].pk, name="changed"),
+                new_product.pk: ProductDataclass(id=new_product.pk, name="new"),
+            }
+        )
+        self.assertEqual(delta.deleted, [deleted_pk])
+        expected = {dto.id: dto for dto in self.converter.to_dto_many(self.queryset, ProductDataclass)}
+        self.assertEqual(snapshot.dtos, expected)
+
+    def test_refresh_without_changes(self) -> None:
+        snapshot = DTOSnapshot(self.converter, self.queryset, ProductDataclass)
+        snapshot.refresh()
+
+        with CaptureQueriesContext(connection) as context:
+            delta = snapshot.refresh()
+
+        self.assertEqual(delta.changed, {})
+        self.assertEqual(delta.deleted, [])
+        self.assertEqual(len(context.captured_queries), 3)
+
+    def test_rows_leaving_the_queryset_are_deleted(self) -> None:
+        snapshot = DTOSnapshot(self.converter, self.queryset.exclude(name="hidden"), ProductDataclass)
+        snapshot.refresh()
+        self.products[0].name = "hidden"
+        self.products[0].save()
+
+        delta = snapshot.refresh()
+
+        self.assertEqual(delta.deleted, [self.products[0].pk])
+        self.assertNotIn(self.products[0].pk, snapshot.dtos)
+
+    def test_refresh_does_not_read_all_pks(self) -> None:
+        snapshot = DTOSnapshot(self.converter, self.queryset, ProductDataclass)
+        snapshot.refresh()
+
+        with CaptureQueriesContext(connection) as context:
+            snapshot.refresh()
+
+        self.assertTrue(all("WHERE" in query["sql"] for query in context.captured_queries))
+
+    def test_queryset_delete_is_tracked(self) -> None:
+        snapshot = DTOSnapshot(self.converter, self.queryset, ProductDataclass)
+        snapshot.refresh()
+
+        Product.objects.filter(pk__in=[self.products[3].pk, self.products[4].pk]).delete()
+        delta = snapshot.refresh()
+
+        self.assertCountEqual(delta.deleted, [self.products[3].pk, self.products[4].pk])
+
+    def test_deletions_without_signals_need_full_scan(self) -> None:
+        snapshot = DTOSnapshot(self.converter, self.queryset, ProductDataclass, full_scan_every=3)
+        snapshot.refresh()
+
+        Product.objects.filter(pk=self.products[4].pk)._raw_delete(Product.objects.db)
+
+        self.assertEqual(snapshot.refresh().deleted, [])
+        self.assertEqual(snapshot.refresh().deleted, [self.products[4].pk])
+
+    def test_disconnect(self) -> None:
+        snapshot = DTOSnapshot(self.converter, self.queryset, ProductDataclass)
+        snapshot.refresh()
+        snapshot.disconnect()
+
+        self.products[4].delete()
+
+        self.assertEqual(snapshot.refresh().deleted, [])
+
+    def test_pk_watermark(self) -> None:
+        snapshot = DTOSnapshot(
+            self.converter, self.queryset, ProductDataclass, watermark_field="pk", track_deletions=False, chunk_size=2
+        )
+        snapshot.refresh()
+        new_product = Product.objects.create(name="new", description="")
+
+        delta = snapshot.refresh()
+
+        self.assertEqual(list(delta.changed), [new_product.pk])
+        self.assertEqual(snapshot.watermark, new_product.pk)
+        self.assertEqual(len(snapshot.dtos), 6)
+
+    def test_wrong_watermark_field(self) -> None:
+        with self.assertRaises(ConversionError):
+            DTOSnapshot(self.converter, self.queryset, ProductDataclass, watermark_field="photos")
+        with self.assertRaises(ConversionError):
+            DTOSnapshot(self.converter, self.queryset, ProductDataclass, watermark_field="unknown")
@@ -0,0 +1,96 @@
+import sys
+from dataclasses import dataclass, field
+from typing import List
+from unittest import TestCase
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+from dj_models import Category, Product, delete_data
+
+
+@dataclass(frozen=True)
+class CategoriesDTO:
+    id: int
+    name: str
+    sub_categories: List['CategoriesDTO'] = field(default_factory=list)
+
+
+class TestToDTOTreeFunc(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.root = Category.objects.create(name="root")
+        for index in range(2):
+            child = Category.objects.create(name=f"child {index}", parent=cls.root)
+            for grandchild_index in range(2):
+                Category.objects.create(name=f"grandchild {index}.{grandchild_index}", parent=child)
+        cls.other_root = Category.objects.create(name="other root")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def setUp(self) -> None:
+        self.converter = FromOrmToDataclass()
+
+    def test_to_dto_tree_matches_to_dto(self) -> None:
+        roots = Category.objects.filter(parent__isnull=True).order_by("id")
+
+        with CaptureQueriesContext(connection) as context:
+            result = self.converter.to_dto_tree(roots, CategoriesDTO)
+
+        self.assertEqual(result, self.converter.to_dto_many(roots, CategoriesDTO))
+        self.assertEqual(len(context.captured_queries), 4)
+
+    def test_to_dto_tree_single_nodes_query(self) -> None:
+        roots = Category.objects.filter(parent__isnull=True).order_by("id")
+
+        with CaptureQueriesContext(connection) as context:
+            result = self.converter.to_dto_tree(roots, CategoriesDTO, nodes=Category.objects.order_by("id"))
+
+        self.assertEqual(len(context.captured_queries), 2)
+        self.assertEqual([dto.name for dto in result], ["root", "other root"])
+        self.assertEqual(result[0].sub_categories[1].sub_categories[0].name, "grandchild 1.0")
+        self.assertEqual(result[1].sub_categories, [])
+
+    def test_to_dto_tree_subtree(self) -> None:
+        child = Category.objects.get(name="child 1")
+
+        result = self.converter.to_dto_tree([child], CategoriesDTO)
+
+        self.assertEqual([dto.name for dto in result[0].sub_categories], ["grandchild 1.0", "grandchild 1.1"])
+
+    def test_to_dto_tree_deeper_than_recursion_limit(self) -> None:
+        depth = sys.getrecursionlimit() + 100
+        parent = root = Category.objects.create(name="deep root")
+        for index in range(depth):
+            parent = Category(name=f"deep {index}", parent=parent)
+            parent.save()
+
+        result = self.converter.to_dto_tree([root], CategoriesDTO, nodes=Category.objects.all())
+
+        node, levels = result[0], 0
+        while node.sub_categories:
+            node, levels = node.sub_categories[0], levels + 1
+        self.assertEqual(levels, depth)
+        Category.objects.filter(name__startswith="deep").delete()
+
+    def test_to_dto_tree_empty_roots(self) -> None:
+        self.assertEqual(self.converter.to_dto_tree(Category.objects.none(), CategoriesDTO), [])
+
+    def test_error_to_dto_tree_without_tree_field(self) -> None:
+        @dataclass
+        class ProductDataclass:
+            id: int
+
+        Product.objects.create(name="product", description="")
+
+        with self.assertRaises(ConversionError) as cm:
+            self.converter.to_dto_tree(Product.objects.all(), ProductDataclass)
+        self.assertEqual(
+            f"The {ProductDataclass} must have a List['ProductDataclass'] field "
+            f"for the reverse relation of {Product} to itself",
+            str(cm.exception)
+        )
@@ -0,0 +1,130 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import List, Optional
+from unittest import TestCase
+
+from django.db.models import Count
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+from dj_models import Brand, Category, Photo, Product, delete_data
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    price: Decimal
+    brand: Optional[BrandDataclass]
+    tags: List[str] = field(default_factory=list)
+
+
+class TestIterDTOValuesFunc(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        brand = Brand.objects.create(name="brand")
+        cls.first = Product.objects.create(name="first", description="", price=Decimal("1.50"), brand=brand)
+        cls.second = Product.objects.create(name="second", description="")
+        Photo.objects.create(product=cls.first, image="image")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def setUp(self) -> None:
+        self.converter = FromOrmToDataclass()
+
+    def test_iter_dto_values(self) -> None:
+        result = list(self.converter.iter_dto_values(Product.objects.order_by("id"), ProductDataclass))
+
+        self.assertEqual(
+            result,
+            [
+                ProductDataclass(
+                    id=self.first.id, name="first", price=Decimal("1.50"),
+                    brand=BrandDataclass(id=self.first.brand_id, name="brand"),
+                ),
+                ProductDataclass(id=self.second.id, name="second", price=Decimal("0"), brand=None),
+            ]
+        )
+
+    def test_iter_dto_values_matches_to_dto(self) -> None:
+        queryset = Product.objects.select_related("brand").order_by("id")
+
+        self.assertEqual(
+            list(self.converter.iter_dto_values(queryset, ProductDataclass, chunk_size=1)),
+            self.converter.to_dto_many(queryset, ProductDataclass),
+        )
+
+    def test_iter_dto_values_columns(self) -> None:
+        plan = self.converter._get_plan(ProductDataclass)
+
+        values_plan = self.converter._get_values_plan(plan, Product.objects.all())
+
+        self.assertEqual(values_plan.columns, ("id", "name", "price", "brand__id", "brand__name"))
+        self.assertIs(self.converter._get_values_plan(plan, Product.objects.all()), values_plan)
+
+    def test_iter_dto_values_annotations(self) -> None:
+        @dataclass
+        class AnnotatedDataclass:
+            name: str
+            photos_count: int
+
+        queryset = Product.objects.annotate(photos_count=Count("photos")).order_by("id")
+
+        result = list(self.converter.iter_dto_values(queryset, AnnotatedDataclass))
+
+        self.assertEqual(result, [AnnotatedDataclass("first", 1), AnnotatedDataclass("second", 0)])
+
+    def test_iter_dto_values_recursive_relation(self) -> None:
+        @dataclass
+        class CategoryDataclass:
+            id: int
+            parent: Optional['CategoryDataclass'] = None
+
+        category = Category.objects.create(name="root")
+
+        result = list(self.converter.iter_dto_values(Category.objects.all(), CategoryDataclass))
+
+        self.assertEqual(result, [CategoryDataclass(id=category.id)])
+        category.delete()
+
+    def test_error_iter_dto_values_list_field(self) -> None:
+        @dataclass
+        class PhotoDataclass:
+            id: int
+
+        @dataclass
+        class ProductWithPhotosDataclass:
+            id: int
+            photos: List[PhotoDataclass]
+
+        with self.assertRaises(ConversionError) as cm:
+            self.converter.iter_dto_values(Product.objects.all(), ProductWithPhotosDataclass)
+        self.assertEqual(
+            f"The field 'photos' with type List[{PhotoDataclass}] can't be converted from values() rows",
+            str(cm.exception)
+        )
+
+    def test_error_iter_dto_values_missed_field(self) -> None:
+        @dataclass
+        class MissedFieldDataclass:
+            id: int
+            non_existed_field_name: int
+
+        with self.assertRaises(ConversionError) as cm:
+            self.converter.iter_dto_values(Product.objects.all(), MissedFieldDataclass)
+        self.assertEqual(
+            f"Field name 'non_existed_field_name' doesn't exist in {Product}",
+            str(cm.exception)
+        )
+
+    def test_error_iter_dto_values_incorrect_data_type(self) -> None:
+        with self.assertRaises(ConversionError):
+            self.converter.iter_dto_values(list(Product.objects.all()), ProductDataclass)
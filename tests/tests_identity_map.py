@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from unittest import TestCase
+from unittest.mock import Mock, MagicMock
+
+from django.db.models import Model
+
+import dj_models  # noqa: F401 configures Django settings
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.dj_queries import count_queries
+from auto_dataclass.profiling import ConversionProfiler
+
+
+class TestIdentityMap(TestCase):
+    @dataclass(frozen=True)
+    class TestDataclass:
+        id: int
+        name: str
+
+    def setUp(self) -> None:
+        InnerTestDataclass = self.TestDataclass
+
+        @dataclass(frozen=True)
+        class OuterTestDataclass:
+            id: int
+            dc: Optional[InnerTestDataclass]
+            dcs: List[InnerTestDataclass]
+
+        self.OuterTestDataclass = OuterTestDataclass
+        self.converters = [
+            FromOrmToDataclass(),
+            FromOrmToDataclass(codegen=True),
+            FromOrmToDataclass(profiler=ConversionProfiler()),
+        ]
+
+    def test_related_objects_are_shared(self) -> None:
+        related_model = self.get_db_model_object(1)
+        models = [self.get_outer_db_model_object(index, related_model) for index in range(3)]
+
+        for converter in self.converters:
+            with self.subTest(converter=converter):
+                result = converter.to_dto_many(models, self.OuterTestDataclass, identity_map=True)
+
+                self.assertEqual(result[0].dc, self.TestDataclass(id=1, name="first"))
+                self.assertIs(result[0].dc, result[2].dc)
+                self.assertIs(result[0].dc, result[1].dcs[0])
+
+    def test_related_objects_are_not_shared_by_default(self) -> None:
+        related_model = self.get_db_model_object(1)
+        models = [self.get_outer_db_model_object(index, related_model) for index in range(2)]
+
+        for converter in self.converters:
+            with self.subTest(converter=converter):
+                result = converter.to_dto_many(models, self.OuterTestDataclass)
+
+                self.assertEqual(result[0].dc, result[1].dc)
+                self.assertIsNot(result[0].dc, result[1].dc)
+
+    def test_identity_map_is_scoped_to_one_call(self) -> None:
+        related_model = self.get_db_model_object(1)
+        models = [self.get_outer_db_model_object(0, related_model)]
+
+        for converter in self.converters:
+            with self.subTest(converter=converter):
+                first = converter.to_dto_many(models, self.OuterTestDataclass, identity_map=True)
+                second = converter.to_dto_many(models, self.OuterTestDataclass, identity_map=True)
+
+                self.assertIsNot(first[0].dc, second[0].dc)
+
+    def test_unsaved_related_objects_are_not_shared(self) -> None:
+        related_model = self.get_db_model_object(None)
+        models = [self.get_outer_db_model_object(index, related_model) for index in range(2)]
+
+        for converter in self.converters:
+            with self.subTest(converter=converter):
+                result = converter.to_dto_many(models, self.OuterTestDataclass, identity_map=True)
+
+                self.assertIsNot(result[0].dc, result[1].dc)
+
+    def test_differently_projected_objects_are_not_shared(self) -> None:
+        related_model = self.get_db_model_object(1)
+        models = [self.get_outer_db_model_object(index, related_model) for index in range(2)]
+
+        for converter in self.converters:
+            with self.subTest(converter=converter):
+                result = converter.to_dto_many(
+                    models, self.OuterTestDataclass, identity_map=True, fields="id,dc.id,dcs.name"
+                )
+
+                self.assertEqual(result[0].dc, self.TestDataclass(id=1, name=None))
+                self.assertEqual(result[0].dcs, [self.TestDataclass(id=None, name="first")])
+                self.assertIs(result[0].dc, result[1].dc)
+                self.assertIs(result[0].dcs[0], result[1].dcs[0])
+
+    def test_related_objects_are_shared_while_counting_queries(self) -> None:
+        related_model = self.get_db_model_object(1)
+        models = [self.get_outer_db_model_object(index, related_model) for index in range(2)]
+
+        with count_queries():
+            result = FromOrmToDataclass().to_dto_many(models, self.OuterTestDataclass, identity_map=True)
+
+        self.assertIs(result[0].dc, result[1].dc)
+        self.assertIs(result[0].dc, result[1].dcs[0])
+
+    @staticmethod
+    def get_db_model_object(pk):
+        model = Mock(spec=Model)
+        model.pk = pk
+        model.id = pk
+        model.name = "first"
+        return model
+
+    @staticmethod
+    def get_outer_db_model_object(pk, related_model):
+        mock_related_manager = MagicMock()
+        mock_related_manager.all.return_value = [related_model]
+        model = Mock(spec=Model)
+        model.pk = pk
+        model.id = pk
+        model.dc = related_model
+        model.dcs = mock_related_manager
+        return model
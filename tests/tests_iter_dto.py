@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from typing import Iterator
+from unittest import TestCase
+from unittest.mock import Mock
+
+from django.db.models import Model, QuerySet
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+
+
+class TestIterDTOFunc(TestCase):
+    @dataclass
+    class TestDataclass:
+        id: int
+        name: str
+
+    def setUp(self) -> None:
+        self.converter = FromOrmToDataclass()
+
+    def test_iter_dto_is_lazy(self) -> None:
+        models = iter(self.get_list_db_model_objects())
+
+        result = self.converter.iter_dto(models, self.TestDataclass)
+
+        self.assertIsInstance(result, Iterator)
+        self.assertEqual(next(result), self.TestDataclass(id=1, name="first"))
+        self.assertEqual(next(models).id, 2)
+
+    def test_to_dto_many(self) -> None:
+        result = self.converter.to_dto_many(self.get_list_db_model_objects(), self.TestDataclass)
+
+        self.assertEqual(
+            result,
+            [self.TestDataclass(id=1, name="first"), self.TestDataclass(id=2, name="second")]
+        )
+
+    def test_to_dto_many_codegen(self) -> None:
+        converter = FromOrmToDataclass(codegen=True)
+
+        result = converter.to_dto_many(self.get_list_db_model_objects(), self.TestDataclass)
+
+        self.assertEqual(result[1], self.TestDataclass(id=2, name="second"))
+
+    def test_to_dto_many_empty_data(self) -> None:
+        self.assertEqual(self.converter.to_dto_many([], self.TestDataclass), [])
+
+    def test_iter_dto_queryset_chunk_size(self) -> None:
+        queryset = Mock(spec=QuerySet)
+        queryset.iterator.return_value = iter(self.get_list_db_model_objects())
+
+        result = self.converter.to_dto_many(queryset, self.TestDataclass, chunk_size=1000)
+
+        queryset.iterator.assert_called_once_with(chunk_size=1000)
+        self.assertEqual(len(result), 2)
+
+    def test_error_iter_dto_incorrect_data_type(self) -> None:
+        with self.assertRaises(ConversionError):
+            self.converter.iter_dto(self.get_list_db_model_objects()[0], self.TestDataclass)
+
+        with self.assertRaises(ConversionError):
+            self.converter.iter_dto({"test": "dict"}, self.TestDataclass)
+
+    def test_error_iter_dto_incorrect_data_item_type(self) -> None:
+        with self.assertRaises(ConversionError) as cm:
+            self.converter.to_dto_many([{"id": 1, "name": "first"}], self.TestDataclass)
+        self.assertEqual(
+            f"Data must be a django.db.models.Model type. Instead, received '{dict}'",
+            str(cm.exception)
+        )
+
+    def test_error_iter_dto_incorrect_dataclass(self) -> None:
+        class IsNotDataclass:
+            id: int
+
+        with self.assertRaises(ConversionError):
+            self.converter.iter_dto(self.get_list_db_model_objects(), IsNotDataclass)
+
+    @staticmethod
+    def get_list_db_model_objects():
+        model_instance_1 = Mock(spec=Model)
+        model_instance_1.id = 1
+        model_instance_1.name = "first"
+        model_instance_2 = Mock(spec=Model)
+        model_instance_2.id = 2
+        model_instance_2.name = "second"
+
+        return [model_instance_1, model_instance_2]
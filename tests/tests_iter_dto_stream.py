@@ -0,0 +1,106 @@
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import List, Optional
+from unittest import TestCase
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+from dj_models import Brand, Photo, Product, Tag, delete_data
+
+
+@dataclass(frozen=True)
+class TagDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    id: int
+    image: str
+    tags: List[TagDataclass] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    brand: Optional[BrandDataclass]
+    photos: List[PhotoDataclass] = field(default_factory=list)
+
+
+class TestIterDTOStream(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        brand = Brand.objects.create(name="brand")
+        tag = Tag.objects.create(name="tag")
+        for index in range(5):
+            product = Product.objects.create(name=f"product {index}", description="", brand=brand)
+            for _ in range(2):
+                Photo.objects.create(product=product, image="image").tags.add(tag)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def setUp(self) -> None:
+        self.converter = FromOrmToDataclass()
+        self.queryset = Product.objects.order_by("id")
+
+    def test_stream_matches_to_dto_many(self) -> None:
+        result = list(self.converter.iter_dto_stream(self.queryset, ProductDataclass, chunk_size=2))
+
+        self.assertEqual(result, self.converter.to_dto_many(self.queryset, ProductDataclass))
+
+    def test_relations_are_prefetched_per_chunk(self) -> None:
+        with CaptureQueriesContext(connection) as context:
+            list(self.converter.iter_dto_stream(self.queryset, ProductDataclass, chunk_size=2))
+
+        self.assertEqual(len(context.captured_queries), 1 + 3 * 2)
+
+    def test_chunk_stats(self) -> None:
+        stats = []
+        tracemalloc.start()
+        try:
+            list(self.converter.iter_dto_stream(self.queryset, ProductDataclass, chunk_size=2, on_chunk=stats.append))
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual([chunk_stats.index for chunk_stats in stats], [0, 1, 2])
+        self.assertEqual([chunk_stats.rows for chunk_stats in stats], [2, 2, 1])
+        self.assertTrue(all(chunk_stats.peak_memory >= chunk_stats.memory > 0 for chunk_stats in stats))
+
+    def test_chunks_are_fetched_on_demand(self) -> None:
+        stats = []
+        dtos = self.converter.iter_dto_stream(self.queryset, ProductDataclass, chunk_size=2, on_chunk=stats.append)
+
+        next(dtos)
+        next(dtos)
+        self.assertEqual(len(stats), 1)
+        self.assertIsNone(stats[0].memory)
+        next(dtos)
+        self.assertEqual(len(stats), 2)
+
+    def test_identity_map_and_fields(self) -> None:
+        result = list(
+            self.converter.iter_dto_stream(
+                self.queryset, ProductDataclass, chunk_size=3, identity_map=True, fields=["id", "brand"]
+            )
+        )
+
+        self.assertIs(result[0].brand, result[2].brand)
+        self.assertIsNot(result[0].brand, result[3].brand)
+        self.assertEqual(result[0].photos, [])
+
+    def test_wrong_chunk_size(self) -> None:
+        with self.assertRaises(ConversionError):
+            self.converter.iter_dto_stream(self.queryset, ProductDataclass, chunk_size=0)
@@ -0,0 +1,119 @@
+import copy
+import pickle
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional
+from unittest import TestCase
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+from auto_dataclass.lazy import LazyDTO, LazyList, materialize
+from dj_models import Brand, Photo, Product, Tag, delete_data
+
+
+@dataclass(frozen=True)
+class TagDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    id: int
+    image: str
+    tags: List[TagDataclass] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    brand: Optional[BrandDataclass]
+    photos: List[PhotoDataclass] = field(default_factory=list)
+
+
+class TestLazyConversion(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        brand = Brand.objects.create(name="brand")
+        tag = Tag.objects.create(name="tag")
+        for index in range(3):
+            product = Product.objects.create(name=f"product {index}", description="", brand=brand)
+            for _ in range(2):
+                Photo.objects.create(product=product, image="image").tags.add(tag)
+        Product.objects.create(name="no brand", description="")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def setUp(self) -> None:
+        self.converter = FromOrmToDataclass()
+        self.queryset = Product.objects.select_related("brand").order_by("id")
+        self.expected = self.converter.to_dto_many(self.queryset, ProductDataclass)
+
+    def test_lazy_list_is_not_fetched_until_accessed(self) -> None:
+        with CaptureQueriesContext(connection) as context:
+            result = self.converter.to_dto_many(self.queryset.all(), ProductDataclass, lazy=True)
+            self.assertEqual([product.name for product in result], [product.name for product in self.expected])
+            self.assertEqual(len(context.captured_queries), 1)
+
+            self.assertEqual(result[0].photos, self.expected[0].photos)
+            self.assertEqual(len(context.captured_queries), 4)
+
+    def test_lazy_dto_equals_eager_dto(self) -> None:
+        result = self.converter.to_dto_many(self.queryset, ProductDataclass, lazy=True)
+
+        self.assertEqual(result, self.expected)
+        self.assertIsNone(result[-1].brand)
+        self.assertIsInstance(result[0].brand, LazyDTO)
+        self.assertIsInstance(result[0].brand, BrandDataclass)
+        self.assertIsInstance(result[0].photos, LazyList)
+        self.assertEqual(result[0].brand.name, "brand")
+        self.assertEqual(hash(result[0].brand), hash(self.expected[0].brand))
+        self.assertEqual(repr(result[0].photos), repr(self.expected[0].photos))
+
+    def test_lazy_to_dto(self) -> None:
+        result = self.converter.to_dto(self.queryset.first(), ProductDataclass, lazy=True)
+
+        self.assertEqual(len(result.photos), 2)
+        self.assertEqual(result.photos[0].tags[0].name, "tag")
+
+    def test_lazy_dto_copies_to_dto(self) -> None:
+        result = self.converter.to_dto(self.queryset.first(), ProductDataclass, lazy=True)
+
+        self.assertIs(type(copy.deepcopy(result.brand)), BrandDataclass)
+        self.assertEqual(pickle.loads(pickle.dumps(result)), self.expected[0])
+        self.assertIs(type(pickle.loads(pickle.dumps(result)).photos), list)
+
+    def test_isinstance_does_not_convert(self) -> None:
+        result = self.converter.to_dto(Product.objects.order_by("id").first(), ProductDataclass, lazy=True)
+
+        with CaptureQueriesContext(connection) as context:
+            self.assertIsInstance(result.brand, BrandDataclass)
+            self.assertNotIsInstance(result.brand, PhotoDataclass)
+
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_materialize_for_asdict(self) -> None:
+        result = self.converter.to_dto_many(self.queryset, ProductDataclass, lazy=True)
+
+        materialized = materialize(result)
+
+        self.assertEqual([asdict(product) for product in materialized], [asdict(product) for product in self.expected])
+        self.assertIs(type(materialized[0].brand), BrandDataclass)
+        self.assertIs(type(materialized[0].photos[0].tags), list)
+        with self.assertRaises(TypeError):
+            asdict(result[0].brand)
+
+    def test_lazy_with_identity_map(self) -> None:
+        with self.assertRaises(ConversionError):
+            self.converter.to_dto_many(self.queryset, ProductDataclass, identity_map=True, lazy=True)
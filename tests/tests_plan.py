@@ -0,0 +1,128 @@
+import dataclasses
+from dataclasses import dataclass
+from typing import List, Optional
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from django.db.models import Model
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.plan import FieldKind
+
+
+@dataclass
+class ModuleOuterTestDataclass:
+    id: int
+    dcs: List['ModuleFutureTestDataclass']
+
+
+@dataclass
+class ModuleFutureTestDataclass:
+    id: int
+
+
+class TestConversionPlan(TestCase):
+    @dataclass
+    class TestDataclass:
+        id: int
+        name: str
+
+    def setUp(self) -> None:
+        self.converter = FromOrmToDataclass()
+
+    def test_plan_is_compiled_once_per_dataclass(self) -> None:
+        with patch("auto_dataclass.plan.dataclasses.fields", wraps=dataclasses.fields) as fields_mock:
+            for _ in range(3):
+                self.converter.to_dto(self.get_db_model_object(), self.TestDataclass)
+
+        self.assertEqual(fields_mock.call_count, 1)
+
+    def test_plan_field_kinds(self) -> None:
+        InnerTestDataclass = self.TestDataclass
+
+        @dataclass
+        class OuterTestDataclass:
+            id: int
+            dc: Optional[InnerTestDataclass]
+            dcs: List[InnerTestDataclass]
+            names: List[str]
+
+        plan = self.converter._get_plan(OuterTestDataclass)
+
+        self.assertEqual(
+            [field.kind for field in plan.fields],
+            [FieldKind.VALUE, FieldKind.OBJECT, FieldKind.LIST, FieldKind.VALUE]
+        )
+        self.assertIs(plan.fields[1].target.dc, InnerTestDataclass)
+        self.assertIs(plan.fields[1].target, plan.fields[2].target)
+
+    def test_recursive_plan_references_itself(self) -> None:
+        @dataclass
+        class RecursiveTestDataclass:
+            id: int
+            dc: List['RecursiveTestDataclass']
+
+        plan = self.converter._get_plan(RecursiveTestDataclass)
+
+        self.assertIs(plan.fields[1].target, plan)
+
+    def test_plan_with_unresolved_future_reference_is_not_cached(self) -> None:
+        @dataclass
+        class OuterTestDataclass:
+            id: int
+            dc: Optional['FutureTestDataclass'] = None
+
+        @dataclass
+        class FutureTestDataclass:
+            id: int
+
+        mock_model = Mock(spec=Model)
+        mock_model.id = 1
+
+        result = self.converter.to_dto(mock_model, OuterTestDataclass)
+        self.assertEqual(result, OuterTestDataclass(id=1, dc=None))
+        self.assertEqual(self.converter._plans.registries[(OuterTestDataclass,)], {})
+
+        mock_model.dc = self.get_db_model_object()
+        result = self.converter.to_dto(mock_model, OuterTestDataclass, FutureTestDataclass)
+        self.assertEqual(result.dc, FutureTestDataclass(id=1))
+        self.assertIn(OuterTestDataclass, self.converter._plans.registries[(OuterTestDataclass, FutureTestDataclass)])
+
+    def test_plans_do_not_grow_with_calls(self) -> None:
+        @dataclass
+        class RecursiveTestDataclass:
+            id: int
+            dc: Optional['RecursiveTestDataclass']
+
+        mock_model = Mock(spec=Model)
+        mock_model.id = 1
+        mock_model.name = "first"
+        mock_model.dc = None
+
+        for _ in range(3):
+            self.converter.to_dto(mock_model, RecursiveTestDataclass)
+            self.converter.to_dto(mock_model, self.TestDataclass, RecursiveTestDataclass)
+
+        self.assertEqual(len(self.converter._plans.registries), 2)
+
+    def test_future_reference_resolved_from_module_globals(self) -> None:
+        plan = self.converter._get_plan(ModuleOuterTestDataclass)
+
+        self.assertIs(plan.fields[1].target.dc, ModuleFutureTestDataclass)
+        self.assertEqual(plan.fields[1].kind, FieldKind.LIST)
+
+    def test_future_dataclasses_args_take_precedence(self) -> None:
+        @dataclass
+        class ModuleFutureTestDataclass:
+            name: str
+
+        plan = self.converter._get_plan(ModuleOuterTestDataclass, (ModuleFutureTestDataclass,))
+
+        self.assertIs(plan.fields[1].target.dc, ModuleFutureTestDataclass)
+
+    @staticmethod
+    def get_db_model_object():
+        model = Mock(spec=Model)
+        model.id = 1
+        model.name = "first"
+        return model
@@ -0,0 +1,103 @@
+import json
+from dataclasses import dataclass, field
+from typing import List, Optional
+from unittest import TestCase
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.profiling import ConversionProfiler
+from dj_models import Brand, Photo, Product, delete_data
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    id: int
+    image: str
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    brand: Optional[BrandDataclass]
+    photos: List[PhotoDataclass] = field(default_factory=list)
+
+
+class TestConversionProfiler(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        brand = Brand.objects.create(name="brand")
+        for index in range(2):
+            product = Product.objects.create(name=f"product {index}", description="", brand=brand)
+            for _ in range(3):
+                Photo.objects.create(product=product, image="image")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def setUp(self) -> None:
+        self.queryset = Product.objects.order_by("id")
+
+    def test_profiler_counts(self) -> None:
+        profiler = ConversionProfiler()
+        converter = FromOrmToDataclass(profiler=profiler)
+
+        result = converter.to_dto_many(self.queryset, ProductDataclass)
+
+        self.assertEqual(result, FromOrmToDataclass().to_dto_many(self.queryset, ProductDataclass))
+        counts = {(row["kind"], row["key"]): row["count"] for row in profiler.report()}
+        self.assertEqual(counts[("dataclass", "ProductDataclass")], 2)
+        self.assertEqual(counts[("dataclass", "PhotoDataclass")], 6)
+        self.assertEqual(counts[("construct", "BrandDataclass")], 2)
+        self.assertEqual(counts[("field", "ProductDataclass.photos")], 2)
+        self.assertEqual(counts[("field", "ProductDataclass.photos[].image")], 6)
+        self.assertEqual(counts[("field", "ProductDataclass.brand.name")], 2)
+        self.assertEqual(counts[("related", "ProductDataclass.photos")], 2)
+
+    def test_profiler_times(self) -> None:
+        ticks = iter(range(10000))
+        profiler = ConversionProfiler(timer=lambda: next(ticks))
+        converter = FromOrmToDataclass(profiler=profiler)
+
+        converter.to_dto(Brand.objects.get(), BrandDataclass)
+
+        report = {(row["kind"], row["key"]): row["total"] for row in profiler.report()}
+        self.assertEqual(report[("field", "BrandDataclass.id")], 1)
+        self.assertEqual(report[("construct", "BrandDataclass")], 1)
+        self.assertEqual(report[("dataclass", "BrandDataclass")], 6)
+        self.assertEqual(profiler.report()[0]["kind"], "dataclass")
+
+    def test_report_export(self) -> None:
+        profiler = ConversionProfiler()
+        FromOrmToDataclass(profiler=profiler).to_dto(Brand.objects.get(), BrandDataclass)
+
+        self.assertEqual(len(json.loads(json.dumps(profiler.report()))), 4)
+        self.assertIn("BrandDataclass.name", profiler.format_report())
+        profiler.reset()
+        self.assertEqual(profiler.report(), [])
+
+    def test_custom_record(self) -> None:
+        records = []
+
+        class RecordingProfiler(ConversionProfiler):
+            def record(self, kind: str, key: str, seconds: float) -> None:
+                records.append((kind, key))
+
+        FromOrmToDataclass(profiler=RecordingProfiler()).to_dto(Brand.objects.get(), BrandDataclass)
+
+        self.assertEqual(records[-1], ("dataclass", "BrandDataclass"))
+
+    def test_no_profiler_uses_regular_converter(self) -> None:
+        converter = FromOrmToDataclass(codegen=True)
+        regular = converter._get_object_converter(ProductDataclass)
+
+        converter.profiler = ConversionProfiler()
+        self.assertIsNot(converter._get_object_converter(ProductDataclass), regular)
+        converter.profiler = None
+        self.assertIs(converter._get_object_converter(ProductDataclass), regular)
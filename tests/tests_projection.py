@@ -0,0 +1,158 @@
+import json
+from dataclasses import dataclass, field
+from typing import List, Optional
+from unittest import TestCase
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+from auto_dataclass.plan import PlanCache
+from dj_models import Brand, Photo, Product, Tag, delete_data
+
+
+@dataclass(frozen=True)
+class TagDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    id: int
+    image: str
+    tags: List[TagDataclass] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    description: str
+    brand: Optional[BrandDataclass]
+    photos: List[PhotoDataclass] = field(default_factory=list)
+
+
+class TestFieldProjection(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        brand = Brand.objects.create(name="brand")
+        tag = Tag.objects.create(name="tag")
+        for index in range(3):
+            product = Product.objects.create(name=f"product {index}", description="description", brand=brand)
+            for _ in range(2):
+                Photo.objects.create(product=product, image="image").tags.add(tag)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def setUp(self) -> None:
+        self.converter = FromOrmToDataclass()
+        self.fields = ["id", "name", "photos.image"]
+
+    def _get_expected(self) -> list[ProductDataclass]:
+        return [
+            ProductDataclass(
+                id=product.id,
+                name=product.name,
+                description=None,
+                brand=None,
+                photos=[PhotoDataclass(id=None, image=photo.image) for photo in product.photos.order_by("id")],
+            )
+            for product in Product.objects.order_by("id")
+        ]
+
+    def test_to_dto_many_with_fields(self) -> None:
+        queryset = Product.objects.prefetch_related("photos").order_by("id")
+
+        with CaptureQueriesContext(connection) as context:
+            result = self.converter.to_dto_many(queryset, ProductDataclass, fields=self.fields)
+
+        self.assertEqual(result, self._get_expected())
+        self.assertEqual(len(context.captured_queries), 2)
+
+    def test_to_dto_with_fields_and_codegen(self) -> None:
+        converter = FromOrmToDataclass(codegen=True)
+        product = Product.objects.order_by("id").first()
+
+        result = converter.to_dto(product, ProductDataclass, fields="id, name, photos.image")
+
+        self.assertEqual(result, self._get_expected()[0])
+
+    def test_to_dto_with_whole_nested_field(self) -> None:
+        product = Product.objects.order_by("id").first()
+
+        result = self.converter.to_dto(product, ProductDataclass, fields=["id", "photos.image", "photos"])
+
+        self.assertEqual(result.photos[0].tags[0].name, "tag")
+        self.assertIsNone(result.name)
+
+    def test_projection_plans_are_cached(self) -> None:
+        plan = self.converter._get_plan(ProductDataclass, (), ["id", "photos.image"])
+
+        self.assertIs(self.converter._get_plan(ProductDataclass, (), ["photos.image", "id"]), plan)
+        self.assertIsNot(self.converter._get_plan(ProductDataclass), plan)
+
+    def test_projection_key_is_normalized(self) -> None:
+        plan = self.converter._get_plan(ProductDataclass, (), "id,name")
+
+        for index in range(20):
+            fields = "id," + " " * index + "name" + "," * (index % 2)
+            self.assertIs(self.converter._get_plan(ProductDataclass, (), fields), plan)
+        whole_photos_plan = self.converter._get_plan(ProductDataclass, (), ["name", "id", "photos"])
+        self.assertIs(self.converter._get_plan(ProductDataclass, (), "photos.image,photos,id,name"), whole_photos_plan)
+
+    def test_projections_past_the_limit_are_not_cached(self) -> None:
+        converter = FromOrmToDataclass(codegen=True, plans=PlanCache(max_projections=1))
+        queryset = Product.objects.order_by("id")
+        converter.to_dto_many(queryset, ProductDataclass, fields="id")
+        converter.to_json(ProductDataclass(1, "name", "", None), ProductDataclass, fields="id")
+        generated = len(converter._generator._converters)
+
+        for fields in ("name", "id,name", "photos.image"):
+            result = converter.to_dto_many(queryset, ProductDataclass, fields=fields)
+            converter.to_json(result[0], ProductDataclass, fields=fields)
+
+        self.assertEqual(result, converter.to_dto_many(queryset, ProductDataclass, fields=["photos.image"]))
+        self.assertEqual(len(converter._plans.projections), 1)
+        self.assertEqual(len(converter._generator._converters), generated)
+        self.assertEqual(len(converter._serializers), 1)
+
+    def test_optimize_queryset_with_fields(self) -> None:
+        queryset = self.converter.optimize_queryset(Product.objects.all(), ProductDataclass, fields=self.fields)
+
+        self.assertEqual(queryset.query.select_related, False)
+        self.assertEqual(queryset.query.deferred_loading, ({"id", "name"}, False))
+        photos_queryset = queryset._prefetch_related_lookups[0].queryset
+        self.assertEqual(photos_queryset.query.deferred_loading, ({"product", "image"}, False))
+        self.assertEqual(self.converter.to_dto_many(queryset.order_by("id"), ProductDataclass, fields=self.fields),
+                         self._get_expected())
+
+    def test_iter_dto_values_with_fields(self) -> None:
+        queryset = Product.objects.order_by("id")
+
+        result = list(self.converter.iter_dto_values(queryset, ProductDataclass, fields=["id", "brand.name"]))
+
+        self.assertEqual(result[0].brand, BrandDataclass(id=None, name="brand"))
+        self.assertIsNone(result[0].name)
+
+    def test_to_json_with_fields(self) -> None:
+        dto = self.converter.to_dto(Product.objects.order_by("id").first(), ProductDataclass, fields=self.fields)
+
+        result = json.loads(self.converter.to_json(dto, ProductDataclass, fields=self.fields))
+
+        self.assertEqual(result, {"id": dto.id, "name": "product 0", "photos": [{"image": "image"}] * 2})
+
+    def test_unknown_field(self) -> None:
+        with self.assertRaises(ConversionError):
+            self.converter.to_dto(Product.objects.first(), ProductDataclass, fields=["id", "unknown"])
+        with self.assertRaises(ConversionError):
+            self.converter.to_dto(Product.objects.first(), ProductDataclass, fields=["name.value"])
@@ -0,0 +1,137 @@
+import dataclasses
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from io import BytesIO
+from typing import List, Optional
+from unittest import TestCase
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+import dj_models  # noqa: F401 configures Django settings
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+from auto_dataclass.lazy import LazyDTO, LazyList
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    id: int
+    image: str
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    price: Decimal
+    created_at: datetime
+    brand: Optional[BrandDataclass]
+    photos: List[PhotoDataclass] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class CategoriesDTO:
+    id: int
+    name: str
+    sub_categories: List['CategoriesDTO'] = field(default_factory=list)
+
+
+class TestJSONSerialization(TestCase):
+    def setUp(self) -> None:
+        self.converter = FromOrmToDataclass()
+        created_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        self.products = [
+            ProductDataclass(
+                id=index,
+                name=f"prodüct \"{index}\"",
+                price=Decimal("1.50"),
+                created_at=created_at,
+                brand=BrandDataclass(id=1, name="brand") if index % 2 else None,
+                photos=[PhotoDataclass(id=index * 10 + photo, image="image") for photo in range(index)],
+            )
+            for index in range(5)
+        ]
+
+    @staticmethod
+    def _asdict_json(obj) -> bytes:
+        if isinstance(obj, list):
+            obj = [dataclasses.asdict(dto) for dto in obj]
+        else:
+            obj = dataclasses.asdict(obj)
+        return json.dumps(obj, cls=DjangoJSONEncoder, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def test_to_json(self) -> None:
+        result = self.converter.to_json(self.products[3], ProductDataclass)
+
+        self.assertEqual(result, self._asdict_json(self.products[3]))
+        self.assertEqual(json.loads(result)["created_at"], "2024-01-02T03:04:05Z")
+
+    def test_to_json_recursive(self) -> None:
+        tree = CategoriesDTO(1, "root", [CategoriesDTO(2, "child", [CategoriesDTO(3, "grandchild")])])
+
+        result = self.converter.to_json(tree, CategoriesDTO)
+
+        self.assertEqual(result, self._asdict_json(tree))
+
+    def test_to_json_recursive_with_fields(self) -> None:
+        tree = CategoriesDTO(1, "root", [CategoriesDTO(2, "child", [CategoriesDTO(3, "grandchild")])])
+
+        result = self.converter.to_json(tree, CategoriesDTO, fields="id,sub_categories.name")
+
+        self.assertEqual(json.loads(result), {"id": 1, "sub_categories": [{"name": "child"}]})
+
+    def test_iter_json_chunks(self) -> None:
+        chunks = list(self.converter.iter_json(iter(self.products), ProductDataclass, chunk_size=100))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b"".join(chunks), self._asdict_json(self.products))
+
+    def test_iter_json_empty(self) -> None:
+        self.assertEqual(b"".join(self.converter.iter_json([], ProductDataclass)), b"[]")
+
+    def test_write_json(self) -> None:
+        fp = BytesIO()
+
+        self.converter.write_json(self.products, fp, ProductDataclass)
+
+        self.assertEqual(fp.getvalue(), self._asdict_json(self.products))
+
+    def test_to_json_lazy_fields(self) -> None:
+        product = self.products[3]
+        lazy_product = dataclasses.replace(
+            product,
+            brand=LazyDTO(lambda: product.brand, BrandDataclass),
+            photos=LazyList(lambda: product.photos),
+        )
+
+        self.assertEqual(self.converter.to_json(lazy_product, ProductDataclass), self._asdict_json(product))
+
+    def test_to_json_values(self) -> None:
+        @dataclass
+        class ValuesDataclass:
+            key: uuid.UUID
+            day: date
+            tags: dict
+
+        dto = ValuesDataclass(uuid.UUID(int=1), date(2024, 1, 2), {"a": [1, 2]})
+
+        result = json.loads(self.converter.to_json(dto, ValuesDataclass))
+
+        self.assertEqual(result, {"key": str(uuid.UUID(int=1)), "day": "2024-01-02", "tags": {"a": [1, 2]}})
+
+    def test_to_json_not_serializable(self) -> None:
+        @dataclass
+        class ObjectDataclass:
+            value: object
+
+        with self.assertRaises(ConversionError):
+            self.converter.to_json(ObjectDataclass(object()), ObjectDataclass)
@@ -0,0 +1,128 @@
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import List, Optional
+from unittest import TestCase
+
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.exceptions import ConversionError
+from auto_dataclass.plan import PlanCache
+from auto_dataclass.sources import AttributeAdapter, FromSourceToDataclass, MappingAdapter, SequenceAdapter
+from dj_models import Product, delete_data
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    id: int
+    image: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    photos: List[PhotoDataclass] = field(default_factory=list)
+    parent: Optional["ProductDataclass"] = None
+
+
+@dataclass(frozen=True)
+class PriceDataclass:
+    id: int
+    price: float
+
+
+class TestFromSourceToDataclass(TestCase):
+    expected = ProductDataclass(
+        id=1, name="product", photos=[PhotoDataclass(id=2, image="a.png")], parent=ProductDataclass(id=3, name="parent")
+    )
+
+    def test_mapping(self) -> None:
+        converter = FromSourceToDataclass(MappingAdapter())
+        data = {
+            "id": 1, "name": "product", "photos": [{"id": 2, "image": "a.png"}],
+            "parent": {"id": 3, "name": "parent", "extra": True},
+        }
+
+        self.assertEqual(converter.to_dto(data, ProductDataclass), self.expected)
+
+    def test_sequence(self) -> None:
+        converter = FromSourceToDataclass(SequenceAdapter())
+        data = (1, "product", [(2, "a.png")], (3, "parent"))
+
+        self.assertEqual(converter.to_dto(data, ProductDataclass), self.expected)
+
+    def test_attribute(self) -> None:
+        converter = FromSourceToDataclass(AttributeAdapter())
+        data = SimpleNamespace(
+            id=1, name="product", photos=(SimpleNamespace(id=2, image="a.png"),),
+            parent=SimpleNamespace(id=3, name="parent", parent=None),
+        )
+
+        self.assertEqual(converter.to_dto(data, ProductDataclass), self.expected)
+
+    def test_to_dto_many_with_projection(self) -> None:
+        converter = FromSourceToDataclass(MappingAdapter())
+        data = [{"id": 1, "photos": [{"id": 2, "image": "a.png"}]}, {"id": 4}]
+
+        result = converter.to_dto_many(data, ProductDataclass, fields=["id", "photos.image"])
+
+        self.assertEqual(
+            result,
+            [
+                ProductDataclass(id=1, name=None, photos=[PhotoDataclass(id=None, image="a.png")]),
+                ProductDataclass(id=4, name=None),
+            ]
+        )
+
+    def test_coerce(self) -> None:
+        converter = FromSourceToDataclass(SequenceAdapter(), coerce=True)
+
+        result = converter.to_dto_many([("1", "2.50")], PriceDataclass)
+
+        self.assertEqual(result, [PriceDataclass(id=1, price=2.5)])
+
+    def test_missing_field_without_default(self) -> None:
+        with self.assertRaises(ConversionError):
+            FromSourceToDataclass(MappingAdapter()).to_dto({"id": 1}, ProductDataclass)
+
+    def test_wrong_source_type(self) -> None:
+        converter = FromSourceToDataclass(MappingAdapter())
+
+        with self.assertRaisesRegex(ConversionError, "must be a mapping object"):
+            converter.to_dto((1, "product"), ProductDataclass)
+        with self.assertRaisesRegex(ConversionError, "must be a mapping object"):
+            converter.to_dto({"id": 1, "name": "product", "parent": (3, "parent")}, ProductDataclass)
+        with self.assertRaisesRegex(ConversionError, "iterable of mapping objects"):
+            converter.to_dto_many({"id": 1}, ProductDataclass)
+
+    def test_sources_import_without_django(self) -> None:
+        code = "import sys, auto_dataclass.sources; assert 'django' not in sys.modules"
+
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestSharedPlans(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        Product.objects.create(name="product", description="", price=Decimal("1.50"))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def test_plans_are_shared(self) -> None:
+        plans = PlanCache(coerce=True)
+        orm_converter = FromOrmToDataclass(coerce=True, plans=plans)
+        source_converter = FromSourceToDataclass(MappingAdapter(), coerce=True, plans=plans)
+
+        product = orm_converter.to_dto(Product.objects.get(), PriceDataclass)
+        row = source_converter.to_dto({"id": product.id, "price": "1.50"}, PriceDataclass)
+
+        self.assertEqual(product, row)
+        self.assertEqual(len(plans.registries), 1)
+
+    def test_coerce_mismatch(self) -> None:
+        with self.assertRaises(ConversionError):
+            FromSourceToDataclass(MappingAdapter(), plans=PlanCache(coerce=True))
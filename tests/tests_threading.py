@@ -0,0 +1,126 @@
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+from auto_dataclass.cache import LRUCache
+from auto_dataclass.codegen import ConverterGenerator
+from auto_dataclass.dj_cache import DTOCache
+from auto_dataclass.dj_model_to_dataclass import FromOrmToDataclass
+from auto_dataclass.plan import PlanCompiler
+from auto_dataclass.profiling import ConversionProfiler
+from dj_models import Brand, Photo, Product, delete_data
+
+THREADS = 8
+
+
+def slowed_down(func):
+    def wrapper(*args, **kwargs):
+        time.sleep(0.001)
+        return func(*args, **kwargs)
+    return wrapper
+
+
+@dataclass(frozen=True)
+class PhotoDataclass:
+    id: int
+    image: str
+
+
+@dataclass(frozen=True)
+class BrandDataclass:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ProductDataclass:
+    id: int
+    name: str
+    brand: Optional[BrandDataclass]
+    photos: List[PhotoDataclass] = field(default_factory=list)
+
+
+class TestSharedConverter(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        brand = Brand.objects.create(name="brand")
+        for index in range(20):
+            product = Product.objects.create(name=f"product {index}", description="", brand=brand)
+            for _ in range(2):
+                Photo.objects.create(product=product, image="image")
+        cls.products = list(Product.objects.select_related("brand").prefetch_related("photos").order_by("id"))
+        cls.expected = FromOrmToDataclass().to_dto_many(cls.products, ProductDataclass)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        delete_data()
+
+    def setUp(self) -> None:
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self) -> None:
+        sys.setswitchinterval(self.switch_interval)
+
+    def run_threads(self, convert) -> list:
+        barrier = threading.Barrier(THREADS)
+
+        def run(_):
+            barrier.wait()
+            return [convert() for _ in range(20)]
+
+        with ThreadPoolExecutor(THREADS) as executor:
+            return list(executor.map(run, range(THREADS)))
+
+    def assert_converted(self, converter: FromOrmToDataclass, **kwargs) -> None:
+        results = self.run_threads(lambda: converter.to_dto_many(self.products, ProductDataclass, **kwargs))
+
+        for thread_results in results:
+            for result in thread_results:
+                self.assertEqual(result, self.expected)
+
+    def test_shared_converter(self) -> None:
+        for _ in range(5):
+            self.assert_converted(FromOrmToDataclass())
+
+    def test_shared_codegen_converter(self) -> None:
+        for _ in range(5):
+            self.assert_converted(FromOrmToDataclass(codegen=True))
+            self.assert_converted(FromOrmToDataclass(codegen=True), identity_map=True)
+
+    @patch.object(ConverterGenerator, "_get_source", slowed_down(ConverterGenerator._get_source))
+    def test_concurrent_code_generation(self) -> None:
+        self.assert_converted(FromOrmToDataclass(codegen=True))
+
+    @patch.object(PlanCompiler, "_compile_field", slowed_down(PlanCompiler._compile_field))
+    def test_threads_share_plans(self) -> None:
+        converter = FromOrmToDataclass()
+
+        results = self.run_threads(
+            lambda: (converter._get_plan(ProductDataclass), converter._get_plan(ProductDataclass, (), ["id", "name"]))
+        )
+
+        plans = {plan for thread_results in results for plan_pair in thread_results for plan in plan_pair}
+        self.assertEqual(len(plans), 2)
+
+    def test_shared_profiler(self) -> None:
+        profiler = ConversionProfiler()
+        converter = FromOrmToDataclass(profiler=profiler)
+
+        self.run_threads(lambda: converter.to_dto_many(self.products, ProductDataclass))
+
+        counts = {(row["kind"], row["key"]): row["count"] for row in profiler.report()}
+        self.assertEqual(counts[("dataclass", "ProductDataclass")], THREADS * 20 * len(self.products))
+
+    def test_shared_cache_stats(self) -> None:
+        cache = DTOCache(LRUCache())
+        converter = FromOrmToDataclass(cache=cache)
+
+        self.run_threads(lambda: converter.to_dto(self.products[0], ProductDataclass))
+
+        self.assertEqual(cache.hits + cache.misses, THREADS * 20)